@@ -4,7 +4,7 @@ from .enums import StatementType
 from .exceptions import *
 from .repo_types import *
 from .repository import BaseRepository
-from .session_provider import SessionProvider
+from .session_provider import ContextSessionProvider, SessionProvider, create_asyncpg_provider
 
 __all__ = [
     # base_filter
@@ -13,6 +13,8 @@ __all__ = [
     'BaseMapper',
     # session_provider
     'SessionProvider',
+    'ContextSessionProvider',
+    'create_asyncpg_provider',
     # base_repo
     'BaseRepository',
     # enums
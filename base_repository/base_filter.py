@@ -1,12 +1,37 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import sys
+from collections.abc import Callable, Sequence
 from collections.abc import Set as ABCSet
 from dataclasses import fields, is_dataclass
+from operator import attrgetter
 from typing import Annotated, Any
+from weakref import WeakKeyDictionary
 
+from sqlalchemy import bindparam
+from sqlalchemy.orm.base import opt_manager_of_class
+from sqlalchemy.sql.elements import ClauseElement
 from typing_extensions import Doc
 
+# type → "use IN" decision for filter values, consulted by the default BaseRepoFilter._is_seq(). Seeded with
+# the common concrete types and extended on first sight of any other type, so ABC checks run at most once per type.
+_SEQ_TYPES: dict[type, bool] = {
+    list: True,
+    tuple: True,
+    set: True,
+    frozenset: True,
+    str: False,
+    bytes: False,
+    bytearray: False,
+    int: False,
+    float: False,
+    bool: False,
+}
+
+
+# ClassManager.info key of the per-model {filter class: bound column triples} cache (see _bound_columns()).
+_COLUMNS_INFO_KEY = 'base_repository.filter_columns'
+
 
 class BaseRepoFilter:
     """
@@ -78,6 +103,32 @@ class BaseRepoFilter:
         ),
     ] = False
 
+    __repo_fields__: Annotated[
+        tuple[tuple[str, str], ...],
+        Doc(
+            'Per-class cache of (field name, resolved column name) pairs.\n'
+            'Built on first use by _repo_fields(); not meant to be set by subclasses.'
+        ),
+    ]
+
+    __repo_getter__: Annotated[
+        Callable[[Any], tuple[Any, ...]],
+        Doc(
+            'Per-class getter returning all field values as a tuple in _repo_fields() order.\n'
+            'Built on first use by _values_getter(); not meant to be set by subclasses.'
+        ),
+    ]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Intern the subclass's own `__aliases__` keys/values once at class definition,
+        so the cached names used for model attribute lookups are interned strings.
+        """
+        super().__init_subclass__(**kwargs)
+        aliases = cls.__dict__.get('__aliases__')
+        if aliases:
+            cls.__aliases__ = {sys.intern(k): sys.intern(v) for k, v in aliases.items()}
+
     @staticmethod
     def _is_seq(
         value: Annotated[Any, Doc('Value to check for sequence-ness (expects list/tuple/set/frozenset, etc.).')],
@@ -85,12 +136,16 @@ class BaseRepoFilter:
         """
         Check whether the value is a Sequence or Set-like object.
         Note: str/bytes/bytearray are excluded.
-        """
-        # Exclude string-like types (they are Sequence but not suitable for IN)
-        if isinstance(value, (str, bytes, bytearray)):
-            return False
 
-        return isinstance(value, (Sequence, ABCSet))
+        The decision depends only on the value's type, so it is memoized in `_SEQ_TYPES`.
+        """
+        t = type(value)
+        hit = _SEQ_TYPES.get(t)
+        if hit is None:
+            # Exclude string-like types (they are Sequence but not suitable for IN)
+            hit = not issubclass(t, (str, bytes, bytearray)) and issubclass(t, (Sequence, ABCSet))
+            _SEQ_TYPES[t] = hit
+        return hit
 
     @classmethod
     def _resolve_column_name(
@@ -110,6 +165,88 @@ class BaseRepoFilter:
 
         return field_name
 
+    @classmethod
+    def _repo_fields(cls) -> Annotated[tuple[tuple[str, str], ...], Doc('Cached (field name, column name) pairs.')]:
+        """
+        Return the cached (field name, resolved column name) pairs for this class.
+
+        The cache is built lazily because `@dataclass` is applied after class creation,
+        so the fields are not known yet in `__init_subclass__`. It is stored in the class's
+        own `__dict__` so subclasses never reuse their parent's field list.
+
+        Raises
+        ------
+        TypeError
+            If the class is not a dataclass.
+        """
+        cached: tuple[tuple[str, str], ...] | None = cls.__dict__.get('__repo_fields__')
+        if cached is None:
+            if not is_dataclass(cls):
+                raise TypeError('BaseRepoFilter must be used with a dataclass.')
+            cached = tuple((sys.intern(f.name), sys.intern(cls._resolve_column_name(f.name))) for f in fields(cls))
+            cls.__repo_fields__ = cached
+        return cached
+
+    @classmethod
+    def _values_getter(cls) -> Annotated[Callable[[Any], tuple[Any, ...]], Doc('Cached field-values getter.')]:
+        """
+        Return a getter that reads every filter field of an instance in a single call.
+
+        `operator.attrgetter` with several names returns a tuple; the 0/1-field cases are
+        wrapped so callers can always zip the result against `_repo_fields()`.
+        """
+        getter: Callable[[Any], tuple[Any, ...]] | None = cls.__dict__.get('__repo_getter__')
+        if getter is None:
+            names = [field_name for field_name, _ in cls._repo_fields()]
+            if not names:
+                getter = _no_values
+            elif len(names) == 1:
+                getter = _single_value(names[0])
+            else:
+                getter = attrgetter(*names)
+            cls.__repo_getter__ = getter
+        return getter
+
+    @classmethod
+    def _bound_columns(
+        cls,
+        m: Annotated[type[Any], Doc('SQLAlchemy ORM model class.')],
+    ) -> Annotated[tuple[tuple[str, str, Any], ...], Doc('Cached (field name, column name, column) triples.')]:
+        """
+        Return the (field name, column name, model column) triples for `m`, resolving them once per model.
+
+        Missing columns are cached as None; the strict-mode check stays in `where_criteria`
+        because it only applies to fields that actually carry a value.
+
+        The cache lives in the model's ClassManager `info` as a WeakKeyDictionary keyed by filter class.
+        The triples reference the model's attributes, so storing them on the model side (rather than in a
+        cache keyed by model) lets models and filter classes created at runtime be garbage collected.
+        Unmapped classes are resolved on every call.
+        """
+        manager = opt_manager_of_class(m)
+        if manager is None:
+            return cls._resolve_columns(m)
+
+        cache: WeakKeyDictionary[type[BaseRepoFilter], tuple[tuple[str, str, Any], ...]] | None = manager.info.get(
+            _COLUMNS_INFO_KEY
+        )
+        if cache is None:
+            cache = WeakKeyDictionary()
+            manager.info[_COLUMNS_INFO_KEY] = cache
+
+        bound = cache.get(cls)
+        if bound is None:
+            bound = cls._resolve_columns(m)
+            cache[cls] = bound
+        return bound
+
+    @classmethod
+    def _resolve_columns(cls, m: type[Any]) -> tuple[tuple[str, str, Any], ...]:
+        """
+        Resolve the (field name, column name, model column or None) triples for `m` without caching.
+        """
+        return tuple((field_name, col_name, getattr(m, col_name, None)) for field_name, col_name in cls._repo_fields())
+
     def where_criteria(
         self,
         m: Annotated[type[Any], Doc('SQLAlchemy ORM model class.')],
@@ -120,9 +257,8 @@ class BaseRepoFilter:
         Behavior
         --------
         1) Validate that `self` is a dataclass. (TypeError if not)
-        2) Iterate over dataclass fields and for each one:
+        2) Iterate over the (field, column) triples cached per model by _bound_columns() and for each one:
            - Skip if the value is None
-           - Resolve column name via _resolve_column_name(field_name)
            - If the model does not have the column:
                - If __strict__ is True: raise ValueError
                - Otherwise: ignore the field
@@ -148,29 +284,33 @@ class BaseRepoFilter:
         ValueError
             If __strict__ = True and the mapped column cannot be found on the model.
         """
-        if not is_dataclass(self):
-            raise TypeError('BaseRepoFilter must be used with a dataclass.')
+        cls = type(self)
+        bound = cls._bound_columns(m)
+        values = cls._values_getter()(self)
 
         crit: list[Any] = []
-        for f in fields(self):
-            val = getattr(self, f.name)
+        is_seq = self._is_seq
+        for (field_name, col_name, col), val in zip(bound, values, strict=True):
             if val is None:
                 continue
 
-            col_name = self._resolve_column_name(f.name)
-            col = getattr(m, col_name, None)
-
             if col is None:
                 if self.__strict__:
-                    raise ValueError(f"Mapping failed: {m.__name__}.{col_name} (from '{f.name}')")
+                    raise ValueError(f"Mapping failed: {m.__name__}.{col_name} (from '{field_name}')")
                 continue
 
-            if isinstance(val, bool):
+            t = type(val)
+            if t is bool:
                 # Use .is_(val) for bool values to represent NULL/True/False precisely
                 crit.append(col.is_(val))
-            elif self._is_seq(val):
-                # Build an IN condition for sequences; ignore empty sequences
-                seq = list(val)
+                continue
+
+            seq_hit = is_seq(val)
+
+            if seq_hit:
+                # Build an IN condition for sequences; ignore empty sequences.
+                # list/tuple go to in_() as-is; other iterables (sets, views, ...) are materialized first.
+                seq = val if t is list or t is tuple else list(val)
                 if seq:
                     crit.append(col.in_(seq))
             else:
@@ -178,3 +318,111 @@ class BaseRepoFilter:
                 crit.append(col == val)
 
         return crit
+
+    def where_params(
+        self,
+        m: Annotated[type[Any], Doc('SQLAlchemy ORM model class.')],
+    ) -> Annotated[
+        tuple[tuple[Any, ...] | None, dict[str, Any]],
+        Doc('(shape, bind parameter values) for where_template(); shape is None when it cannot be templated.'),
+    ]:
+        """
+        Split the filter into a hashable *shape* and bind parameter values, following the same rules as
+        `where_criteria()`.
+
+        The shape has one entry per field: None (no condition), True/False (`IS`), 'in' or '='.
+        Filters with the same shape share one `where_template()` statement, so callers can cache the
+        statement per shape and only bind new values.
+
+        SQL expression values (columns, functions, subqueries, ...) cannot be bound as parameters;
+        when any field holds one, `(None, {})` is returned and callers should use `where_criteria()`.
+
+        Raises
+        ------
+        ValueError
+            If __strict__ = True and the mapped column cannot be found on the model.
+        """
+        cls = type(self)
+        bound = cls._bound_columns(m)
+        values = cls._values_getter()(self)
+
+        shape: list[Any] = []
+        params: dict[str, Any] = {}
+        is_seq = self._is_seq
+        for (field_name, col_name, col), val in zip(bound, values, strict=True):
+            if val is None:
+                shape.append(None)
+                continue
+
+            if col is None:
+                if self.__strict__:
+                    raise ValueError(f"Mapping failed: {m.__name__}.{col_name} (from '{field_name}')")
+                shape.append(None)
+                continue
+
+            t = type(val)
+            if t is bool:
+                shape.append(val)
+                continue
+
+            seq_hit = is_seq(val)
+
+            if seq_hit:
+                seq = val if t is list or t is tuple else list(val)
+                if seq:
+                    if any(_is_sql_expr(v) for v in seq):
+                        return None, {}
+                    shape.append('in')
+                    params[_param_name(field_name)] = seq
+                else:
+                    shape.append(None)
+            else:
+                if _is_sql_expr(val):
+                    return None, {}
+                shape.append('=')
+                params[_param_name(field_name)] = val
+
+        return tuple(shape), params
+
+    @classmethod
+    def where_template(
+        cls,
+        m: Annotated[type[Any], Doc('SQLAlchemy ORM model class.')],
+        shape: Annotated[tuple[Any, ...], Doc('Shape returned by where_params().')],
+    ) -> Annotated[list[Any], Doc('WHERE criteria using bind parameters named after the filter fields.')]:
+        """
+        Build the WHERE criteria for a `where_params()` shape, with `bindparam()` placeholders instead of values.
+        """
+        crit: list[Any] = []
+        for (field_name, _, col), kind in zip(cls._bound_columns(m), shape, strict=True):
+            if kind is None:
+                continue
+            if kind is True or kind is False:
+                crit.append(col.is_(kind))
+            elif kind == 'in':
+                crit.append(col.in_(bindparam(_param_name(field_name), expanding=True)))
+            else:
+                crit.append(col == bindparam(_param_name(field_name)))
+        return crit
+
+
+def _param_name(field_name: str) -> str:
+    return f'flt_{field_name}'
+
+
+def _is_sql_expr(val: Any) -> bool:
+    # ORM attributes (Model.col) are not ClauseElements but coerce to one through __clause_element__().
+    return isinstance(val, ClauseElement) or hasattr(type(val), '__clause_element__')
+
+
+def _no_values(obj: Any) -> tuple[Any, ...]:
+    return ()
+
+
+def _single_value(name: str) -> Callable[[Any], tuple[Any, ...]]:
+    get = attrgetter(name)
+
+    def _getter(obj: Any) -> tuple[Any, ...]:
+        return (get(obj),)
+
+    return _getter
@@ -9,17 +9,29 @@ class StatementType(str, Enum):
     UPDATE = 'update'
     DELETE = 'delete'
 
-    def __str__(self) -> str:
-        return self.value
+    # Members are str instances already; return the plain string without going through the `.value` descriptor.
+    __str__ = str.__str__
 
     @classmethod
     def from_stmt(cls, stmt: object) -> 'StatementType':
-        if isinstance(stmt, Select):
-            return cls.SELECT
-        if isinstance(stmt, Insert):
-            return cls.INSERT
-        if isinstance(stmt, Update):
-            return cls.UPDATE
-        if isinstance(stmt, Delete):
-            return cls.DELETE
+        t = type(stmt)
+        hit = _STMT_TYPES.get(t)
+        if hit is not None:
+            return hit
+
+        # Subclasses of the SQLAlchemy statement classes: resolve via MRO once, then remember the type.
+        for base in t.__mro__[1:]:
+            hit = _STMT_TYPES.get(base)
+            if hit is not None:
+                _STMT_TYPES[t] = hit
+                return hit
         raise TypeError(f'Unsupported statement type: {type(stmt).__name__}')
+
+
+# Statement class → StatementType. Kept outside the Enum body so it does not become a member.
+_STMT_TYPES: dict[type, StatementType] = {
+    Select: StatementType.SELECT,
+    Insert: StatementType.INSERT,
+    Update: StatementType.UPDATE,
+    Delete: StatementType.DELETE,
+}
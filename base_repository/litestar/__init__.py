@@ -1,12 +1,16 @@
-from .pagination import (
-    CursorPagination,
-    OffsetPagination,
-    apply_pagination,
-    provide_cursor_pagination,
-    provide_offset_pagination,
-)
+from typing import TYPE_CHECKING, Any
+
 from .repository import provide_repo
 
+if TYPE_CHECKING:
+    from .pagination import (
+        CursorPagination,
+        OffsetPagination,
+        apply_pagination,
+        provide_cursor_pagination,
+        provide_offset_pagination,
+    )
+
 __all__ = [
     'CursorPagination',
     'OffsetPagination',
@@ -15,3 +19,24 @@ __all__ = [
     'provide_offset_pagination',
     'provide_repo',
 ]
+
+# Pagination helpers pull in litestar.params and msgspec; import them only when first accessed.
+_PAGINATION_EXPORTS = frozenset(
+    {
+        'CursorPagination',
+        'OffsetPagination',
+        'apply_pagination',
+        'provide_cursor_pagination',
+        'provide_offset_pagination',
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PAGINATION_EXPORTS:
+        from . import pagination
+
+        value = getattr(pagination, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
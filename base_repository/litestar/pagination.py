@@ -1,73 +1,99 @@
 from __future__ import annotations
 
-import base64
-import json
+import binascii
+from collections.abc import Callable
 from typing import Any, TypeVar
 
+import msgspec
 from litestar.params import Parameter
-from pydantic import BaseModel
 
 from base_repository.query.list_query import ListQuery
 from base_repository.repo_types import TModel
 
 T = TypeVar('T', bound=ListQuery[Any])
 
+# Query parameter definitions, built once and shared by the providers.
+_PAGE_PARAM: Any = Parameter(ge=1, default=1, query='page', description='Page number')
+_SIZE_PARAM: Any = Parameter(ge=1, default=20, query='size', description='Page size')
+_CURSOR_PARAM: Any = Parameter(
+    default=None,
+    query='cursor',
+    description='Cursor string (base64 encoded JSON) for keyset pagination',
+)
+_LIMIT_PARAM: Any = Parameter(ge=1, default=20, query='limit', description='Page limit')
 
-class OffsetPagination(BaseModel):
-    page: int = Parameter(ge=1, default=1, query='page', description='Page number')
-    size: int = Parameter(ge=1, default=20, query='size', description='Page size')
+# urlsafe base64 alphabet → standard alphabet, so cursors can go straight to binascii.
+_URLSAFE_TRANS = bytes.maketrans(b'-_', b'+/')
 
 
-class CursorPagination(BaseModel):
-    cursor: str | None = Parameter(
-        default=None,
-        query='cursor',
-        description='Cursor string (base64 encoded JSON) for keyset pagination',
-    )
-    limit: int = Parameter(ge=1, default=20, query='limit', description='Page limit')
+class OffsetPagination(msgspec.Struct, frozen=True):
+    page: int = 1
+    size: int = 20
+
+
+class CursorPagination(msgspec.Struct, frozen=True):
+    cursor: str | None = None
+    limit: int = 20
 
 
 def provide_offset_pagination(
-    page: int = Parameter(ge=1, default=1, query='page', description='Page number'),
-    size: int = Parameter(ge=1, default=20, query='size', description='Page size'),
+    page: int = _PAGE_PARAM,
+    size: int = _SIZE_PARAM,
 ) -> OffsetPagination:
     return OffsetPagination(page=page, size=size)
 
 
 def provide_cursor_pagination(
-    cursor: str | None = Parameter(
-        default=None,
-        query='cursor',
-        description='Cursor string (base64 encoded JSON) for keyset pagination',
-    ),
-    limit: int = Parameter(ge=1, default=20, query='limit', description='Page limit'),
+    cursor: str | None = _CURSOR_PARAM,
+    limit: int = _LIMIT_PARAM,
 ) -> CursorPagination:
     return CursorPagination(cursor=cursor, limit=limit)
 
 
+def _apply_offset(q: ListQuery[TModel], pagination: OffsetPagination) -> ListQuery[TModel]:
+    return q.paging(page=pagination.page, size=pagination.size)
+
+
+def _apply_cursor(q: ListQuery[TModel], pagination: CursorPagination) -> ListQuery[TModel]:
+    cursor_dict: dict[str, Any] | None = None
+    if pagination.cursor:
+        try:
+            # msgspec (a litestar dependency) decodes the raw bytes directly, no utf-8 str step.
+            # Extra '=' padding is ignored by a2b_base64, so unpadded cursors decode too.
+            raw = binascii.a2b_base64(pagination.cursor.encode('ascii').translate(_URLSAFE_TRANS) + b'==')
+            cursor_dict = msgspec.json.decode(raw, type=dict[str, Any])
+        except (ValueError, msgspec.DecodeError):
+            # If decoding fails, treating it as invalid cursor or empty.
+            # For safety, let's pass empty dict if decoding failed?
+            # Or maybe we shouldn't swallow errors silently?
+            # Given this is a helper, raising an error might be 500.
+            # Let's fallback to None (start) or empty.
+            cursor_dict = {}
+
+    q.with_cursor(cursor_dict or {})
+    q.limit(pagination.limit)
+    return q
+
+
+# pagination type -> handler. Subclasses are resolved via MRO once and then cached here.
+_PAGINATION_HANDLERS: dict[type[Any], Callable[[ListQuery[Any], Any], ListQuery[Any]]] = {
+    OffsetPagination: _apply_offset,
+    CursorPagination: _apply_cursor,
+}
+
+
 def apply_pagination(q: ListQuery[TModel], pagination: OffsetPagination | CursorPagination) -> ListQuery[TModel]:
     """
     Apply pagination parameters to the ListQuery.
     """
-    if isinstance(pagination, OffsetPagination):
-        return q.paging(page=pagination.page, size=pagination.size)
-
-    if isinstance(pagination, CursorPagination):
-        cursor_dict: dict[str, Any] | None = None
-        if pagination.cursor:
-            try:
-                decoded = base64.urlsafe_b64decode(pagination.cursor).decode('utf-8')
-                cursor_dict = json.loads(decoded)
-            except (ValueError, UnicodeDecodeError, json.JSONDecodeError):
-                # If decoding fails, treating it as invalid cursor or empty.
-                # For safety, let's pass empty dict if decoding failed?
-                # Or maybe we shouldn't swallow errors silently?
-                # Given this is a helper, raising an error might be 500.
-                # Let's fallback to None (start) or empty.
-                cursor_dict = {}
-
-        q.with_cursor(cursor_dict or {})
-        q.limit(pagination.limit)
-        return q
-
-    return q
+    t = type(pagination)
+    handler = _PAGINATION_HANDLERS.get(t)
+    if handler is None:
+        for base in t.__mro__[1:]:
+            handler = _PAGINATION_HANDLERS.get(base)
+            if handler is not None:
+                _PAGINATION_HANDLERS[t] = handler
+                break
+        else:
+            return q
+    return handler(q, pagination)
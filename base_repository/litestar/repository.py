@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from typing import Any, TypeVar, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from base_repository.repository.base_repo import BaseRepository
 
-T = TypeVar('T', bound=BaseRepository)
+# Any schema: a bare BaseRepository bound would pin TSchema to its NoSchema default.
+T = TypeVar('T', bound=BaseRepository[Any, Any])
+
+# repo_type -> provider, so wiring the same Repository type twice reuses one function object.
+_PROVIDERS: dict[type[Any], Callable[[AsyncSession], Awaitable[Any]]] = {}
 
 
 def provide_repo(repo_type: type[T]) -> Callable[[AsyncSession], Awaitable[T]]:
@@ -21,8 +25,13 @@ def provide_repo(repo_type: type[T]) -> Callable[[AsyncSession], Awaitable[T]]:
             }
         )
     """
+    provider = _PROVIDERS.get(repo_type)
+    if provider is not None:
+        return cast(Callable[[AsyncSession], Awaitable[T]], provider)
 
+    # Keep the explicit `session` signature: Litestar resolves provider arguments by name.
     async def _provide_repo(session: AsyncSession) -> T:
-        return repo_type(session=session)
+        return repo_type(session)
 
+    _PROVIDERS[repo_type] = _provide_repo
     return _provide_repo
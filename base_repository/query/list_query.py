@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Annotated, Any, Generic
 
 from sqlalchemy import Select, select
@@ -11,7 +12,9 @@ from typing_extensions import Doc
 from base_repository.base_filter import BaseRepoFilter
 from base_repository.repo_types import TModel
 
-from .strategies import KeysetStrategy, OffsetStrategy, OrderByStrategy
+from .strategies import CompiledOrder, KeysetStrategy, OffsetStrategy, OrderByStrategy
+
+_SEALED_MESSAGE = 'This query has already been used. Create a new ListQuery.'
 
 
 class PagingMode(Enum):
@@ -71,6 +74,18 @@ class ListQuery(Generic[TModel]):
     >>> rows = await repo.execute(q)
     """
 
+    __slots__ = (
+        'model',
+        '_filter',
+        '_order_items',
+        '_mode',
+        '_cursor',
+        '_cursor_size',
+        '_page',
+        '_offset_size',
+        '_sealed',
+    )
+
     def __init__(self, model: type[TModel], flt: BaseRepoFilter | None = None) -> None:
         """
         Create a ListQuery instance.
@@ -111,7 +126,7 @@ class ListQuery(Generic[TModel]):
             If you try to mutate an already sealed ListQuery.
         """
         if self._sealed:
-            raise RuntimeError('This query has already been used. Create a new ListQuery.')
+            raise RuntimeError(_SEALED_MESSAGE)
 
     def where(self, flt: BaseRepoFilter | None) -> ListQuery[TModel]:
         """
@@ -141,7 +156,8 @@ class ListQuery(Generic[TModel]):
         RuntimeError
             If called while sealed.
         """
-        self._ensure_mutable()
+        if self._sealed:  # inlined _ensure_mutable()
+            raise RuntimeError(_SEALED_MESSAGE)
         if flt is None:
             return self
         if self._filter is not None:
@@ -171,7 +187,8 @@ class ListQuery(Generic[TModel]):
         - Cannot be called after entering CURSOR mode (after `with_cursor()`).
           Cursor paging depends on the ordering keys, so changing them after entering the mode is not allowed.
         """
-        self._ensure_mutable()
+        if self._sealed:  # inlined _ensure_mutable()
+            raise RuntimeError(_SEALED_MESSAGE)
         if self._mode is PagingMode.CURSOR:
             raise ValueError('In cursor mode, order_by() must be called before setting the cursor.')
         self._order_items = items
@@ -190,7 +207,8 @@ class ListQuery(Generic[TModel]):
             - Validation and WHERE construction are performed by KeysetStrategy.
             - The key set and order must match the columns specified by `order_by`.
         """
-        self._ensure_mutable()
+        if self._sealed:  # inlined _ensure_mutable()
+            raise RuntimeError(_SEALED_MESSAGE)
 
         if self._mode is PagingMode.OFFSET:
             raise ValueError('Offset paging and cursor paging cannot be used together.')
@@ -229,7 +247,8 @@ class ListQuery(Generic[TModel]):
         RuntimeError
             If called while sealed.
         """
-        self._ensure_mutable()
+        if self._sealed:  # inlined _ensure_mutable()
+            raise RuntimeError(_SEALED_MESSAGE)
         if size <= 0:
             raise ValueError('limit(size) must be >= 1.')
         if self._mode is PagingMode.OFFSET:
@@ -249,10 +268,14 @@ class ListQuery(Generic[TModel]):
         size:
             Page size (must be >= 1).
         """
-        self._ensure_mutable()
-        if self._mode is PagingMode.CURSOR or self._cursor is not None:
+        if self._sealed:  # inlined _ensure_mutable()
+            raise RuntimeError(_SEALED_MESSAGE)
+        # The mode is only switched together with its state (with_cursor sets _cursor, paging sets
+        # _page/_offset_size), so identity checks on the mode are enough here.
+        mode = self._mode
+        if mode is PagingMode.CURSOR:
             raise ValueError('paging(page, size) cannot be used in cursor mode.')
-        if self._mode is PagingMode.OFFSET and (self._page is not None or self._offset_size is not None):
+        if mode is PagingMode.OFFSET:
             raise ValueError('paging() can be called only once.')
         if size <= 0:
             raise ValueError('size must be >= 1.')
@@ -392,25 +415,25 @@ def _apply_paging(
         - If CURSOR mode but cursor or cursor_size is missing.
         - If OFFSET mode but page or offset_size is missing.
     """
-    if q.mode is PagingMode.CURSOR:
-        if q.cursor is None:
-            raise ValueError('Cursor mode requires with_cursor(cursor).')
-        if q.cursor_size is None:
-            raise ValueError('Cursor mode requires limit(size).')
-        return KeysetStrategy.apply(
-            stmt,
-            order_cols=order_cols,
-            cursor=q.cursor,
-            size=q.cursor_size,
-        )
-
-    if q.mode is PagingMode.OFFSET:
-        if q.page is None or q.offset_size is None:
-            raise ValueError('Offset mode requires paging(page, size).')
-        return OffsetStrategy.apply(stmt, page=q.page, size=q.offset_size)
-
-    # PagingMode.NONE: no paging
-    return stmt
+    match q.mode:
+        case PagingMode.CURSOR:
+            if q.cursor is None:
+                raise ValueError('Cursor mode requires with_cursor(cursor).')
+            if q.cursor_size is None:
+                raise ValueError('Cursor mode requires limit(size).')
+            return KeysetStrategy.apply(
+                stmt,
+                order_cols=order_cols,
+                cursor=q.cursor,
+                size=q.cursor_size,
+            )
+        case PagingMode.OFFSET:
+            if q.page is None or q.offset_size is None:
+                raise ValueError('Offset mode requires paging(page, size).')
+            return OffsetStrategy.apply(stmt, page=q.page, size=q.offset_size)
+        case _:
+            # PagingMode.NONE: no paging
+            return stmt
 
 
 def _build_list_query(q: ListQuery[TModel]) -> Select[tuple[TModel]]:
@@ -420,12 +443,20 @@ def _build_list_query(q: ListQuery[TModel]) -> Select[tuple[TModel]]:
     Conversion order
     ----------------
     1. Create a base Select via `select(q.model)`
-    2. Apply WHERE via `_apply_where`
-    3. Compute order columns via `_compute_order_cols`
-    4. Apply ORDER BY via `_apply_order`
-    5. Apply OFFSET or CURSOR paging via `_apply_paging`
+    2. Compute order columns (same as `_compute_order_cols`)
+    3. Apply ORDER BY (same as `_apply_order`)
+    4. Apply WHERE (same as `_apply_where`)
+    5. Apply OFFSET or CURSOR paging (same as `_apply_paging`)
     6. Seal the query (q._sealed = True) so it can no longer be modified
 
+    Steps 1-3 depend only on the model and the ORDER BY input. When that input is
+    None/empty or made of str/Enum items, the ordered base Select is reused from
+    `_ordered_select()` (Select objects are immutable; `.where()` returns a copy), together with
+    its CompiledOrder for keyset paging.
+
+    The steps are inlined here instead of calling the `_apply_*` helpers, since this runs
+    on every list query build. The helpers remain for callers that need a single step.
+
     Parameters
     ----------
     q:
@@ -442,10 +473,69 @@ def _build_list_query(q: ListQuery[TModel]) -> Select[tuple[TModel]]:
       External code typically reaches it through higher-level APIs such as
       `BaseRepository.execute` or `query_to_stmt`.
     """
-    stmt = select(q.model)
-    stmt = _apply_where(stmt, q)
-    order_cols = _compute_order_cols(q)
-    stmt = _apply_order(stmt, order_cols)
-    stmt = _apply_paging(stmt, q, order_cols)
+    model = q.model
+
+    # ORDER BY (base Select + order columns are shared per query shape when possible)
+    order_items = q._order_items
+    order_key = _order_shape_key(order_items)
+    if order_key is None:
+        order_cols: Sequence[ColumnElement[Any]] | CompiledOrder = OrderByStrategy.apply(model, order_items)
+        stmt = select(model).order_by(*order_cols)
+    else:
+        stmt, order_cols = _ordered_select(model, order_key)
+
+    # WHERE
+    flt = q._filter
+    if flt is not None:
+        crit = flt.where_criteria(model)
+        if crit:
+            stmt = stmt.where(*crit)
+
+    # PAGING
+    match q._mode:
+        case PagingMode.CURSOR:
+            if q._cursor is None:
+                raise ValueError('Cursor mode requires with_cursor(cursor).')
+            if q._cursor_size is None:
+                raise ValueError('Cursor mode requires limit(size).')
+            stmt = KeysetStrategy.apply(stmt, order_cols=order_cols, cursor=q._cursor, size=q._cursor_size)
+        case PagingMode.OFFSET:
+            if q._page is None or q._offset_size is None:
+                raise ValueError('Offset mode requires paging(page, size).')
+            stmt = OffsetStrategy.apply(stmt, page=q._page, size=q._offset_size)
+        case _:
+            # PagingMode.NONE: no paging
+            pass
+
     q._sealed = True
     return stmt
+
+
+def _order_shape_key(order_items: Sequence[Any] | None) -> tuple[Any, ...] | None:
+    """
+    Build a hashable cache key for ORDER BY input, or None if the input must not be cached.
+
+    Only str/Enum items are keyed: their hash/equality are stable. Column expressions such as
+    `User.id.asc()` are new objects per call and overload `==`, so they always take the uncached path.
+    A bare string is also left uncached so OrderByStrategy can reject it.
+    """
+    if not order_items:
+        return ()
+    if isinstance(order_items, str):
+        return None
+    for item in order_items:
+        if not isinstance(item, str | Enum):
+            return None
+    return tuple(order_items)
+
+
+@lru_cache(maxsize=512)
+def _ordered_select(model: type[Any], order_key: tuple[Any, ...]) -> tuple[Select[tuple[Any]], CompiledOrder]:
+    """
+    Return `select(model).order_by(...)` and its CompiledOrder for a cacheable ORDER BY shape.
+
+    The CompiledOrder is handed to KeysetStrategy in CURSOR mode, so keys/directions are derived once per shape.
+    Validation errors from OrderByStrategy are raised as usual (and not cached).
+    """
+    order = OrderByStrategy.compile(model, order_key)
+    return select(model).order_by(*order.cols), order
@@ -1,5 +1,5 @@
 from .keyset import KeysetStrategy
 from .offset import OffsetStrategy
-from .order_by import OrderByStrategy
+from .order_by import CompiledOrder, OrderByStrategy
 
-__all__ = ['KeysetStrategy', 'OffsetStrategy', 'OrderByStrategy']
+__all__ = ['CompiledOrder', 'KeysetStrategy', 'OffsetStrategy', 'OrderByStrategy']
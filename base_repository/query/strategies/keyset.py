@@ -6,7 +6,14 @@ from typing import Any
 from sqlalchemy import ClauseElement, Select, and_, or_, tuple_
 from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
 
-from base_repository.query.strategies.order_by import OrderByStrategy
+from base_repository.query.strategies.order_by import (
+    _MISSING,
+    CompiledOrder,
+    _coerce_cursor_value,
+    _decompose,
+    _expected_python_type,
+    _key_or_name,
+)
 from base_repository.repo_types import TModel
 
 
@@ -19,7 +26,11 @@ class KeysetStrategy:
 
     Compared to OFFSET pagination, it is more stable and resilient to data changes.
 
+    `order_cols` may be a prebuilt `CompiledOrder` (see `OrderByStrategy.compile()`), which skips
+    re-deriving base columns / keys / directions on every page.
+
     Current behavior:
+    - A single plain column with a matching one-key cursor takes a fast path (simple `>` comparison)
     - If ALL orderings are ASC:
       - single column: simple `>` comparison
       - multi column: tuple comparison
@@ -31,7 +42,7 @@ class KeysetStrategy:
     def apply(
         stmt: Select[tuple[TModel]],
         *,
-        order_cols: Sequence[ColumnElement[Any]],
+        order_cols: Sequence[ColumnElement[Any]] | CompiledOrder,
         cursor: dict[str, Any] | None,
         size: int,
     ) -> Select[tuple[TModel]]:
@@ -40,14 +51,16 @@ class KeysetStrategy:
 
         1. Validate order_cols and size
         2. First page (no cursor) -> apply LIMIT only
-        3. Validate cursor keys and order against order_cols
-        4. Validate and cast cursor values based on column python_type when available
-        5. Determine ASC/DESC directions
+        3. Resolve base columns / keys / directions
+           - CompiledOrder (from `OrderByStrategy.compile()`) -> used as-is
+           - Sequence -> derived here on every call
+        4. Validate cursor keys and order against order_cols (`CompiledOrder.validate_cursor()`)
+        5. Validate and cast cursor values based on column python_type (resolved once per CompiledOrder)
         6. Build WHERE clause:
            - All ASC -> tuple comparison or simple comparison
            - DESC present -> OR-ladder (seek) condition
         """
-        if not order_cols:
+        if not (order_cols.cols if isinstance(order_cols, CompiledOrder) else order_cols):
             raise ValueError('keyset pagination requires order_cols.')
         if size < 1:
             raise ValueError('size must be >= 1.')
@@ -55,56 +68,68 @@ class KeysetStrategy:
         if cursor is None or len(cursor) == 0:
             return stmt.limit(size)
 
-        col_keys = [KeysetStrategy._col_key(c) for c in order_cols]
-        cursor_keys = list(cursor.keys())
-
-        if set(cursor_keys) != set(col_keys):
-            raise ValueError(f'cursor keys mismatch. required={col_keys}, got={cursor_keys}')
-
-        if cursor_keys != col_keys:
-            raise ValueError(f'cursor key order must match order_cols. required={col_keys}, got={cursor_keys}')
+        if isinstance(order_cols, CompiledOrder):
+            order = order_cols
+        else:
+            # Fast path for the most common shape: a single plain (ASC) column with a matching one-key cursor.
+            # Same checks and SQL as the general path, without building a CompiledOrder.
+            if len(order_cols) == 1 and len(cursor) == 1:
+                col = order_cols[0]
+                if not isinstance(col, UnaryExpression):
+                    key = _key_or_name(col, _MISSING)
+                    if key is not _MISSING and key in cursor:
+                        v = cursor[key]
+                        expected_py = _expected_python_type(col)
+                        if v is None or (expected_py is not None and type(v) is not expected_py):
+                            v = _coerce_cursor_value(key, v, expected_py)
+                        return stmt.where(col > v).limit(size)
+            order = KeysetStrategy._compile_cols(order_cols)
+        return KeysetStrategy._apply_compiled(stmt, order, cursor, size)
 
-        values: list[Any] = []
-        stripped = KeysetStrategy._strip_unary(order_cols)
+    @staticmethod
+    def _compile_cols(order_cols: Sequence[ColumnElement[Any]]) -> CompiledOrder:
+        """
+        <Derive a CompiledOrder from already-normalized ORDER BY columns>
+        """
+        stripped, col_keys, dirs = _decompose(order_cols)
         if len(stripped) != len(col_keys):
             raise ValueError('order_cols length does not match extracted key length.')
+        return CompiledOrder(
+            stripped=stripped,
+            keys=col_keys,
+            dirs=dirs,
+            cols=tuple(order_cols),
+            expected_types=tuple(_expected_python_type(c) for c in stripped),
+        )
 
-        for i, key in enumerate(col_keys):
-            v = cursor[key]
-            if v is None:
-                raise ValueError(f'NULL is not allowed in cursor values. key={key}')
-
-            # Validate/cast using column python_type if available
-            expected_py = getattr(getattr(stripped[i], 'type', None), 'python_type', None)
-            if expected_py is not None and not isinstance(v, expected_py):
-                try:
-                    v = expected_py(v)
-                except Exception as e:
-                    raise TypeError(f"cursor['{key}'] is not {expected_py.__name__}.") from e
-            values.append(v)
+    @staticmethod
+    def _apply_compiled(
+        stmt: Select[tuple[TModel]],
+        order: CompiledOrder,
+        cursor: dict[str, Any],
+        size: int,
+    ) -> Select[tuple[TModel]]:
+        stripped = order.stripped
+        values = order.validate_cursor(cursor)
 
-        dirs = [OrderByStrategy.is_desc(c) for c in order_cols]
+        dirs = order.dirs
 
         if not any(dirs):
             if len(stripped) == 1:
                 cond = stripped[0] > values[0]
                 return stmt.where(cond).limit(size)
-            cond = tuple_(*stripped) > tuple_(*values)
+            cond = order._row_lhs > tuple_(*values)
             return stmt.where(cond).limit(size)
 
-        # DESC present (mixed or all DESC): OR-ladder seek condition
+        # DESC present (mixed or all DESC): OR-ladder seek condition.
+        # Branch i is (c0 == v0 AND ... AND c(i-1) == v(i-1) AND ci <op> vi); the equality
+        # predicates are built once and shared by every later branch.
         or_conds = []
-        for i in range(len(stripped)):
-            and_parts = []
-            # Fix previous columns with ==
-            for j in range(i):
-                and_parts.append(stripped[j] == values[j])
-            # Current column compares by direction
-            if dirs[i]:  # DESC
-                and_parts.append(stripped[i] < values[i])
-            else:  # ASC
-                and_parts.append(stripped[i] > values[i])
-            or_conds.append(and_(*and_parts))
+        eq_prefix: list[ColumnElement[bool]] = []
+        for col, val, desc in zip(stripped, values, dirs, strict=True):
+            cmp = col < val if desc else col > val
+            or_conds.append(and_(*eq_prefix, cmp))
+            eq_prefix.append(col == val)
 
         seek = or_(*or_conds)
         return stmt.where(seek).limit(size)
@@ -119,7 +144,8 @@ class KeysetStrategy:
         """
         if isinstance(col, UnaryExpression):
             col = col.element
-        return getattr(col, 'key', getattr(col, 'name', repr(col)))
+        key = _key_or_name(col, _MISSING)
+        return repr(col) if key is _MISSING else key
 
     @staticmethod
     def _strip_unary(cols: Sequence[ColumnElement[Any]]) -> list[ColumnElement[Any]]:
@@ -12,5 +12,14 @@ class OffsetStrategy:
             raise ValueError('page must be >= 1.')
         if size < 1:
             raise ValueError('size must be >= 1.')
-        offset = (page - 1) * size
-        return stmt.offset(offset).limit(size)
+        return OffsetStrategy.apply_unchecked(stmt, page=page, size=size)
+
+    @staticmethod
+    def apply_unchecked(stmt: Select[tuple[TModel]], *, page: int, size: int) -> Select[tuple[TModel]]:
+        """
+        Apply OFFSET/LIMIT without validating page/size.
+
+        For callers whose page/size are already guaranteed to be >= 1 (e.g. validated by a
+        schema with `Field(ge=1)`); anything else should go through `apply()`.
+        """
+        return stmt.offset((page - 1) * size).limit(size)
@@ -23,19 +23,255 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import sys
+import weakref
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
+from uuid import UUID
+from weakref import WeakKeyDictionary
 
+from sqlalchemy import tuple_
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.sql import operators
-from sqlalchemy.sql.elements import ColumnElement, TextClause, UnaryExpression
+from sqlalchemy.sql.elements import ColumnElement, TextClause, Tuple, UnaryExpression
 from sqlalchemy.sql.functions import FunctionElement
 
 from base_repository.repo_types import TModel
 from base_repository.sa_helper import sa_mapper
 
 
+class _ModelMeta(NamedTuple):
+    valid_keys: frozenset[str]
+    valid_expr_map: dict[str, ColumnElement[Any]]
+    pk_cols: tuple[ColumnElement[Any], ...]
+
+
+# model -> (valid column keys, key -> canonical expression, PK columns), resolved once per mapped class.
+_MODEL_META_CACHE: WeakKeyDictionary[type[Any], _ModelMeta] = WeakKeyDictionary()
+
+
+_MISSING: Any = object()
+
+
+def _key_or_name(col: Any, default: Any = None) -> Any:
+    """
+    Return `col.key`, else `col.name`, else `default`.
+
+    Same result as `getattr(col, 'key', getattr(col, 'name', default))`, but `name` (and any costly
+    default such as `repr(col)`, which walks the clause tree) is only evaluated when `key` is absent.
+    """
+    key = getattr(col, 'key', _MISSING)
+    if key is _MISSING:
+        return getattr(col, 'name', default)
+    return key
+
+
+def _decompose(
+    cols: Sequence[ColumnElement[Any]],
+) -> tuple[tuple[ColumnElement[Any], ...], tuple[str, ...], tuple[bool, ...]]:
+    """
+    Split ORDER BY columns into `(stripped, keys, dirs)` in a single pass.
+
+    One isinstance check per column covers what `_strip_unary`, `_col_key` / `_base_key` and `is_desc`
+    would each re-derive separately.
+    """
+    stripped: list[ColumnElement[Any]] = []
+    keys: list[str] = []
+    dirs: list[bool] = []
+    for c in cols:
+        if isinstance(c, UnaryExpression):
+            base = c.element
+            dirs.append(c.modifier is operators.desc_op)
+        else:
+            base = c
+            dirs.append(False)
+        stripped.append(base)
+        key = _key_or_name(base, _MISSING)
+        keys.append(repr(base) if key is _MISSING else key)
+    return tuple(stripped), tuple(keys), tuple(dirs)
+
+
+def _expected_python_type(col: Any) -> type | None:
+    """
+    Return `col.type.python_type`, or None when the column has no type or its type does not implement it.
+    """
+    try:
+        return getattr(getattr(col, 'type', None), 'python_type', None)
+    except NotImplementedError:
+        return None
+
+
+# (id(a), id(b)) pairs already proven to be the same column by `OrderByStrategy._same_column`.
+# Only positive results are kept, and a pair is dropped as soon as either object is collected.
+_SAME_COLUMN_PAIRS: set[tuple[int, int]] = set()
+
+
+def _remember_same_column(a: Any, b: Any, pair: tuple[int, int]) -> None:
+    try:
+        weakref.finalize(a, _SAME_COLUMN_PAIRS.discard, pair)
+        weakref.finalize(b, _SAME_COLUMN_PAIRS.discard, pair)
+    except TypeError:
+        # Not weak-referenceable: eviction could not be guaranteed, so do not cache.
+        return
+    _SAME_COLUMN_PAIRS.add(pair)
+
+
+def _model_meta(model: type[Any]) -> _ModelMeta:
+    """
+    Return cached `(valid_keys, valid_expr_map, pk_cols)` for `model`.
+    The mapper is inspected (and each InstrumentedAttribute resolved) only on the first call per model.
+    """
+    meta = _MODEL_META_CACHE.get(model)
+    if meta is None:
+        mapper = sa_mapper(model)
+        # Interned keys: lookups with literal/identifier strings from user code hit the identity fast path.
+        valid_expr_map = {sys.intern(a.key): getattr(model, a.key).expression for a in mapper.column_attrs}
+        meta = _ModelMeta(frozenset(valid_expr_map), valid_expr_map, tuple(mapper.primary_key))
+        _MODEL_META_CACHE[model] = meta
+    return meta
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledOrder:
+    """
+    < Normalized ORDER BY plan, built once by `OrderByStrategy.compile()` >
+
+    1. Holds everything keyset paging derives from the ORDER BY columns, so a plan built for a
+       reused ordering (e.g. a module-level `[Model.id.desc()]`) turns per-request work into attribute reads.
+    2. Can be passed as `order_cols` to `KeysetStrategy.apply`.
+
+    Attributes
+    ----------
+    stripped : tuple[ColumnElement[Any], ...]
+        Base columns with asc()/desc() removed (keyset comparison targets).
+    keys : tuple[str, ...]
+        Base key per column (ASC/DESC ignored), in ORDER BY order. Used as the cursor keys,
+        and the same value `OrderByStrategy._base_key()` computes for deduplication.
+    dirs : tuple[bool, ...]
+        True where the column is ordered DESC.
+    cols : tuple[ColumnElement[Any], ...]
+        Normalized ORDER BY columns (direction preserved), ready for `order_by(*cols)`.
+    expected_types : tuple[type | None, ...]
+        `python_type` of each base column (None if the column type does not declare one),
+        used to validate/cast cursor values.
+    """
+
+    stripped: tuple[ColumnElement[Any], ...]
+    keys: tuple[str, ...]
+    dirs: tuple[bool, ...]
+    cols: tuple[ColumnElement[Any], ...]
+    expected_types: tuple[type | None, ...]
+    _value_checks: tuple[tuple[str, type | None], ...] = field(init=False, repr=False, compare=False)
+    _row_lhs: Tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_value_checks', tuple(zip(self.keys, self.expected_types, strict=True)))
+        # Left side of the all-ASC row comparison `(c1, c2, ...) > (v1, v2, ...)`, built once per plan.
+        object.__setattr__(self, '_row_lhs', tuple_(*self.stripped))
+
+    def validate_cursor(self, cursor: Mapping[str, Any]) -> list[Any]:
+        """
+        < Validate a keyset cursor against this plan and return its values in ORDER BY order >
+        1. The cursor keys must equal `keys`, in the same order.
+        2. Values must not be None.
+        3. Values are cast to the column `python_type` when they are not already instances of it.
+
+        The success path is a straight loop over precomputed `(key, expected_type)` pairs;
+        anything that is not an exact type match goes through `_coerce_cursor_value()`.
+
+        Raises
+        ------
+        ValueError
+            If the key set/order does not match, or a value is None.
+        TypeError
+            If a value cannot be cast to the expected type.
+        """
+        cursor_keys = tuple(cursor)
+        if cursor_keys != self.keys:
+            # Matching order (the common case) costs one tuple compare; sets are built only to word the error.
+            if set(cursor_keys) != set(self.keys):
+                raise ValueError(f'cursor keys mismatch. required={list(self.keys)}, got={list(cursor_keys)}')
+            raise ValueError(
+                f'cursor key order must match order_cols. required={list(self.keys)}, got={list(cursor_keys)}'
+            )
+
+        values: list[Any] = []
+        for key, expected_py in self._value_checks:
+            v = cursor[key]
+            if v is None or (expected_py is not None and type(v) is not expected_py):
+                v = _coerce_cursor_value(key, v, expected_py)
+            values.append(v)
+        return values
+
+
+def _coerce_cursor_value(key: str, v: Any, expected_py: type | None) -> Any:
+    """
+    Slow path of `CompiledOrder.validate_cursor()` for None values and non-exact type matches.
+    """
+    if v is None:
+        raise ValueError(f'NULL is not allowed in cursor values. key={key}')
+    if expected_py is None or isinstance(v, expected_py):
+        return v
+
+    # Cursors decoded from JSON/query strings carry str values: common column types parse them
+    # with a dedicated parser that reports failure as `_MISSING` instead of a chained exception.
+    if type(v) is str:
+        cast = _STR_CURSOR_CASTS.get(expected_py)
+        if cast is not None:
+            out = cast(v)
+            if out is _MISSING:
+                raise TypeError(f"cursor['{key}'] is not {expected_py.__name__}.")
+            return out
+
+    try:
+        return expected_py(v)
+    except Exception as e:
+        raise TypeError(f"cursor['{key}'] is not {expected_py.__name__}.") from e
+
+
+def _str_to_int(v: str) -> Any:
+    # Same accepted forms as int(v) (surrounding whitespace, sign, '_' digit separators).
+    try:
+        return int(v)
+    except ValueError:
+        return _MISSING
+
+
+def _str_to_uuid(v: str) -> Any:
+    # Same accepted forms as UUID(v) (braces, 'urn:uuid:' prefix, hyphens anywhere).
+    try:
+        return UUID(v)
+    except ValueError:
+        return _MISSING
+
+
+def _str_to_datetime(v: str) -> Any:
+    try:
+        return datetime.fromisoformat(v)
+    except ValueError:
+        return _MISSING
+
+
+def _str_to_date(v: str) -> Any:
+    try:
+        return date.fromisoformat(v)
+    except ValueError:
+        return _MISSING
+
+
+# Expected python_type -> parser for str cursor values. Each returns `_MISSING` when the value does not parse.
+# Other (type, value) combinations keep the generic `expected_py(v)` cast.
+_STR_CURSOR_CASTS: dict[type, Callable[[str], Any]] = {
+    int: _str_to_int,
+    UUID: _str_to_uuid,
+    datetime: _str_to_datetime,
+    date: _str_to_date,
+}
+
+
 class OrderByStrategy:
     """
     < Order-by input normalization strategy >
@@ -82,38 +318,81 @@ class OrderByStrategy:
             - If it is FunctionElement/TextClause based
             - If the model has no PK for default ordering
         """
+        cols = OrderByStrategy._normalize_with_default(model, order_items)
+
+        # Deduplicate by base column identity (ASC/DESC ignored). First occurrence wins;
+        # dicts keep insertion order, so one table serves as both the "seen" set and the result.
+        by_key: dict[str, ColumnElement[Any]] = {}
+        for c in cols:
+            base = OrderByStrategy._base_key(c)
+            if base not in by_key:
+                by_key[base] = c
+        return list(by_key.values())
+
+    @staticmethod
+    def _normalize_with_default(model: type[TModel], order_items: Sequence[Any] | None) -> list[ColumnElement[Any]]:
+        """
+        Steps 1-3 of `apply()`: reject a bare string, normalize/validate, then fall back to the PK columns.
+        """
         if isinstance(order_items, str):
             raise TypeError('order_items must be a Sequence, not a single string.')
 
-        cols: list[Any] = list(order_items or [])
-        cols = OrderByStrategy._normalize_and_validate(model, cols)
+        cols = OrderByStrategy._normalize_and_validate(model, list(order_items or []))
 
         # If no ordering is provided, use PK columns as the default (supports composite PK).
+        # The PK tuple is cached per model, so this is a plain tuple -> list copy.
         if not cols:
-            pks = list(sa_mapper(model).primary_key)
-            if not pks:
+            pk_cols = _model_meta(model).pk_cols
+            if not pk_cols:
                 raise ValueError('Cannot build a default ordering. The model must have a primary key.')
-            cols.extend(pks)
+            cols = list(pk_cols)
+        return cols
 
-        # Deduplicate by base column identity (ASC/DESC ignored). First occurrence wins.
-        seen: set[str] = set()
-        uniq: list[ColumnElement[Any]] = []
-        for c in cols:
-            base = OrderByStrategy._base_key(c)
-            if base in seen:
-                continue
-            seen.add(base)
-            uniq.append(c)
-        return uniq
+    @staticmethod
+    def compile(model: type[TModel], order_items: Sequence[Any] | None) -> CompiledOrder:
+        """
+        < Normalize ordering criteria once into a reusable CompiledOrder >
+        1. Normalize and validate like `apply()` (same inputs, defaults and errors).
+        2. Split into base columns, base keys and directions in one pass, then deduplicate by base key.
+        3. Resolve expected cursor value types for keyset paging.
+
+        Returns
+        -------
+        CompiledOrder
+            Plan that can be passed to `KeysetStrategy.apply(order_cols=...)` on every request.
+        """
+        cols = tuple(OrderByStrategy._normalize_with_default(model, order_items))
+
+        # The base keys from `_decompose` double as the dedup keys (same rule as `apply()`),
+        # so `_base_key` / `is_desc` are never re-evaluated per column.
+        stripped, keys, dirs = _decompose(cols)
+        if len(set(keys)) != len(keys):
+            first: dict[str, int] = {}
+            for i, k in enumerate(keys):
+                if k not in first:
+                    first[k] = i
+            idx = tuple(first.values())
+            cols = tuple(cols[i] for i in idx)
+            stripped = tuple(stripped[i] for i in idx)
+            keys = tuple(keys[i] for i in idx)
+            dirs = tuple(dirs[i] for i in idx)
+
+        return CompiledOrder(
+            stripped=stripped,
+            keys=keys,
+            dirs=dirs,
+            cols=cols,
+            expected_types=tuple(_expected_python_type(c) for c in stripped),
+        )
 
     @staticmethod
     def _normalize_and_validate(model: type[TModel], cols: list[Any]) -> list[ColumnElement[Any]]:
         """
         < Normalize each input to ColumnElement and validate against the model >
-        1. Build:
+        1. Read (cached per model via `_model_meta()`):
            - `valid_keys`: allowed column keys from `mapper.column_attrs`
            - `valid_expr_map`: key -> expected ColumnElement expression
-        2. For each input:
+        2. For each input, dispatch on `type(item)` to a handler (see `_order_handler()`):
            - str / Enum(value=str): map to the expected model column expression
            - InstrumentedAttribute: must belong to `model`, then map to expected expression
            - UnaryExpression (asc/desc):
@@ -135,94 +414,14 @@ class OrderByStrategy:
         ValueError
             If an input is unsupported or fails model/table/column validation.
         """
-        mapper = sa_mapper(model)
-        valid_map = {c.key: getattr(model, c.key) for c in mapper.column_attrs}
-        valid_keys = set(valid_map.keys())
-        valid_expr_map = {k: v.expression for k, v in valid_map.items()}
+        valid_keys, valid_expr_map, _ = _model_meta(model)
 
         out: list[ColumnElement[Any]] = []
-
         for item in cols:
-            # 1) String column key
-            if isinstance(item, str):
-                if item not in valid_keys:
-                    raise ValueError(f"Model {model.__name__} does not have a field '{item}'.")
-                out.append(valid_expr_map[item])
-                continue
-
-            # 2) Enum (only when value is str)
-            if isinstance(item, Enum) and isinstance(item.value, str):
-                name = item.value
-                if name not in valid_keys:
-                    raise ValueError(f"Model {model.__name__} does not have a field '{name}'.")
-                out.append(valid_expr_map[name])
-                continue
-
-            # 3) Unary expressions (asc()/desc(), etc.)
-            if isinstance(item, UnaryExpression):
-                inner = item.element
-
-                # Reject function/text-based ordering.
-                if isinstance(inner, FunctionElement | TextClause):
-                    raise ValueError(f'Unsupported order_by input type: {item!r}')
-
-                # InstrumentedAttribute: must belong to the same model
-                if isinstance(inner, InstrumentedAttribute):
-                    cls = getattr(inner, 'class_', None)
-                    if cls is not model:
-                        raise ValueError(f'{inner} belongs to another model ({getattr(cls, "__name__", "Unknown")}).')
-                    key_or_name = inner.key
-                    if key_or_name not in valid_keys:
-                        raise ValueError(f"Model {model.__name__} does not have a field '{key_or_name}'.")
-                    out.append(item)  # preserve direction
-                    continue
-
-                # ColumnElement: strict same-table + same-column validation
-                if isinstance(inner, ColumnElement):
-                    key_or_name = getattr(inner, 'key', getattr(inner, 'name', None))
-                    if key_or_name is None or key_or_name not in valid_keys:
-                        raise ValueError(f"Model {model.__name__} does not have a field '{key_or_name}'.")
-                    expected = valid_expr_map[str(key_or_name)]
-                    if not OrderByStrategy._same_table(inner, expected):
-                        raise ValueError(f"Model {model.__name__} does not have a field '{key_or_name}'.")
-                    if not OrderByStrategy._same_column(inner, expected):
-                        raise ValueError(f"Model {model.__name__} does not have a field '{key_or_name}'.")
-                    out.append(item)  # preserve direction
-                    continue
-
-                raise ValueError(f'Unsupported order_by input type: {item!r}')
-
-            # 4) ORM column attribute
-            if isinstance(item, InstrumentedAttribute):
-                cls = getattr(item, 'class_', None)
-                if cls is not model:
-                    raise ValueError(f"'{item}' belongs to another model ({getattr(cls, '__name__', 'Unknown')}).")
-                key_or_name = item.key
-                if key_or_name not in valid_keys:
-                    raise ValueError(f"Model {model.__name__} does not have a field '{key_or_name}'.")
-                out.append(valid_expr_map[key_or_name])
-                continue
-
-            # 5) ColumnElement (labels/aliases/expressions): must pass strict identity checks
-            if isinstance(item, ColumnElement):
-                key_or_name = getattr(item, 'key', getattr(item, 'name', None))
-                if key_or_name is None or key_or_name not in valid_keys:
-                    raise ValueError(f'Unsupported order_by input type: {item!r}')
-                expected = valid_expr_map[str(key_or_name)]
-                if not OrderByStrategy._same_table(item, expected):
-                    raise ValueError(f"Model {model.__name__} does not have a field '{key_or_name}'.")
-                if not OrderByStrategy._same_column(item, expected):
-                    raise ValueError(f"Model {model.__name__} does not have a field '{key_or_name}'.")
-                out.append(expected)  # collapse to canonical expression
-                continue
-
-            # 6) Function/Text: explicitly rejected
-            if isinstance(item, FunctionElement | TextClause):
-                raise ValueError(f'Unsupported order_by input type: {item!r}')
-
-            # 7) Unsupported
-            raise ValueError(f'Unsupported order_by input type: {item!r}')
-
+            handler = _ORDER_HANDLERS.get(type(item))
+            if handler is None:
+                handler = _order_handler(type(item))
+            out.append(handler(item, model, valid_keys, valid_expr_map))
         return out
 
     @staticmethod
@@ -240,30 +439,44 @@ class OrderByStrategy:
         """
         Strictly determine whether two expressions refer to the same underlying DB column.
 
-        Order of checks:
-        1) If `a.compare(b)` is True => same
-        2) If `b` is in `a.proxy_set` => same (labels/aliases)
-        3) Recursively follow `a.element` / `a.original`
-        4) Otherwise => False (simple key/name comparison is intentionally avoided)
+        Walks `a` and its `element` / `original` chain (depth-first, each node once) and, per node:
+        1) If `b` is in `node.proxy_set` => same (labels/aliases)
+        2) If `node.compare(b)` is True => same (exceptions from compare are ignored)
+        3) Otherwise continue with `node.element` / `node.original`
+        Nothing matched => False (simple key/name comparison is intentionally avoided).
+
+        Positive results are remembered per `(a, b)` object pair until either object is collected.
         """
-        try:
-            cmp = getattr(a, 'compare', None)
-            if callable(cmp) and cmp(b):
+        pair = (id(a), id(b))
+        if pair in _SAME_COLUMN_PAIRS:
+            return True
+
+        stack = [a]
+        seen: dict[int, Any] = {}  # id -> node; holding the node keeps its id from being reused mid-walk
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen[id(node)] = node
+
+            proxy = getattr(node, 'proxy_set', None)
+            if proxy is not None and b in proxy:
+                _remember_same_column(a, b, pair)
                 return True
-        except Exception:
-            pass
 
-        a_proxy = getattr(a, 'proxy_set', None)
-        if a_proxy is not None and b in a_proxy:
-            return True
+            try:
+                cmp = getattr(node, 'compare', None)
+                if callable(cmp) and cmp(b):
+                    _remember_same_column(a, b, pair)
+                    return True
+            except Exception:
+                pass
 
-        for attr in ('element', 'original'):
-            if hasattr(a, attr):
-                try:
-                    if OrderByStrategy._same_column(getattr(a, attr), b):
-                        return True
-                except RecursionError:
-                    break
+            # Pushed in reverse so `element` is explored before `original`.
+            for attr in ('original', 'element'):
+                child = getattr(node, attr, None)
+                if child is not None:
+                    stack.append(child)
 
         return False
 
@@ -274,9 +487,9 @@ class OrderByStrategy:
         ASC/DESC direction is ignored, so the same column is kept only once.
         """
         if isinstance(col, UnaryExpression):
-            inner = col.element
-            return getattr(inner, 'key', getattr(inner, 'name', repr(inner)))
-        return getattr(col, 'key', getattr(col, 'name', repr(col)))
+            col = col.element
+        key = _key_or_name(col, _MISSING)
+        return repr(col) if key is _MISSING else key
 
     @staticmethod
     def is_desc(col: ColumnElement[Any]) -> bool:
@@ -284,3 +497,133 @@ class OrderByStrategy:
         Return True if the given unary ordering expression is DESC.
         """
         return isinstance(col, UnaryExpression) and col.modifier is operators.desc_op
+
+
+# ---------------------------------------------------------------------------
+# Per-input-type handlers for `OrderByStrategy._normalize_and_validate`
+# ---------------------------------------------------------------------------
+
+_OrderHandler = Callable[[Any, type[Any], frozenset[str], dict[str, ColumnElement[Any]]], ColumnElement[Any]]
+
+
+def _missing_field(model: type[Any], name: Any) -> ValueError:
+    return ValueError(f"Model {model.__name__} does not have a field '{name}'.")
+
+
+def _unsupported(item: Any) -> ValueError:
+    return ValueError(f'Unsupported order_by input type: {item!r}')
+
+
+def _order_str(
+    item: Any, model: type[Any], valid_keys: frozenset[str], valid_expr_map: dict[str, ColumnElement[Any]]
+) -> ColumnElement[Any]:
+    # 1) String column key
+    if item not in valid_keys:
+        raise _missing_field(model, item)
+    return valid_expr_map[item]
+
+
+def _order_enum(
+    item: Any, model: type[Any], valid_keys: frozenset[str], valid_expr_map: dict[str, ColumnElement[Any]]
+) -> ColumnElement[Any]:
+    # 2) Enum (only when value is str)
+    name = item.value
+    if not isinstance(name, str):
+        raise _unsupported(item)
+    if name not in valid_keys:
+        raise _missing_field(model, name)
+    return valid_expr_map[name]
+
+
+def _order_unary(
+    item: Any, model: type[Any], valid_keys: frozenset[str], valid_expr_map: dict[str, ColumnElement[Any]]
+) -> ColumnElement[Any]:
+    # 3) Unary expressions (asc()/desc(), etc.)
+    inner = item.element
+
+    # Reject function/text-based ordering.
+    if isinstance(inner, FunctionElement | TextClause):
+        raise _unsupported(item)
+
+    # InstrumentedAttribute: must belong to the same model
+    if isinstance(inner, InstrumentedAttribute):
+        cls = getattr(inner, 'class_', None)
+        if cls is not model:
+            raise ValueError(f'{inner} belongs to another model ({getattr(cls, "__name__", "Unknown")}).')
+        if inner.key not in valid_keys:
+            raise _missing_field(model, inner.key)
+        return item  # preserve direction
+
+    # ColumnElement: strict same-table + same-column validation
+    if isinstance(inner, ColumnElement):
+        key_or_name = _key_or_name(inner)
+        if key_or_name is None or key_or_name not in valid_keys:
+            raise _missing_field(model, key_or_name)
+        expected = valid_expr_map[str(key_or_name)]
+        if not OrderByStrategy._same_table(inner, expected):
+            raise _missing_field(model, key_or_name)
+        if not OrderByStrategy._same_column(inner, expected):
+            raise _missing_field(model, key_or_name)
+        return item  # preserve direction
+
+    raise _unsupported(item)
+
+
+def _order_attribute(
+    item: Any, model: type[Any], valid_keys: frozenset[str], valid_expr_map: dict[str, ColumnElement[Any]]
+) -> ColumnElement[Any]:
+    # 4) ORM column attribute
+    cls = getattr(item, 'class_', None)
+    if cls is not model:
+        raise ValueError(f"'{item}' belongs to another model ({getattr(cls, '__name__', 'Unknown')}).")
+    if item.key not in valid_keys:
+        raise _missing_field(model, item.key)
+    return valid_expr_map[item.key]
+
+
+def _order_column_element(
+    item: Any, model: type[Any], valid_keys: frozenset[str], valid_expr_map: dict[str, ColumnElement[Any]]
+) -> ColumnElement[Any]:
+    # 5) ColumnElement (labels/aliases/expressions): must pass strict identity checks
+    key_or_name = _key_or_name(item)
+    if key_or_name is None or key_or_name not in valid_keys:
+        raise _unsupported(item)
+    expected = valid_expr_map[str(key_or_name)]
+    if not OrderByStrategy._same_table(item, expected):
+        raise _missing_field(model, key_or_name)
+    if not OrderByStrategy._same_column(item, expected):
+        raise _missing_field(model, key_or_name)
+    return expected  # collapse to canonical expression
+
+
+def _order_reject(
+    item: Any, model: type[Any], valid_keys: frozenset[str], valid_expr_map: dict[str, ColumnElement[Any]]
+) -> ColumnElement[Any]:
+    # 6) Function/Text (explicitly rejected) and 7) anything else
+    raise _unsupported(item)
+
+
+# Exact input type -> handler. Seeded with the common inputs; other types are resolved once by
+# `_order_handler()` (in the same precedence as an isinstance chain) and then remembered here.
+_ORDER_HANDLERS: dict[type, _OrderHandler] = {
+    str: _order_str,
+    UnaryExpression: _order_unary,
+    InstrumentedAttribute: _order_attribute,
+}
+
+
+def _order_handler(t: type) -> _OrderHandler:
+    if issubclass(t, str):
+        handler: _OrderHandler = _order_str
+    elif issubclass(t, Enum):
+        handler = _order_enum
+    elif issubclass(t, UnaryExpression):
+        handler = _order_unary
+    elif issubclass(t, InstrumentedAttribute):
+        handler = _order_attribute
+    elif issubclass(t, ColumnElement):
+        handler = _order_column_element
+    else:
+        handler = _order_reject
+    _ORDER_HANDLERS[t] = handler
+    return handler
@@ -2,7 +2,6 @@ import sys
 from typing import TYPE_CHECKING, TypeAlias
 
 from pydantic import BaseModel
-from sqlalchemy import Select
 from sqlalchemy.orm import DeclarativeBase
 
 if sys.version_info >= (3, 13):
@@ -11,14 +10,17 @@ else:
     from typing_extensions import TypeVar
 
 if TYPE_CHECKING:
+    # Only referenced from the string alias below; needed by type checkers, never imported at runtime.
+    from sqlalchemy import Select
+
     from base_repository.query.list_query import ListQuery
 
+__all__ = ['NoSchema', 'QueryOrStmt', 'TModel', 'TPydanticSchema', 'TSchema']
+
 
 class NoSchema:
     """Typing-only sentinel. Never used as a real mapping schema."""
 
-    pass
-
 
 TModel = TypeVar('TModel', bound=DeclarativeBase)
 TPydanticSchema = TypeVar('TPydanticSchema', bound=BaseModel)
@@ -1,26 +1,34 @@
 from __future__ import annotations
 
 import builtins
-from collections.abc import Mapping, Sequence
-from typing import Annotated, Any, Generic, cast, get_args
+import warnings
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import is_dataclass
+from typing import TYPE_CHECKING, Annotated, Any, Generic, Literal, cast, get_args
 
-from pydantic import BaseModel
-from sqlalchemy import Integer, Update, delete, func, select
+from pydantic import BaseModel, PlainSerializer, TypeAdapter, WrapSerializer
+from sqlalchemy import Insert, Integer, Table, Update, bindparam, delete, func, insert, select, text
 from sqlalchemy import update as sa_update
-from sqlalchemy.engine import ScalarResult
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapper
-from sqlalchemy.sql import Select
 from typing_extensions import Doc
 
 from base_repository.base_filter import BaseRepoFilter
 from base_repository.base_mapper import BaseMapper
 from base_repository.query.converter import query_to_stmt
 from base_repository.query.list_query import ListQuery
+from base_repository.query.strategies import OffsetStrategy, OrderByStrategy
 from base_repository.repo_types import QueryOrStmt, TModel, TSchema
 from base_repository.sa_helper import sa_mapper
 from base_repository.session_provider import SessionProvider
-from base_repository.validator import validate_schema_base
+from base_repository.validator import is_msgspec_struct, validate_schema_base
+
+if TYPE_CHECKING:
+    # Optional dependency: only referenced in annotations and casts.
+    import msgspec
+
+# Planner row estimate for one relation; `rel` is the quoted (schema-qualified) table name.
+_PG_RELTUPLES = text('SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:rel AS regclass)')
 
 
 class BaseRepository(Generic[TModel, TSchema]):
@@ -65,6 +73,178 @@ class BaseRepository(Generic[TModel, TSchema]):
         Doc('Default return type flag. True returns schema(Pydantic) by default, False returns ORM objects.'),
     ] = False
 
+    _schema_backend: Annotated[
+        Literal['pydantic', 'msgspec'],
+        Doc(
+            'How mapping_schema objects are built from ORM rows. Set by __init_subclass__:\n'
+            "- 'pydantic': mapping_schema is a BaseModel (model_validate / TypeAdapter)\n"
+            "- 'msgspec' : mapping_schema is a msgspec.Struct (msgspec.convert(..., from_attributes=True))"
+        ),
+    ] = 'pydantic'
+
+    trusted_construct: Annotated[
+        bool | None,
+        Doc(
+            'ORM → schema conversion via `model_construct` (no Pydantic validation) instead of `model_validate`.\n'
+            '- False : always validate (default; pydantic-core validation of plain scalar rows is usually\n'
+            '          faster than the Python-level `model_construct`).\n'
+            '- None  : auto. Construct only when mapping_schema declares no validators and every field is a\n'
+            '          plain model column (no nested BaseModel types).\n'
+            '- True  : always construct (the caller guarantees DB values already match the schema types);\n'
+            '          schema fields that are not model columns keep their defaults.'
+        ),
+    ] = False
+
+    bulk_insert_threshold: Annotated[
+        int | None,
+        Doc(
+            'Batch size from which create_many() switches to a single bulk `INSERT ... RETURNING`\n'
+            '(see create_many_core()). None always keeps the ORM add_all + flush path.\n'
+            'Models with `@validates` validators, mapper `before_insert`/`after_insert` listeners or a custom\n'
+            'constructor always keep the ORM path, since the bulk statement bypasses them. Session flush events\n'
+            '(e.g. `before_flush`) do not see bulk batches either; set None if the app relies on them.'
+        ),
+    ] = 50
+    copy_threshold: Annotated[
+        int,
+        Doc(
+            'Minimum batch size for which create_many_copy() uses PostgreSQL COPY (asyncpg only).\n'
+            'Smaller batches use a plain bulk INSERT.'
+        ),
+    ] = 1000
+
+    _sa_mapper: Annotated[
+        Mapper[Any],
+        Doc(
+            'Per-class cache of the SQLAlchemy Mapper of `model`, shared by instances as `self.sa_mapper`.\n'
+            'Built on first __init__; not meant to be set by subclasses.'
+        ),
+    ]
+    _column_keys: Annotated[
+        frozenset[str],
+        Doc(
+            'Per-class cache of model column keys (mapper.column_attrs).\n'
+            'Built on first use by _model_key_sets(); not meant to be set by subclasses.'
+        ),
+    ]
+    _autoinc_pk: Annotated[
+        frozenset[str],
+        Doc(
+            'Per-class cache of autoincrement PK column keys (see _autoinc_pk_keys()).\n'
+            'Built on first use by _model_key_sets(); not meant to be set by subclasses.'
+        ),
+    ]
+    _payload_keys: Annotated[
+        frozenset[str],
+        Doc(
+            'Per-class cache of the keys _schema_payload() keeps: column keys minus autoincrement PK keys.\n'
+            'Built on first use by _model_key_sets(); not meant to be set by subclasses.'
+        ),
+    ]
+    _session_warned: Annotated[
+        set[str],
+        Doc(
+            "Per-class record of __init__ session warnings already emitted ('provider' / 'session').\n"
+            'Built on first use; not meant to be set by subclasses.'
+        ),
+    ]
+    _pk_attr_keys: Annotated[
+        tuple[str, ...],
+        Doc(
+            'Per-class cache of primary key attribute keys (see _pk_keys()).\n'
+            'Built on first use; not meant to be set by subclasses.'
+        ),
+    ]
+    _required_fields: Annotated[
+        frozenset[str],
+        Doc(
+            'Per-class cache of required mapping_schema field names, stored once they are validated against\n'
+            'the model columns (see _validate_schema_against_model()); not meant to be set by subclasses.'
+        ),
+    ]
+    _required_schema: Annotated[
+        type[BaseModel],
+        Doc('Schema whose `_required_fields` were validated for this Repository class.'),
+    ]
+    _clean_payload_types: Annotated[
+        dict[type[BaseModel], bool],
+        Doc(
+            'Per-class cache of schema type → whether its dump is already a columns-only payload.\n'
+            'Built on first use by _payload_is_clean(); not meant to be set by subclasses.'
+        ),
+    ]
+    _payload_fields: Annotated[
+        dict[type[BaseModel], tuple[str, ...] | None],
+        Doc(
+            'Per-class cache of schema type → column fields read directly by _schema_payload() (None: use dump).\n'
+            'Built on first use by _payload_field_names(); not meant to be set by subclasses.'
+        ),
+    ]
+    _construct_fields: Annotated[
+        tuple[str, ...] | None,
+        Doc(
+            'Per-class cache of schema field names copied by model_construct, or None to use model_validate.\n'
+            'Built on first use by _construct_names(); not meant to be set by subclasses.'
+        ),
+    ]
+    _insert_returning: Annotated[
+        Insert | None,
+        Doc(
+            'Per-class cache of the Core INSERT ... RETURNING statement used by create(), or None if unusable.\n'
+            'Built on first use by _insert_returning_stmt(); not meant to be set by subclasses.'
+        ),
+    ]
+    _insert_defaulted: Annotated[
+        frozenset[str],
+        Doc(
+            'Per-class cache of column keys whose None payload values are left out of the Core INSERT, so their\n'
+            'default applies as in an ORM flush. Built with _insert_returning; not meant to be set by subclasses.'
+        ),
+    ]
+    _plain_insert: Annotated[
+        bool,
+        Doc(
+            'Per-class cache of whether statement-level inserts behave like constructing the model and flushing it.\n'
+            'Built on first use by _has_no_insert_hooks(); not meant to be set by subclasses.'
+        ),
+    ]
+    _bulk_insert_stmt: Annotated[
+        Insert,
+        Doc(
+            'Per-class cache of the ORM bulk INSERT ... RETURNING statement used by create_many_core().\n'
+            'Built on first use; not meant to be set by subclasses.'
+        ),
+    ]
+    _update_stmts: Annotated[
+        dict[frozenset[str], tuple[Update, tuple[tuple[str, str], ...]] | None],
+        Doc(
+            'Per-class cache of Core UPDATE-by-primary-key statements used by update_many(), keyed by payload keys.\n'
+            'Each entry holds the statement and its (attribute key, bind name) pairs, or None for multi-table models.\n'
+            'Built on first use by _update_by_pk_stmt(); not meant to be set by subclasses.'
+        ),
+    ]
+    _filter_stmts: Annotated[
+        dict[tuple[Any, ...], Any],
+        Doc(
+            'Per-class cache of get/list/count statements keyed by (kind, filter class, filter shape).\n'
+            'Built on first use by _filter_stmt(); not meant to be set by subclasses.'
+        ),
+    ]
+    _list_adapter: Annotated[
+        TypeAdapter[builtins.list[Any]],
+        Doc(
+            'Per-class cache of `TypeAdapter(list[mapping_schema])` used to convert result lists in one call.\n'
+            'Built on first use by _convert_many(); not meant to be set by subclasses.'
+        ),
+    ]
+    _copy_columns: Annotated[
+        tuple[tuple[str, str], ...],
+        Doc(
+            'Per-class cache of (attribute key, column name) pairs written by COPY (autoincrement PK excluded).\n'
+            'Built on first use by create_many_copy(); not meant to be set by subclasses.'
+        ),
+    ]
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """
         Hook automatically invoked when a subclass is declared.
@@ -74,9 +254,9 @@ class BaseRepository(Generic[TModel, TSchema]):
         1. Extract Generic args from cls.__orig_bases__ (e.g., BaseRepository[Model, Schema]).
         2. If the subclass did not explicitly define `model`, infer it from the 1st Generic arg and assign `cls.model`.
         3. If the subclass did not explicitly define `mapping_schema`, infer it from the 2nd Generic arg
-        (only when it is a Pydantic BaseModel subclass) and assign `cls.mapping_schema`.
-        4. If `mapping_schema` is set, run lightweight schema validation (BaseModel type / from_attributes, etc.)
-        via `validate_schema_base()`.
+        (only when it is a Pydantic BaseModel or msgspec.Struct subclass) and assign `cls.mapping_schema`.
+        4. If `mapping_schema` is set, pick `_schema_backend`; for Pydantic schemas run lightweight schema
+        validation (BaseModel type / from_attributes, etc.) via `validate_schema_base()`.
         """
         super().__init_subclass__(**kwargs)
 
@@ -93,18 +273,25 @@ class BaseRepository(Generic[TModel, TSchema]):
 
             if inferred_schema is None and len(args) >= 2:
                 schema_arg = args[1]
-                if isinstance(schema_arg, type) and issubclass(schema_arg, BaseModel):
+                if isinstance(schema_arg, type) and (
+                    issubclass(schema_arg, BaseModel) or is_msgspec_struct(schema_arg)
+                ):
                     inferred_schema = schema_arg
 
         if not hasattr(cls, 'model') and inferred_model is not None:
             cls.model = cast(type[TModel], inferred_model)
 
-        if getattr(cls, 'mapping_schema', None) is None and inferred_schema is not None:
+        # `mapping_schema` defaults to None on BaseRepository, so it can be read directly.
+        if cls.mapping_schema is None and inferred_schema is not None:
             cls.mapping_schema = cast(type[TSchema], inferred_schema)
 
-        if getattr(cls, 'mapping_schema', None) is not None:
+        if cls.mapping_schema is not None:
             schema = cast(type[BaseModel], cls.mapping_schema)
-            validate_schema_base(schema)
+            if is_msgspec_struct(schema):
+                cls._schema_backend = 'msgspec'
+            else:
+                validate_schema_base(schema)
+                cls._schema_backend = 'pydantic'
             cls._default_convert_schema = True
 
     def __init__(
@@ -138,7 +325,12 @@ class BaseRepository(Generic[TModel, TSchema]):
         - ValueError: when `default_convert_schema=True` but no schema is configured.
         """
         self._specific_session = session
-        self.sa_mapper: Mapper[Any] = sa_mapper(self.model)
+        cls = type(self)
+        model_mapper: Mapper[Any] | None = cls.__dict__.get('_sa_mapper')
+        if model_mapper is None:
+            model_mapper = sa_mapper(self.model)
+            cls._sa_mapper = model_mapper
+        self.sa_mapper: Mapper[Any] = model_mapper
 
         # Configure an instance-level mapper
         candiate_mapper = mapper
@@ -159,23 +351,28 @@ class BaseRepository(Generic[TModel, TSchema]):
                 raise ValueError('default_convert_schema=True is not allowed without mapping_schema.')
             self._default_convert_schema = default_convert_schema
 
-        if session is not None and self._session_provider is not None:
-            import warnings
-
-            warnings.warn(
-                '[BaseRepository] Repository-level session was provided via __init__, '
-                'but a SessionProvider is also configured. The SessionProvider takes precedence, '
-                'and the repository-level session will be ignored.',
-                stacklevel=2,
-            )
-        elif session is not None:
-            import warnings
-
-            warnings.warn(
-                '[BaseRepository] Repository-level session was provided via __init__. '
-                "Stale or closed session handling is the caller's responsibility.",
-                stacklevel=2,
-            )
+        if session is not None:
+            # Each warning is emitted once per Repository class; repos are often built per request.
+            kind = 'provider' if self._session_provider is not None else 'session'
+            warned: set[str] | None = cls.__dict__.get('_session_warned')
+            if warned is None:
+                warned = set()
+                cls._session_warned = warned
+            if kind not in warned:
+                warned.add(kind)
+                if kind == 'provider':
+                    warnings.warn(
+                        '[BaseRepository] Repository-level session was provided via __init__, '
+                        'but a SessionProvider is also configured. The SessionProvider takes precedence, '
+                        'and the repository-level session will be ignored.',
+                        stacklevel=2,
+                    )
+                else:
+                    warnings.warn(
+                        '[BaseRepository] Repository-level session was provided via __init__. '
+                        "Stale or closed session handling is the caller's responsibility.",
+                        stacklevel=2,
+                    )
 
     @classmethod
     def configure_session_provider(cls, provider: SessionProvider) -> None:
@@ -183,15 +380,20 @@ class BaseRepository(Generic[TModel, TSchema]):
 
     @property
     def session(self) -> AsyncSession:
-        if self._session_provider is None:
-            if self._specific_session is None:
-                raise RuntimeError('Neither SessionProvider nor specific_session is configured.')
-            return self._specific_session
-
-        return self._session_provider.get_session()
+        return self._resolve_session(None)
 
     def _resolve_session(self, session: AsyncSession | None) -> AsyncSession:
-        return session if session is not None else self.session
+        # Called by every CRUD method: resolved inline (no property hop) with one read of each attribute.
+        # The provider is not bound at __init__ because configure_session_provider() may run later, on any class.
+        if session is not None:
+            return session
+        provider = self._session_provider
+        if provider is not None:
+            return provider.get_session()
+        specific = self._specific_session
+        if specific is None:
+            raise RuntimeError('Neither SessionProvider nor specific_session is configured.')
+        return specific
 
     def _validate_mapper_integrity(self, mapper_instance: BaseMapper) -> None:
         """
@@ -208,54 +410,183 @@ class BaseRepository(Generic[TModel, TSchema]):
         Note
         ----
         Accessing SQLAlchemy mapper.column_attrs is only done after instance construction.
+        A passing check is remembered per Repository class (`_required_fields`), so later instances skip it.
         """
-        model_column_names = {prop.key for prop in self.sa_mapper.column_attrs}
-        required = {n for n, f in schema.model_fields.items() if f.is_required()}
-        missing = required - model_column_names
+        cls = type(self)
+        if cls.__dict__.get('_required_schema') is schema:
+            return
+
+        if self._schema_backend == 'msgspec':
+            import msgspec
+
+            struct = cast('type[msgspec.Struct]', schema)
+            required = frozenset(f.name for f in msgspec.structs.fields(struct) if f.required)
+        else:
+            required = frozenset(n for n, f in schema.model_fields.items() if f.is_required())
+        missing = set(required - self._model_key_sets()[0])
         if missing:
             raise TypeError(
                 f'[Strict] Required schema fields must map to model columns only: missing={missing} '
                 f'(model={self.model.__name__})'
             )
+        cls._required_fields = required
+        cls._required_schema = schema
+
+    def _pk_keys(self) -> tuple[str, ...]:
+        """
+        Return the mapper attribute keys of the model's primary key columns (cached per Repository class).
+        """
+        cls = type(self)
+        keys: tuple[str, ...] | None = cls.__dict__.get('_pk_attr_keys')
+        if keys is None:
+            mapper = self.sa_mapper
+            keys = tuple(mapper.get_property_by_column(col).key for col in mapper.primary_key)
+            cls._pk_attr_keys = keys
+        return keys
+
+    def _model_key_sets(self) -> tuple[frozenset[str], frozenset[str]]:
+        """
+        Return `(column keys, autoincrement PK keys)` for this Repository's model.
 
-    def _autoinc_pk_keys(self) -> set[str]:
+        Both depend only on the model, so they are computed once per Repository class and stored
+        in the class's own `__dict__` (subclasses never reuse a parent's sets). Computed lazily
+        because the mapper must not be inspected at class definition time.
+        """
+        cls = type(self)
+        column_keys: frozenset[str] | None = cls.__dict__.get('_column_keys')
+        autoinc_pk: frozenset[str] | None = cls.__dict__.get('_autoinc_pk')
+        if column_keys is None or autoinc_pk is None:
+            column_keys = frozenset(prop.key for prop in self.sa_mapper.column_attrs)
+            # Mapper columns always carry these attributes (expressions have primary_key=False), so read them
+            # directly. Keys are mapper attribute keys, matching the payload keys built from column_attrs.
+            autoinc_pk = frozenset(
+                key
+                for key, col in self.sa_mapper.columns.items()
+                if col.primary_key and isinstance(col.type, Integer) and col.autoincrement is True
+            )
+            cls._column_keys = column_keys
+            cls._autoinc_pk = autoinc_pk
+            cls._payload_keys = column_keys - autoinc_pk
+        return column_keys, autoinc_pk
+
+    def _payload_key_set(self) -> frozenset[str]:
+        """
+        Return the keys `_schema_payload()` keeps: model column keys minus autoincrement PK keys
+        (cached per Repository class with `_model_key_sets()`).
+        """
+        keys: frozenset[str] | None = type(self).__dict__.get('_payload_keys')
+        if keys is None:
+            self._model_key_sets()
+            keys = type(self)._payload_keys
+        return keys
+
+    def _autoinc_pk_keys(self) -> frozenset[str]:
         """
         Autoincrement PK detection rules:
 
         - primary_key=True
         - isinstance(col.type, Integer) (includes BigInteger)
         - Column.autoincrement is True (string 'auto' is NOT accepted)
+
+        Cached per Repository class (see `_model_key_sets()`).
         """
-        keys: set[str] = set()
-        for col in self.sa_mapper.columns:
-            if not getattr(col, 'primary_key', False):
-                continue
-            if not isinstance(getattr(col, 'type', None), Integer):
-                continue
-            if getattr(col, 'autoincrement', None) is True:
-                keys.add(col.key)
-        return keys
+        return self._model_key_sets()[1]
 
     def _schema_payload(
         self,
-        data: Annotated[BaseModel | Mapping[str, Any], Doc('Pydantic model or mapping input.')],
+        data: Annotated[
+            BaseModel | Mapping[str, Any] | msgspec.Struct, Doc('Pydantic model, msgspec.Struct or mapping input.')
+        ],
     ) -> Annotated[dict[str, Any], Doc('Payload sanitized to model columns only.')]:
         """
         Normalize schema/mapping input into a **model-columns-only payload**.
 
         Steps
         -----
-        1) Pydantic → dict via `model_dump(exclude_unset=True)`
+        1) Pydantic → dict via `model_dump(exclude_unset=True)` (msgspec.Struct → fields that are not UNSET)
         2) Filter keys by model column keys
         3) Remove **autoincrement PK** keys (ignore client input)
+
+        Steps 2-3 are a single pass against the per-class `_payload_key_set()`, and are skipped
+        entirely for schema types whose dump can only contain non-autoincrement column keys
+        (see `_payload_is_clean()`).
         """
-        raw = data.model_dump(exclude_unset=True) if isinstance(data, BaseModel) else dict(data)
-        colnames = {prop.key for prop in self.sa_mapper.column_attrs}
-        payload = {k: v for k, v in raw.items() if k in colnames}
+        if type(data) is dict:
+            # Plain dicts (the usual bulk input) skip the BaseModel/Mapping ABC checks and are filtered directly.
+            allowed = self._payload_key_set()
+            return {k: v for k, v in data.items() if k in allowed}
+        if isinstance(data, BaseModel):
+            t = type(data)
+            names = self._payload_field_names(t)
+            if names is not None:
+                # Plain schemas: read set fields straight from the instance, no serializer round-trip.
+                fields_set = data.__pydantic_fields_set__
+                state = data.__dict__
+                return {k: state[k] for k in names if k in fields_set}
+            if t.model_dump is BaseModel.model_dump:
+                # Same as model_dump(exclude_unset=True) without the Python-level wrapper.
+                raw = t.__pydantic_serializer__.to_python(data, exclude_unset=True)
+            else:
+                raw = data.model_dump(exclude_unset=True)
+            if self._payload_is_clean(t):
+                return raw
+        elif isinstance(data, Mapping) or not is_msgspec_struct(type(data)):
+            raw = data
+        else:
+            import msgspec
+
+            # Struct fields left as msgspec.UNSET play the role of Pydantic's unset fields.
+            raw = {k: v for k, v in msgspec.structs.asdict(data).items() if v is not msgspec.UNSET}
+        # One membership test per key: non-column keys and autoincrement PK values from the client are dropped.
+        allowed = self._payload_key_set()
+        return {k: v for k, v in raw.items() if k in allowed}
+
+    def _payload_field_names(self, schema: type[BaseModel]) -> tuple[str, ...] | None:
+        """
+        Return the non-autoincrement column fields of `schema` (declaration order) that `_schema_payload()` may
+        read directly from an instance's `__dict__`, or None when the dump must go through Pydantic.
 
-        for k in self._autoinc_pk_keys():
-            payload.pop(k, None)  # ignore client input for autoincrement PKs
-        return payload
+        Only schemas whose `model_dump(exclude_unset=True)` is exactly "set fields → stored values" qualify
+        (see `_plain_dump_schema()`). Cached per Repository class and schema type.
+        """
+        cls = type(self)
+        cache: dict[type[BaseModel], tuple[str, ...] | None] | None = cls.__dict__.get('_payload_fields')
+        if cache is None:
+            cache = {}
+            cls._payload_fields = cache
+        if schema in cache:
+            return cache[schema]
+
+        names: tuple[str, ...] | None = None
+        if _plain_dump_schema(schema):
+            allowed = self._payload_key_set()
+            names = tuple(k for k in schema.model_fields if k in allowed)
+        cache[schema] = names
+        return names
+
+    def _payload_is_clean(self, schema: type[BaseModel]) -> bool:
+        """
+        Return True if every key `schema` can dump is a model column and not an autoincrement PK.
+
+        Schemas allowing extra fields or declaring computed fields never qualify. Cached per Repository class
+        and schema type.
+        """
+        cls = type(self)
+        cache: dict[type[BaseModel], bool] | None = cls.__dict__.get('_clean_payload_types')
+        if cache is None:
+            cache = {}
+            cls._clean_payload_types = cache
+        clean = cache.get(schema)
+        if clean is None:
+            clean = (
+                schema.model_config.get('extra') != 'allow'
+                # The computed_fields decorator infos exist on every pydantic 2.x (the class-level
+                # model_computed_fields / __pydantic_computed_fields__ mapping only from 2.10).
+                and not schema.__pydantic_decorators__.computed_fields
+                and schema.model_fields.keys() <= self._payload_key_set()
+            )
+            cache[schema] = clean
+        return clean
 
     def _schema_to_orm(
         self,
@@ -269,16 +600,37 @@ class BaseRepository(Generic[TModel, TSchema]):
         1) If mapper instance exists and `data` matches mapping_schema type → use mapper.to_orm
         2) Otherwise → sanitize via `_schema_payload()` → `self.model(**payload)`
         """
-        try:
+        mapper = self._mapper_instance
+        if mapper is not None:
             schema = self.mapping_schema
-            if self._mapper_instance and schema is not None and isinstance(data, schema):
-                return cast(TModel, self._mapper_instance.to_orm(data))
-        except NotImplementedError:
-            pass
+            if schema is not None and isinstance(data, schema):
+                # BaseMapper's methods are abstract, so every mapper overrides to_orm; an override may still
+                # raise NotImplementedError (per call), so only the call itself is guarded.
+                try:
+                    return cast(TModel, mapper.to_orm(data))
+                except NotImplementedError:
+                    pass
 
         payload = self._schema_payload(cast(BaseModel | Mapping[str, Any], data))
         return self.model(**payload)
 
+    def _schemas_to_orm(
+        self,
+        items: Annotated[Sequence[BaseModel | Mapping[str, Any]], Doc('Batch of schema or mapping inputs.')],
+    ) -> Annotated[builtins.list[TModel], Doc('ORM model instances, in input order.')]:
+        """
+        Batch version of `_schema_to_orm()`.
+
+        Without a mapper (or without `mapping_schema`) every item takes the payload path, so the mapper/schema
+        checks are made once for the batch instead of per item. Per-item input types are still dispatched by
+        `_schema_payload()`, so mixed batches are fine.
+        """
+        if self._mapper_instance is None or self.mapping_schema is None:
+            model = self.model
+            payload = self._schema_payload
+            return [model(**payload(data)) for data in items]
+        return [self._schema_to_orm(data) for data in items]
+
     def _convert(self, row: TModel, *, convert_schema: bool | None = None) -> TSchema | TModel:
         """
         Convert ORM → schema (Pydantic).
@@ -287,21 +639,120 @@ class BaseRepository(Generic[TModel, TSchema]):
         -----
         - If `convert_schema` is None, uses `_default_convert_schema`
         - Conversion happens only when: effective=True and row is not None and `mapping_schema` exists
-        - Mapper(to_schema) first; if not implemented, fall back to Pydantic `model_validate(...)`
-        (from_attributes is enforced via `mapping_schema.model_config`)
+        - Mapper(to_schema) first; if not implemented, fall back to `_row_to_schema()`
+        (Pydantic `model_validate(...)` with from_attributes enforced via `mapping_schema.model_config`,
+        or `msgspec.convert(..., from_attributes=True)` for msgspec.Struct schemas)
         """
         effective = self._default_convert_schema if convert_schema is None else convert_schema
         schema = self.mapping_schema
         if not effective or row is None or schema is None:
             return row
 
-        try:
-            if self._mapper_instance:
-                return cast(TSchema, self._mapper_instance.to_schema(row))
-        except NotImplementedError:
-            pass
+        mapper = self._mapper_instance
+        if mapper is not None:
+            try:
+                return cast(TSchema, mapper.to_schema(row))
+            except NotImplementedError:
+                pass
+
+        return cast(TSchema, self._row_to_schema(row, cast(type[BaseModel], schema)))
+
+    def _trusted_construct_fields(self, schema: type[BaseModel]) -> tuple[str, ...] | None:
+        """
+        Return the schema field names to copy from ORM rows when `model_construct` may be used, else None.
+
+        Auto mode (`trusted_construct=None`) requires:
+        - no field/model validators on the schema (they would be skipped by `model_construct`)
+        - every field is a model column, so each value is a plain DB scalar read from the row
+        - no field annotation that contains a BaseModel (nested models need validation to be built)
+
+        With `trusted_construct=True` only the fields that are model columns are copied; other (optional)
+        fields keep their schema defaults.
+        """
+        names = tuple(schema.model_fields)
+        if self.trusted_construct is not None:
+            if not self.trusted_construct:
+                return None
+            column_keys = self._model_key_sets()[0]
+            return tuple(n for n in names if n in column_keys)
+
+        decorators = schema.__pydantic_decorators__
+        if decorators.validators or decorators.field_validators or decorators.root_validators:
+            return None
+        if decorators.model_validators:
+            return None
+        if not set(names) <= self._model_key_sets()[0]:
+            return None
+        if any(_contains_nested_model(f.annotation) for f in schema.model_fields.values()):
+            return None
+        return names
+
+    def _row_to_schema(self, row: TModel, schema: type[BaseModel]) -> Any:
+        """
+        Convert one ORM row into `schema`.
 
-        return cast(TSchema, cast(type[BaseModel], schema).model_validate(row))
+        Uses `msgspec.convert` for msgspec.Struct schemas, `model_construct` with the row's column values
+        when `_construct_names()` allows it, otherwise Pydantic `model_validate(row)` (from_attributes).
+        """
+        if self._schema_backend == 'msgspec':
+            import msgspec
+
+            return msgspec.convert(row, schema, from_attributes=True)
+
+        names = self._construct_names(schema)
+        if names is None:
+            return schema.model_validate(row)
+        return schema.model_construct(**{k: getattr(row, k) for k in names})
+
+    def _construct_names(self, schema: type[BaseModel]) -> tuple[str, ...] | None:
+        """
+        Return the cached `_trusted_construct_fields()` decision for this Repository class.
+        """
+        cls = type(self)
+        if '_construct_fields' not in cls.__dict__:
+            cls._construct_fields = self._trusted_construct_fields(schema)
+        return cls._construct_fields
+
+    def _convert_many(
+        self, rows: builtins.list[TModel], *, convert_schema: bool | None = None
+    ) -> builtins.list[TSchema] | builtins.list[TModel]:
+        """
+        Convert a list of ORM rows → schemas, with the same rules as `_convert()`.
+
+        Without a mapper (and without `model_construct`), the whole list is validated by one cached
+        `TypeAdapter(list[mapping_schema])` call, so pydantic-core iterates the rows instead of Python.
+        msgspec.Struct schemas are converted the same way with one `msgspec.convert(rows, list[schema])` call.
+        """
+        effective = self._default_convert_schema if convert_schema is None else convert_schema
+        schema = self.mapping_schema
+        if not effective or schema is None:
+            return rows
+
+        schema_t = cast(type[BaseModel], schema)
+        mapper = self._mapper_instance
+        if mapper is not None:
+            # The conversion decision is already made: call to_schema directly and only fall back to the
+            # per-row `_convert()` rules when the mapper does not implement it (for some row).
+            to_schema = mapper.to_schema
+            try:
+                return [cast(TSchema, to_schema(r)) for r in rows]
+            except NotImplementedError:
+                return [cast(TSchema, self._convert(r, convert_schema=True)) for r in rows]
+
+        if self._schema_backend == 'msgspec':
+            import msgspec
+
+            return msgspec.convert(rows, builtins.list[schema_t], from_attributes=True)  # type: ignore[valid-type]
+
+        if self._construct_names(schema_t) is not None:
+            return [cast(TSchema, self._row_to_schema(r, schema_t)) for r in rows]
+
+        cls = type(self)
+        adapter: TypeAdapter[builtins.list[Any]] | None = cls.__dict__.get('_list_adapter')
+        if adapter is None:
+            adapter = TypeAdapter(builtins.list[schema_t])  # type: ignore[valid-type]
+            cls._list_adapter = adapter
+        return cast(builtins.list[TSchema], adapter.validate_python(rows, from_attributes=True))
 
     def list(
         self,
@@ -332,9 +783,38 @@ class BaseRepository(Generic[TModel, TSchema]):
         s = self._resolve_session(session)
         result = await s.execute(stmt)
 
-        scalars: ScalarResult[TModel] = result.scalars()
-        rows: list[TModel] = list(scalars)
-        return [self._convert(r, convert_schema=convert_schema) for r in rows]
+        # One materialization: `.all()` feeds the list straight into `_convert_many()` (returned as-is for ORM).
+        rows = cast(list[TModel], result.scalars().all())
+        return self._convert_many(rows, convert_schema=convert_schema)
+
+    async def iter_execute(
+        self,
+        q_or_stmt: Annotated[QueryOrStmt[TModel], Doc('ListQuery or SQLAlchemy Core statement.')],
+        *,
+        chunk: Annotated[int, Doc('Rows buffered per batch (`yield_per`).')] = 1000,
+        session: Annotated[AsyncSession | None, Doc('Session to use for execution (optional).')] = None,
+        convert_schema: Annotated[bool | None, Doc('Per-call schema conversion flag. None uses default.')] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a `ListQuery` or SQLAlchemy statement and yield results in batches (lists) of at most `chunk` rows.
+
+        - Uses `execution_options(yield_per=chunk)` + `session.stream()`, so only one batch of rows is held in
+          Python memory at a time (`execute()` stays the eager version).
+        - Each batch is converted like `execute()` results (schema/ORM).
+        - The streamed result is closed when iteration ends, fails or the generator is closed early
+          (`aclose()`), releasing the server-side cursor.
+        """
+        if chunk < 1:
+            raise ValueError('chunk must be >= 1.')
+
+        stmt = query_to_stmt(q_or_stmt).execution_options(yield_per=chunk)
+        s = self._resolve_session(session)
+        result = await s.stream(stmt)
+        try:
+            async for partition in result.scalars().partitions():
+                yield self._convert_many(cast(list[TModel], partition), convert_schema=convert_schema)
+        finally:
+            await result.close()
 
     async def get_list(
         self,
@@ -359,7 +839,18 @@ class BaseRepository(Generic[TModel, TSchema]):
         - If `cursor` is provided → keyset(cursor) paging (requires `size`)
         - If `page` and `size` are provided → OFFSET paging
         - If neither is provided → no paging
+
+        Without `cursor`/`order_by` no ListQuery is built: the filtered Select, ordered by the primary key
+        like a ListQuery without `order_by()`, is cached by `_filter_stmt()` (OFFSET/LIMIT applied on top when paging).
         """
+        s = self._resolve_session(session)
+        if cursor is None and not order_by:
+            stmt, params = self._filter_stmt('list', flt)
+            if page is not None and size is not None:
+                stmt = OffsetStrategy.apply(stmt, page=page, size=size)
+            result = await (s.execute(stmt, params) if params else s.execute(stmt))
+            return self._convert_many(cast(list[TModel], result.scalars().all()), convert_schema=convert_schema)
+
         q = ListQuery(self.model, flt=None)
         if flt:
             q.where(flt)
@@ -375,7 +866,6 @@ class BaseRepository(Generic[TModel, TSchema]):
         elif page is not None and size is not None:
             q.paging(page=page, size=size)
 
-        s = self._resolve_session(session)
         return await self.execute(q, session=s, convert_schema=convert_schema)
 
     async def get(
@@ -389,14 +879,10 @@ class BaseRepository(Generic[TModel, TSchema]):
         Get a single row. Returns the first matching row.
         """
         s = self._resolve_session(session)
-        stmt: Select[tuple[TModel]] = select(self.model)
-        crit = flt.where_criteria(self.model)
-        if crit:
-            stmt = stmt.where(*crit)
-
-        res = await s.execute(stmt)
+        stmt, params = self._filter_stmt('get', flt)
+        res = await (s.execute(stmt, params) if params else s.execute(stmt))
         obj = res.scalars().first()
-        return self._convert(obj, convert_schema=convert_schema) if obj else None
+        return self._convert(obj, convert_schema=convert_schema) if obj is not None else None
 
     async def get_or_fail(
         self,
@@ -409,31 +895,41 @@ class BaseRepository(Generic[TModel, TSchema]):
         Get a single row (required). Raises ValueError if not found.
         """
         s = self._resolve_session(session)
-        obj = await self.get(
-            flt,
-            convert_schema=convert_schema,
-            session=s,
-        )
-        if not obj:
+        stmt, params = self._filter_stmt('get', flt)
+        res = await (s.execute(stmt, params) if params else s.execute(stmt))
+        obj = res.scalars().first()
+        if obj is None:
             raise ValueError(f'{self.model.__name__} not found with filter={flt}')
-        return obj
+        return self._convert(obj, convert_schema=convert_schema)
 
     async def count(
         self,
         flt: Annotated[BaseRepoFilter | None, Doc('WHERE filter for aggregation (optional).')] = None,
         *,
+        approximate: Annotated[
+            bool,
+            Doc(
+                'Unfiltered counts on PostgreSQL only: return the planner estimate (`pg_class.reltuples`) '
+                'instead of scanning the table. Ignored otherwise.'
+            ),
+        ] = False,
         session: Annotated[AsyncSession | None, Doc('Session to use for execution (optional).')] = None,
     ) -> Annotated[int, Doc('Number of rows matching the condition.')]:
         """
         Return row count based on the given condition.
+
+        - Counts the primary key column (`count(pk)`), which lets the planner answer from the PK index.
+        - `approximate=True` without a filter on PostgreSQL reads the table statistics instead; if the table
+          has never been analyzed (`reltuples < 0`), the exact count is returned.
         """
         s = self._resolve_session(session)
-        stmt = select(func.count()).select_from(self.model)
-        if flt:
-            crit = flt.where_criteria(self.model)
-            if crit:
-                stmt = stmt.where(*crit)
-        res = await s.execute(stmt)
+        if approximate and flt is None:
+            estimate = await self._approximate_count(s)
+            if estimate is not None:
+                return estimate
+
+        stmt, params = self._filter_stmt('count', flt)
+        res = await (s.execute(stmt, params) if params else s.execute(stmt))
         return res.scalar_one()
 
     async def delete(
@@ -441,14 +937,108 @@ class BaseRepository(Generic[TModel, TSchema]):
         flt: Annotated[BaseRepoFilter, Doc('WHERE filter for delete target.')],
         *,
         session: Annotated[AsyncSession | None, Doc('Session to use for execution (optional).')] = None,
-    ) -> Annotated[int, Doc('Number of deleted rows (rowcount).')]:
+        returning_pks: Annotated[
+            bool,
+            Doc(
+                'If True, return the primary keys of the deleted rows instead of the row count '
+                '(scalars for a single-column PK, tuples for composite PKs).'
+            ),
+        ] = False,
+    ) -> Annotated[int | builtins.list[Any], Doc('Number of deleted rows (rowcount), or their primary keys.')]:
         """
         Delete by condition. Returns affected row count.
+
+        With `returning_pks=True` the deleted primary keys are returned from `DELETE ... RETURNING` in the same
+        round trip; on dialects without it, they are selected with the same criteria right before the DELETE.
         """
         s = self._resolve_session(session)
-        stmt = delete(self.model).where(*flt.where_criteria(self.model))
-        res = await s.execute(stmt)
-        return res.rowcount or 0  # type: ignore[attr-defined]
+        crit = flt.where_criteria(self.model)
+        # Built per call with literal values (not the cached bind-parameter statements): ORM bulk DELETE
+        # synchronizes the session by evaluating the WHERE clause in Python, which cannot see execute-time params.
+        stmt = self._build_filter_stmt('delete', crit)
+        if not returning_pks:
+            res = await s.execute(stmt)
+            return res.rowcount or 0  # type: ignore[attr-defined]
+
+        pk_cols = tuple(self.sa_mapper.primary_key)
+        if self._supports_returning(s, executemany=False, kind='delete'):
+            rows = (await s.execute(stmt.returning(*pk_cols))).all()
+        else:
+            pk_stmt = select(*pk_cols)
+            rows = (await s.execute(pk_stmt.where(*crit) if crit else pk_stmt)).all()
+            await s.execute(stmt)
+        if len(pk_cols) == 1:
+            return [r[0] for r in rows]
+        return [tuple(r) for r in rows]
+
+    def _filter_stmt(
+        self, kind: Literal['get', 'list', 'count'], flt: BaseRepoFilter | None
+    ) -> tuple[Any, dict[str, Any]]:
+        """
+        Return `(statement, bind params)` for a filtered get/list/count.
+
+        Statements are built from `flt.where_template()` with bind parameters and cached per Repository class,
+        keyed by kind, filter class and `where_params()` shape, so repeated calls with the same filter shape
+        reuse one statement object (and its memoized SQL cache key) and only bind new values.
+        Filters overriding `where_criteria()`, or holding SQL expression values, are built from their
+        criteria on every call.
+        """
+        if flt is not None and type(flt).where_criteria is not BaseRepoFilter.where_criteria:
+            return self._build_filter_stmt(kind, flt.where_criteria(self.model)), {}
+
+        shape: tuple[Any, ...] | None = ()
+        params: dict[str, Any] = {}
+        if flt is not None:
+            shape, params = flt.where_params(self.model)
+            if shape is None:
+                return self._build_filter_stmt(kind, flt.where_criteria(self.model)), {}
+
+        cls = type(self)
+        cache: dict[tuple[Any, ...], Any] | None = cls.__dict__.get('_filter_stmts')
+        if cache is None:
+            cache = {}
+            cls._filter_stmts = cache
+
+        key = (kind, type(flt), shape)
+        stmt = cache.get(key)
+        if stmt is None:
+            crit = type(flt).where_template(self.model, shape) if flt is not None else []
+            stmt = self._build_filter_stmt(kind, crit)
+            cache[key] = stmt
+        return stmt, params
+
+    async def _approximate_count(self, session: AsyncSession) -> int | None:
+        """
+        Return the PostgreSQL planner row estimate for the model's table, or None when unavailable
+        (other dialects, or statistics not collected yet).
+        """
+        try:
+            dialect = session.get_bind().dialect
+        except Exception:
+            return None
+        if dialect.name != 'postgresql':
+            return None
+
+        rel = dialect.identifier_preparer.format_table(self.sa_mapper.local_table)
+        res = await session.execute(_PG_RELTUPLES, {'rel': rel})
+        estimate = res.scalar_one()
+        if estimate < 0:
+            return None
+        return int(estimate)
+
+    def _build_filter_stmt(self, kind: Literal['get', 'list', 'count', 'delete'], crit: builtins.list[Any]) -> Any:
+        if kind == 'get':
+            stmt: Any = select(self.model)
+        elif kind == 'list':
+            # Default primary-key ordering, as ListQuery applies without order_by(): keeps OFFSET pages stable.
+            stmt = select(self.model).order_by(*OrderByStrategy.apply(self.model, None))
+        elif kind == 'count':
+            # count(pk) over the (non-null) primary key: same result as count(*), index-only friendly.
+            pk_col = next(iter(self.sa_mapper.primary_key))
+            stmt = select(func.count(pk_col)).select_from(self.model)
+        else:
+            stmt = delete(self.model)
+        return stmt.where(*crit) if crit else stmt
 
     def add(
         self,
@@ -489,9 +1079,22 @@ class BaseRepository(Generic[TModel, TSchema]):
         - For Pydantic schema input, validation is handled by Pydantic
         - Autoincrement PK values from the client are ignored
         - Return type is schema/ORM depending on configuration
+        - When the result is converted to schema, no mapper is configured and the dialect supports RETURNING,
+          the row is inserted with a Core `INSERT ... RETURNING` (no ORM unit-of-work flush) and the schema is
+          built from the returned row. ORM results always use the session add + flush path, and so do models
+          with `@validates` validators, insert listeners, a custom constructor or a `version_id_col`, and schemas
+          with fields that are not model columns (e.g. properties), which a Core row cannot provide.
+          As in a flush, a None value does not override a column default.
         """
         s = self._resolve_session(session)
 
+        effective = self._default_convert_schema if convert_schema is None else convert_schema
+        if effective and self.mapping_schema is not None and self._mapper_instance is None:
+            stmt = self._insert_returning_stmt()
+            if stmt is not None and self._supports_returning(s, executemany=False):
+                row = await self._core_insert_one(self._schema_payload(data), stmt, s)
+                return self._row_to_schema(row, cast(type[BaseModel], self.mapping_schema))
+
         obj = self._schema_to_orm(data)
         self.add(obj, session=s)
         await s.flush()
@@ -512,15 +1115,217 @@ class BaseRepository(Generic[TModel, TSchema]):
 
         - Same rule applies: autoincrement PK values from the client are ignored for each item
         - If skip_convert=True, returns ORM objects without conversion
+        - Batches of at least `bulk_insert_threshold` items go through `create_many_core()` when no mapper
+          is configured, the model has no ORM insert hooks (see `_has_no_insert_hooks()`) and the dialect
+          supports executemany RETURNING
         """
-        objs = [self._schema_to_orm(data) for data in items]
         s = self._resolve_session(session)
+        threshold = self.bulk_insert_threshold
+        if (
+            threshold is not None
+            and len(items) >= threshold
+            and self._mapper_instance is None
+            and self._has_no_insert_hooks()
+            and self._supports_returning(s, executemany=True)
+        ):
+            return await self.create_many_core(
+                items, convert_schema=convert_schema, session=s, skip_convert=skip_convert
+            )
+
+        objs = self._schemas_to_orm(items)
         self.add_all(objs, session=s)
         await s.flush()
 
         if skip_convert:
             return objs
-        return [self._convert(o, convert_schema=convert_schema) for o in objs]
+        return self._convert_many(objs, convert_schema=convert_schema)
+
+    async def create_many_core(
+        self,
+        items: Annotated[
+            Sequence[BaseModel | Mapping[str, Any]], Doc('Batch create input (each item is schema or dict).')
+        ],
+        *,
+        chunk: Annotated[int, Doc('Maximum number of rows sent per INSERT statement execution.')] = 1000,
+        convert_schema: Annotated[bool | None, Doc('Per-call schema conversion flag.')] = None,
+        session: Annotated[AsyncSession | None, Doc('Session to use for execution (optional).')] = None,
+        skip_convert: Annotated[bool, Doc('If True, skip schema conversion and return ORM objects as-is.')] = False,
+    ) -> Annotated[builtins.list[Any], Doc('Created objects list (schema/ORM), in input order.')]:
+        """
+        Create multiple rows with ORM bulk `INSERT ... RETURNING` (no unit-of-work flush per instance).
+
+        Notes
+        -----
+        - Items are sanitized with `_schema_payload()` (columns only, autoincrement PK dropped); the mapper's
+          `to_orm` and ORM `before_insert`/`after_insert` events are not used.
+        - Rows are returned as ORM objects in input order (`sort_by_parameter_order=True`) and then converted.
+        - Falls back to `create_many()`'s ORM path when the dialect has no executemany RETURNING.
+        """
+        if chunk < 1:
+            raise ValueError('chunk must be >= 1.')
+
+        s = self._resolve_session(session)
+        if not self._supports_returning(s, executemany=True):
+            objs = self._schemas_to_orm(items)
+            self.add_all(objs, session=s)
+            await s.flush()
+        else:
+            payloads = [self._schema_payload(data) for data in items]
+            # One statement object per class: its cache key is memoized, so repeated batches skip regenerating it.
+            cls = type(self)
+            stmt: Insert | None = cls.__dict__.get('_bulk_insert_stmt')
+            if stmt is None:
+                stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+                cls._bulk_insert_stmt = stmt
+            objs = []
+            for start in range(0, len(payloads), chunk):
+                result = await s.execute(stmt, payloads[start : start + chunk])
+                objs.extend(result.scalars())
+
+        if skip_convert:
+            return objs
+        return self._convert_many(objs, convert_schema=convert_schema)
+
+    async def create_many_copy(
+        self,
+        items: Annotated[
+            Sequence[BaseModel | Mapping[str, Any]], Doc('Batch create input (each item is schema or dict).')
+        ],
+        *,
+        session: Annotated[AsyncSession | None, Doc('Session to use for execution (optional).')] = None,
+    ) -> Annotated[int, Doc('Number of inserted rows.')]:
+        """
+        Bulk-load rows with PostgreSQL `COPY` (asyncpg `copy_records_to_table`) for ETL-style batches.
+
+        Notes
+        -----
+        - Opt-in and write-only: nothing is returned except the row count, and no ORM objects are created.
+        - Items are sanitized with `_schema_payload()`; every non-autoincrement-PK column is copied, so keys
+          missing from an item are written as NULL (column defaults are not applied by COPY).
+        - Uses COPY only on the asyncpg driver and for at least `copy_threshold` items; otherwise the payloads
+          are sent as one bulk INSERT executemany.
+        """
+        s = self._resolve_session(session)
+        payloads = [self._schema_payload(data) for data in items]
+        if not payloads:
+            return 0
+
+        if len(payloads) < self.copy_threshold or s.get_bind().dialect.driver != 'asyncpg':
+            await s.execute(insert(self.model), payloads)
+            return len(payloads)
+
+        cls = type(self)
+        columns: tuple[tuple[str, str], ...] | None = cls.__dict__.get('_copy_columns')
+        if columns is None:
+            autoinc = self._autoinc_pk_keys()
+            columns = tuple((key, col.name) for key, col in self.sa_mapper.columns.items() if key not in autoinc)
+            cls._copy_columns = columns
+        records = [tuple(p.get(key) for key, _ in columns) for p in payloads]
+        table = self.sa_mapper.local_table
+
+        conn = await s.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[name for _, name in columns],
+            schema_name=table.schema,
+        )
+        return len(records)
+
+    @staticmethod
+    def _supports_returning(
+        session: AsyncSession, *, executemany: bool, kind: Literal['insert', 'delete'] = 'insert'
+    ) -> bool:
+        """
+        Return True if the session's bind dialect supports `INSERT ... RETURNING`
+        (for executemany when `executemany=True`), or `DELETE ... RETURNING` with `kind='delete'`.
+        """
+        try:
+            dialect = session.get_bind().dialect
+        except Exception:
+            return False
+        flag = f'{kind}_executemany_returning' if executemany else f'{kind}_returning'
+        return bool(getattr(dialect, flag, False))
+
+    def _insert_returning_stmt(self) -> Insert | None:
+        """
+        Return the cached Core `INSERT ... RETURNING <all columns>` statement used by `_core_insert_one()`,
+        or None when the model cannot use it.
+
+        Built once per Repository class. Only single-table models whose attribute keys equal their Column
+        keys qualify, so `_schema_payload()` output can be bound as-is and returned rows expose attribute names.
+        The model must also have no ORM insert hooks (`_has_no_insert_hooks()`) and no `version_id_col`
+        (the ORM sets the version counter on flush), and every `mapping_schema` field must be a column,
+        since the schema is built from the returned row.
+        """
+        cls = type(self)
+        if '_insert_returning' not in cls.__dict__:
+            mapper = self.sa_mapper
+            # Typed as FromClause; for the single-table models accepted below it is the model's Table.
+            table = cast(Table, mapper.local_table)
+            columns = builtins.list(mapper.columns.items())
+            stmt: Insert | None = None
+            if (
+                all(col.table is table and col.key == key for key, col in columns)
+                and mapper.version_id_col is None
+                and self._has_no_insert_hooks()
+                and self._schema_field_names() <= self._model_key_sets()[0]
+            ):
+                stmt = insert(table).returning(*(col.label(key) for key, col in columns))
+            # Like ORM persistence, a None value does not override a column default (unless the type evaluates None).
+            cls._insert_defaulted = frozenset(
+                key
+                for key, col in columns
+                if (col.default is not None or col.server_default is not None) and not col.type.should_evaluate_none
+            )
+            cls._insert_returning = stmt
+        return cls._insert_returning
+
+    def _has_no_insert_hooks(self) -> bool:
+        """
+        Return True if inserting a payload with an INSERT statement stores the same row as constructing the model
+        and flushing it: no `@validates` validators, no mapper `before_insert`/`after_insert` listeners
+        and the registry's default constructor.
+
+        Cached per Repository class, so listeners registered after the first insert are not taken into account.
+        """
+        cls = type(self)
+        plain: bool | None = cls.__dict__.get('_plain_insert')
+        if plain is None:
+            mapper = self.sa_mapper
+            plain = (
+                not mapper.validators
+                and not mapper.dispatch.before_insert
+                and not mapper.dispatch.after_insert
+                and mapper.class_manager.original_init is mapper.registry.constructor
+            )
+            cls._plain_insert = plain
+        return plain
+
+    def _schema_field_names(self) -> frozenset[str]:
+        """
+        Return the field names of `mapping_schema` (Pydantic fields or msgspec.Struct fields).
+        """
+        schema = self.mapping_schema
+        if schema is None:
+            return frozenset()
+        if self._schema_backend == 'msgspec':
+            import msgspec
+
+            return frozenset(f.name for f in msgspec.structs.fields(cast('type[msgspec.Struct]', schema)))
+        return frozenset(schema.model_fields)
+
+    async def _core_insert_one(self, payload: Mapping[str, Any], stmt: Insert, session: AsyncSession) -> Any:
+        """
+        Insert one sanitized payload with a Core `INSERT ... RETURNING` and return the new row.
+
+        None values for columns with a default are left out, so the default applies as in an ORM flush.
+        """
+        defaulted = type(self)._insert_defaulted
+        params = {k: v for k, v in payload.items() if v is not None or k not in defaulted}
+        result = await session.execute(stmt, params)
+        return result.one()
 
     async def create_from_model(
         self,
@@ -570,6 +1375,115 @@ class BaseRepository(Generic[TModel, TSchema]):
         res = await s.execute(stmt)
         return res.rowcount or 0  # type: ignore[attr-defined]
 
+    async def update_many(
+        self,
+        rows: Annotated[
+            Sequence[BaseModel | Mapping[str, Any]],
+            Doc('Per-row values (schema or dict); each item must carry every primary key attribute.'),
+        ],
+        *,
+        session: Annotated[AsyncSession | None, Doc('Session to use for execution (optional).')] = None,
+    ) -> Annotated[int, Doc('Number of rows matched by primary key.')]:
+        """
+        Update many rows by primary key with a Core UPDATE (executemany), without loading them.
+
+        Rules
+        -----
+        - Values are sanitized via `_schema_payload()`; primary key values are read from each item and used only
+          in the WHERE clause
+        - Raises ValueError if an item has no value for a primary key attribute
+        - Returns the number of rows matched: primary keys without a row are not counted. On drivers without
+          reliable executemany rowcounts (`supports_sane_multi_rowcount`, e.g. asyncpg) items are executed one by
+          one to count them
+        - Items with no value besides the primary key are skipped
+        - Objects already loaded in the session are not refreshed
+        - Models mapped to several tables fall back to an ORM bulk UPDATE, which raises `StaleDataError` for
+          unknown primary keys where the driver reports rowcounts; the number of items is returned in that case
+        """
+        pk_keys = self._pk_keys()
+        groups: dict[frozenset[str], builtins.list[dict[str, Any]]] = {}
+        payloads: builtins.list[dict[str, Any]] = []
+        for row in rows:
+            payload = self._schema_payload(row)
+            for key in pk_keys:
+                value = row.get(key) if isinstance(row, Mapping) else getattr(row, key, None)
+                if value is None:
+                    raise ValueError(f'update_many requires primary key {key!r} in every item.')
+                payload[key] = value
+            payloads.append(payload)
+            groups.setdefault(frozenset(payload), []).append(payload)
+
+        if not payloads:
+            return 0
+
+        s = self._resolve_session(session)
+        built: builtins.list[tuple[tuple[Update, tuple[tuple[str, str], ...]], builtins.list[dict[str, Any]]]] = []
+        for keys, group in groups.items():
+            entry = self._update_by_pk_stmt(keys)
+            if entry is None:
+                # Multi-table model: let the ORM bulk UPDATE split the values per table.
+                await s.execute(sa_update(self.model), payloads)
+                return len(payloads)
+            built.append((entry, group))
+
+        try:
+            multi_rowcount = s.get_bind().dialect.supports_sane_multi_rowcount
+        except Exception:
+            multi_rowcount = False
+
+        matched = 0
+        for (stmt, binds), group in built:
+            if not binds:
+                continue
+            params = [{name: payload[key] for key, name in binds} for payload in group]
+            for batch in [params] if multi_rowcount else [[p] for p in params]:
+                res = await s.execute(stmt, batch)
+                matched += res.rowcount or 0  # type: ignore[attr-defined]
+        return matched
+
+    def _update_by_pk_stmt(self, keys: frozenset[str]) -> tuple[Update, tuple[tuple[str, str], ...]] | None:
+        """
+        Return the cached Core `UPDATE ... WHERE <pk> = :pk` statement for payloads with `keys`, together with
+        its (attribute key, bind name) pairs, or None when the model is mapped to more than one table.
+
+        Bind names are prefixed so they never clash with the column names SQLAlchemy reserves for the SET clause.
+        The pairs are empty when the payload carries nothing besides the primary key.
+        """
+        cls = type(self)
+        cache: dict[frozenset[str], tuple[Update, tuple[tuple[str, str], ...]] | None] | None = cls.__dict__.get(
+            '_update_stmts'
+        )
+        if cache is None:
+            cache = {}
+            cls._update_stmts = cache
+
+        if keys in cache:
+            return cache[keys]
+
+        mapper = self.sa_mapper
+        # Typed as FromClause; for the single-table models accepted below it is the model's Table.
+        table = cast(Table, mapper.local_table)
+        entry: tuple[Update, tuple[tuple[str, str], ...]] | None = None
+        if all(col.table is table for col in mapper.columns):
+            pk_keys = self._pk_keys()
+
+            def bind_name(key: str) -> str:
+                name = f'b_{key}'
+                while name in table.c:
+                    name = f'_{name}'
+                return name
+
+            set_keys = sorted(keys.difference(pk_keys))
+            stmt = sa_update(table).where(*(mapper.columns[key] == bindparam(bind_name(key)) for key in pk_keys))
+            if set_keys:
+                stmt = stmt.values({mapper.columns[key]: bindparam(bind_name(key)) for key in set_keys})
+                binds = tuple((key, bind_name(key)) for key in (*pk_keys, *set_keys))
+            else:
+                binds = ()
+            entry = (stmt, binds)
+        cache[keys] = entry
+        return entry
+
     async def update_from_model(
         self,
         base: Annotated[TModel, Doc('A persistent ORM object in the session (Dirty Checking target).')],
@@ -596,3 +1510,49 @@ class BaseRepository(Generic[TModel, TSchema]):
         s = self._resolve_session(session)
         await s.flush()
         return self._convert(base, convert_schema=convert_schema)
+
+
+def _contains_nested_model(annotation: Any) -> bool:
+    """
+    Return True if a field annotation is, or contains (e.g. `list[Item] | None`), a Pydantic BaseModel or dataclass.
+    """
+    if isinstance(annotation, type) and (issubclass(annotation, BaseModel) or is_dataclass(annotation)):
+        return True
+    return any(_contains_nested_model(arg) for arg in get_args(annotation))
+
+
+def _contains_serializer(annotation: Any) -> bool:
+    """
+    Return True if a field annotation carries, at any depth (e.g. `list[Annotated[int, PlainSerializer(...)]]`),
+    an `Annotated` PlainSerializer/WrapSerializer.
+    """
+    if isinstance(annotation, (PlainSerializer, WrapSerializer)):
+        return True
+    return any(_contains_serializer(arg) for arg in get_args(annotation))
+
+
+def _plain_dump_schema(schema: type[BaseModel]) -> bool:
+    """
+    Return True if `model_dump(exclude_unset=True)` of `schema` equals `{name: __dict__[name] for set fields}`.
+
+    Rules out anything that reshapes the dump: an overridden `model_dump`, RootModel, extra fields,
+    alias keys (`serialize_by_alias`), serializers (decorators or `Annotated`), computed fields,
+    excluded fields and nested models/dataclasses (dumped as dicts).
+    """
+    if schema.model_dump is not BaseModel.model_dump or schema.__pydantic_root_model__:
+        return False
+    config = schema.model_config
+    if config.get('extra') == 'allow' or config.get('serialize_by_alias'):
+        return False
+    decorators = schema.__pydantic_decorators__
+    if decorators.computed_fields or decorators.field_serializers or decorators.model_serializers:
+        return False
+    return not any(
+        f.exclude
+        # exclude_if only exists on pydantic >= 2.12
+        or getattr(f, 'exclude_if', None) is not None
+        or _contains_nested_model(f.annotation)
+        or _contains_serializer(f.annotation)
+        or any(_contains_serializer(m) for m in f.metadata)
+        for f in schema.model_fields.values()
+    )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import builtins
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Mapping, Sequence
 from typing import Any, Generic, Literal, overload
 
-from pydantic import BaseModel
+import msgspec
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Insert, Update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapper
 
@@ -25,6 +27,29 @@ class BaseRepository(Generic[TModel, TSchema]):
     filter_class: type[BaseRepoFilter]
     mapper: type[BaseMapper] | None
     _default_convert_schema: bool
+    _schema_backend: Literal['pydantic', 'msgspec']
+    trusted_construct: bool | None
+    bulk_insert_threshold: int | None
+    copy_threshold: int
+    _sa_mapper: Mapper[Any]
+    _column_keys: frozenset[str]
+    _autoinc_pk: frozenset[str]
+    _payload_keys: frozenset[str]
+    _session_warned: set[str]
+    _pk_attr_keys: tuple[str, ...]
+    _required_fields: frozenset[str]
+    _required_schema: type[BaseModel]
+    _clean_payload_types: dict[type[BaseModel], bool]
+    _payload_fields: dict[type[BaseModel], tuple[str, ...] | None]
+    _construct_fields: tuple[str, ...] | None
+    _insert_returning: Insert | None
+    _insert_defaulted: frozenset[str]
+    _plain_insert: bool
+    _bulk_insert_stmt: Insert
+    _update_stmts: dict[frozenset[str], tuple[Update, tuple[tuple[str, str], ...]] | None]
+    _filter_stmts: dict[tuple[Any, ...], Any]
+    _list_adapter: TypeAdapter[builtins.list[Any]]
+    _copy_columns: tuple[tuple[str, str], ...]
 
     # =========================
     # instance attributes
@@ -59,9 +84,21 @@ class BaseRepository(Generic[TModel, TSchema]):
     # =========================
     def _validate_mapper_integrity(self, mapper_instance: BaseMapper) -> None: ...
     def _validate_schema_against_model(self, schema: type[BaseModel]) -> None: ...
-    def _autoinc_pk_keys(self) -> set[str]: ...
-    def _schema_payload(self, data: BaseModel | Mapping[str, Any]) -> dict[str, Any]: ...
+    def _model_key_sets(self) -> tuple[frozenset[str], frozenset[str]]: ...
+    def _payload_key_set(self) -> frozenset[str]: ...
+    def _autoinc_pk_keys(self) -> frozenset[str]: ...
+    def _pk_keys(self) -> tuple[str, ...]: ...
+    def _schema_payload(self, data: BaseModel | Mapping[str, Any] | msgspec.Struct) -> dict[str, Any]: ...
+    def _payload_field_names(self, schema: type[BaseModel]) -> tuple[str, ...] | None: ...
+    def _payload_is_clean(self, schema: type[BaseModel]) -> bool: ...
     def _schema_to_orm(self, data: BaseModel | Mapping[str, Any]) -> TModel: ...
+    def _schemas_to_orm(self, items: Sequence[BaseModel | Mapping[str, Any]]) -> builtins.list[TModel]: ...
+    def _trusted_construct_fields(self, schema: type[BaseModel]) -> tuple[str, ...] | None: ...
+    def _row_to_schema(self, row: TModel, schema: type[BaseModel]) -> Any: ...
+    def _construct_names(self, schema: type[BaseModel]) -> tuple[str, ...] | None: ...
+    def _convert_many(
+        self, rows: builtins.list[TModel], *, convert_schema: bool | None = None
+    ) -> builtins.list[TSchema] | builtins.list[TModel]: ...
     @overload
     def _convert(
         self: BaseRepository[TModel, NoSchema],
@@ -147,6 +184,55 @@ class BaseRepository(Generic[TModel, TSchema]):
         convert_schema: bool,
     ) -> builtins.list[TModel] | builtins.list[TPydanticSchema]: ...
 
+    # =========================
+    # iter_execute
+    # =========================
+    @overload
+    def iter_execute(
+        self: BaseRepository[TModel, NoSchema],
+        q_or_stmt: QueryOrStmt[TModel],
+        *,
+        chunk: int = ...,
+        session: AsyncSession | None = ...,
+        convert_schema: bool | None = ...,
+    ) -> AsyncIterator[builtins.list[TModel]]: ...
+    @overload
+    def iter_execute(
+        self: BaseRepository[TModel, TPydanticSchema],
+        q_or_stmt: QueryOrStmt[TModel],
+        *,
+        chunk: int = ...,
+        session: AsyncSession | None = ...,
+        convert_schema: None = ...,
+    ) -> AsyncIterator[builtins.list[TPydanticSchema]]: ...
+    @overload
+    def iter_execute(
+        self: BaseRepository[TModel, TPydanticSchema],
+        q_or_stmt: QueryOrStmt[TModel],
+        *,
+        chunk: int = ...,
+        session: AsyncSession | None = ...,
+        convert_schema: Literal[False],
+    ) -> AsyncIterator[builtins.list[TModel]]: ...
+    @overload
+    def iter_execute(
+        self: BaseRepository[TModel, TPydanticSchema],
+        q_or_stmt: QueryOrStmt[TModel],
+        *,
+        chunk: int = ...,
+        session: AsyncSession | None = ...,
+        convert_schema: Literal[True],
+    ) -> AsyncIterator[builtins.list[TPydanticSchema]]: ...
+    @overload
+    def iter_execute(
+        self: BaseRepository[TModel, TPydanticSchema],
+        q_or_stmt: QueryOrStmt[TModel],
+        *,
+        chunk: int = ...,
+        session: AsyncSession | None = ...,
+        convert_schema: bool,
+    ) -> AsyncIterator[builtins.list[TModel] | builtins.list[TPydanticSchema]]: ...
+
     # =========================
     # get_list (existing overloads)
     # =========================
@@ -302,8 +388,22 @@ class BaseRepository(Generic[TModel, TSchema]):
     # =========================
     # count, delete
     # =========================
-    async def count(self, flt: BaseRepoFilter | None = ..., *, session: AsyncSession | None = ...) -> int: ...
-    async def delete(self, flt: BaseRepoFilter, *, session: AsyncSession | None = ...) -> int: ...
+    async def count(
+        self, flt: BaseRepoFilter | None = ..., *, approximate: bool = ..., session: AsyncSession | None = ...
+    ) -> int: ...
+    @overload
+    async def delete(
+        self, flt: BaseRepoFilter, *, session: AsyncSession | None = ..., returning_pks: Literal[False] = ...
+    ) -> int: ...
+    @overload
+    async def delete(
+        self, flt: BaseRepoFilter, *, session: AsyncSession | None = ..., returning_pks: Literal[True]
+    ) -> builtins.list[Any]: ...
+    def _filter_stmt(
+        self, kind: Literal['get', 'list', 'count'], flt: BaseRepoFilter | None
+    ) -> tuple[Any, dict[str, Any]]: ...
+    async def _approximate_count(self, session: AsyncSession) -> int | None: ...
+    def _build_filter_stmt(self, kind: Literal['get', 'list', 'count', 'delete'], crit: builtins.list[Any]) -> Any: ...
 
     # =========================
     # add, add_all
@@ -413,6 +513,84 @@ class BaseRepository(Generic[TModel, TSchema]):
         skip_convert: Literal[False] = ...,
     ) -> builtins.list[TModel] | builtins.list[TPydanticSchema]: ...
 
+    # =========================
+    # create_many_core
+    # =========================
+    @overload
+    async def create_many_core(
+        self: BaseRepository[TModel, NoSchema],
+        items: Sequence[BaseModel | Mapping[str, Any]],
+        *,
+        chunk: int = ...,
+        convert_schema: bool | None = ...,
+        session: AsyncSession | None = ...,
+        skip_convert: bool = ...,
+    ) -> builtins.list[TModel]: ...
+    @overload
+    async def create_many_core(
+        self: BaseRepository[TModel, TPydanticSchema],
+        items: Sequence[BaseModel | Mapping[str, Any]],
+        *,
+        chunk: int = ...,
+        convert_schema: bool | None = ...,
+        session: AsyncSession | None = ...,
+        skip_convert: Literal[True],
+    ) -> builtins.list[TModel]: ...
+    @overload
+    async def create_many_core(
+        self: BaseRepository[TModel, TPydanticSchema],
+        items: Sequence[BaseModel | Mapping[str, Any]],
+        *,
+        chunk: int = ...,
+        convert_schema: None = ...,
+        session: AsyncSession | None = ...,
+        skip_convert: Literal[False] = ...,
+    ) -> builtins.list[TPydanticSchema]: ...
+    @overload
+    async def create_many_core(
+        self: BaseRepository[TModel, TPydanticSchema],
+        items: Sequence[BaseModel | Mapping[str, Any]],
+        *,
+        chunk: int = ...,
+        convert_schema: Literal[False],
+        session: AsyncSession | None = ...,
+        skip_convert: Literal[False] = ...,
+    ) -> builtins.list[TModel]: ...
+    @overload
+    async def create_many_core(
+        self: BaseRepository[TModel, TPydanticSchema],
+        items: Sequence[BaseModel | Mapping[str, Any]],
+        *,
+        chunk: int = ...,
+        convert_schema: Literal[True],
+        session: AsyncSession | None = ...,
+        skip_convert: Literal[False] = ...,
+    ) -> builtins.list[TPydanticSchema]: ...
+    @overload
+    async def create_many_core(
+        self: BaseRepository[TModel, TPydanticSchema],
+        items: Sequence[BaseModel | Mapping[str, Any]],
+        *,
+        chunk: int = ...,
+        convert_schema: bool,
+        session: AsyncSession | None = ...,
+        skip_convert: Literal[False] = ...,
+    ) -> builtins.list[TModel] | builtins.list[TPydanticSchema]: ...
+    async def create_many_copy(
+        self,
+        items: Sequence[BaseModel | Mapping[str, Any]],
+        *,
+        session: AsyncSession | None = ...,
+    ) -> int: ...
+    @staticmethod
+    def _supports_returning(
+        session: AsyncSession, *, executemany: bool, kind: Literal['insert', 'delete'] = ...
+    ) -> bool: ...
+    def _insert_returning_stmt(self) -> Insert | None: ...
+    def _has_no_insert_hooks(self) -> bool: ...
+    def _schema_field_names(self) -> frozenset[str]: ...
+    async def _core_insert_one(self, payload: Mapping[str, Any], stmt: Insert, session: AsyncSession) -> Any: ...
+
     # =========================
     # create_from_model
     # =========================
@@ -467,6 +645,17 @@ class BaseRepository(Generic[TModel, TSchema]):
         session: AsyncSession | None = ...,
     ) -> int: ...
 
+    # =========================
+    # update_many
+    # =========================
+    async def update_many(
+        self,
+        rows: Sequence[BaseModel | Mapping[str, Any]],
+        *,
+        session: AsyncSession | None = ...,
+    ) -> int: ...
+    def _update_by_pk_stmt(self, keys: frozenset[str]) -> tuple[Update, tuple[tuple[str, str], ...]] | None: ...
+
     # =========================
     # update_from_model (dirty checking)
     # =========================
@@ -1,11 +1,23 @@
+import weakref
 from typing import Any, cast
 
 from sqlalchemy import ColumnElement, UnaryExpression, inspect
 from sqlalchemy.orm import Mapper
 
+# model class -> weak reference to its Mapper. A mapped class has exactly one Mapper for its lifetime, so the
+# lookup can be memoized; both sides are weak (the Mapper references its class), so classes created at runtime,
+# e.g. in tests, are not kept alive by this cache.
+_MAPPERS: weakref.WeakKeyDictionary[type[Any], weakref.ref[Mapper[Any]]] = weakref.WeakKeyDictionary()
+
 
 def sa_mapper(model: type[Any]) -> Mapper[Any]:
-    return cast(Mapper[Any], inspect(model))
+    # Unmapped classes raise NoInspectionAvailable from inspect() and are not cached.
+    ref = _MAPPERS.get(model)
+    mapper = ref() if ref is not None else None
+    if mapper is None:
+        mapper = cast(Mapper[Any], inspect(model))
+        _MAPPERS[model] = weakref.ref(mapper)
+    return mapper
 
 
 def peel_unary(expr: ColumnElement[Any]) -> ColumnElement[Any]:
@@ -1,7 +1,112 @@
-from typing import Protocol
+from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Protocol, runtime_checkable
 
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+
+@runtime_checkable
 class SessionProvider(Protocol):
     def get_session(self) -> AsyncSession: ...
+
+
+class ContextSessionProvider:
+    """
+    SessionProvider that reuses one `AsyncSession` per asyncio task (context variable),
+    created from an `async_sessionmaker`.
+
+    Every repository call made in the same task shares that session instead of opening a new one,
+    and connections come from the engine's pool. A task that calls `get_session()` first gets its own session;
+    tasks spawned after a session was opened inherit it (context variables are copied at task creation),
+    so open a `scope()` inside such tasks when they run concurrently.
+
+    Lifecycle
+    ---------
+    - Wrap a unit of work (e.g. one request) in `async with provider.scope():` to open a fresh session
+      and close it at the end, or
+    - call `await provider.close()` when the task's work is done.
+
+    Usage:
+        provider = ContextSessionProvider(async_sessionmaker(engine, expire_on_commit=False))
+        BaseRepository.configure_session_provider(provider)
+
+        async with provider.scope() as session:
+            users = await repo.get_list()
+            await session.commit()
+    """
+
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+        self._sessionmaker = sessionmaker
+        self._current: ContextVar[AsyncSession | None] = ContextVar(f'session_{id(self)}', default=None)
+
+    @property
+    def engine(self) -> AsyncEngine | None:
+        """The engine the sessionmaker binds sessions to (None if it has no fixed bind)."""
+        return self._sessionmaker.kw.get('bind')
+
+    def get_session(self) -> AsyncSession:
+        session = self._current.get()
+        if session is None:
+            session = self._sessionmaker()
+            self._current.set(session)
+        return session
+
+    async def close(self) -> None:
+        """
+        Close the current task's session (if any); the next `get_session()` opens a new one.
+        """
+        session = self._current.get()
+        if session is not None:
+            self._current.set(None)
+            await session.close()
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open a fresh session for the enclosed block and close it on exit, restoring the previous one.
+        """
+        session = self._sessionmaker()
+        token = self._current.set(session)
+        try:
+            yield session
+        finally:
+            self._current.reset(token)
+            await session.close()
+
+
+def create_asyncpg_provider(
+    url: str | URL,
+    *,
+    stmt_cache: int = 500,
+    compiled_cache_size: int = 2000,
+    **engine_kwargs: Any,
+) -> ContextSessionProvider:
+    """
+    Build a `ContextSessionProvider` over a new `postgresql+asyncpg` engine tuned for CRUD-heavy workloads.
+
+    - `stmt_cache`: asyncpg prepared statement cache size per connection (`prepared_statement_cache_size`,
+      driver default 100).
+    - `compiled_cache_size`: SQLAlchemy compiled statement cache size (`query_cache_size`, default 500).
+    - Other keyword arguments are passed to `create_async_engine()` (pool size, echo, ...).
+
+    Sessions are created with `expire_on_commit=False`; dispose `provider.engine` on shutdown.
+
+    Raises
+    ------
+    ValueError
+        If the URL does not use the asyncpg driver.
+    """
+    engine_url = _asyncpg_url(url, stmt_cache)
+    engine = create_async_engine(engine_url, query_cache_size=compiled_cache_size, **engine_kwargs)
+    return ContextSessionProvider(async_sessionmaker(engine, expire_on_commit=False))
+
+
+def _asyncpg_url(url: str | URL, stmt_cache: int) -> URL:
+    parsed = make_url(url)
+    if parsed.get_driver_name() != 'asyncpg':
+        raise ValueError(f'create_asyncpg_provider() requires a postgresql+asyncpg URL, got {parsed.drivername!r}.')
+    return parsed.update_query_dict({'prepared_statement_cache_size': str(stmt_cache)})
@@ -7,13 +7,19 @@ F = TypeVar('F', bound=Callable[..., Any])
 
 
 def experimental(func: F) -> F:
+    warned = False
+
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        warnings.warn(
-            f'{func.__name__}() is experimental and may change or be removed in a future release.',
-            category=UserWarning,
-            stacklevel=2,
-        )
+        # Warn on the first call only; later calls skip the warnings machinery (filter matching) entirely.
+        nonlocal warned
+        if not warned:
+            warned = True
+            warnings.warn(
+                f'{func.__name__}() is experimental and may change or be removed in a future release.',
+                category=UserWarning,
+                stacklevel=2,
+            )
         return func(*args, **kwargs)
 
     return cast(F, wrapper)
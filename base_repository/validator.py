@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Mapping
 
 from pydantic import BaseModel
@@ -7,6 +8,9 @@ def validate_config_from_attributes_true(schema: type[BaseModel]) -> bool:
     conf = getattr(schema, 'model_config', None)
     if conf is None:
         return False
+    if type(conf) is dict:
+        # Pydantic v2 ConfigDict is a plain dict at runtime: skip the Mapping ABC check.
+        return bool(conf.get('from_attributes', False))
     if isinstance(conf, Mapping):
         return bool(conf.get('from_attributes', False))
     return bool(getattr(conf, 'from_attributes', False))
@@ -17,3 +21,14 @@ def validate_schema_base(schema: type[BaseModel]) -> None:
         raise TypeError('mapping_schema must be a subclass of pydantic.BaseModel.')
     if not validate_config_from_attributes_true(schema):
         raise TypeError('mapping_schema.model_config.from_attributes must be set to True.')
+
+
+def is_msgspec_struct(schema: object) -> bool:
+    """
+    Return True if `schema` is a `msgspec.Struct` subclass.
+
+    msgspec is an optional dependency: when it was never imported, no Struct type can exist,
+    so the check does not import it.
+    """
+    msgspec = sys.modules.get('msgspec')
+    return msgspec is not None and isinstance(schema, type) and issubclass(schema, msgspec.Struct)
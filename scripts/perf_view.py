@@ -1,15 +1,39 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
-import matplotlib.pyplot as plt
+import matplotlib
+
+matplotlib.use('Agg')  # headless rendering, also in worker processes
+matplotlib.rcParams['font.family'] = 'DejaVu Sans'  # bundled with matplotlib; no system font lookup
+matplotlib.rcParams['agg.path.chunksize'] = 10000  # rasterize long series in chunks
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+try:
+    from orjson import loads
+except ImportError:  # orjson is optional; the stdlib parser accepts bytes lines as well
+    from json import loads
+
+# Below this many images, starting worker processes costs more than rendering them in-process.
+PARALLEL_MIN_PNGS = 12
+
+# Read result files in large chunks; lines are still parsed one at a time
+READ_BUFFER_BYTES = 1 << 20
+
+# Leading "[..][..]" chunks (family) + the rest (variant); a lone "[..]" with a suffix glued on; unsafe path chars
+_FAMILY_RE = re.compile(r'^(\[[^\]]+\](?:\[[^\]]+\])*)\s*(.*)$')
+_FAMILY_SUFFIX_RE = re.compile(r'^(\[[^\]]+\])(.*)$')
+_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9._-]+')
 
 
 @dataclass(frozen=True)
@@ -21,19 +45,26 @@ class Record:
     type: str
     scenario: str
     key_label: str | None
-    metrics: Any
+    metrics: Any  # table: {x: {metric: ms}} with int x; one: {metric: ms}
     seed_data_rows: int | None
 
 
-def _parse_ts(ts_utc: str) -> datetime:
-    # 1) Parse timestamps like "2025-11-26T..." (UTC offset may be included)
-    return datetime.fromisoformat(ts_utc.replace('Z', '+00:00'))
+@dataclass(frozen=True)
+class PngTask:
+    # One image to render: a line per variant over `xs` ('line'), or one bar per variant named in `xs` ('bar')
+    kind: Literal['line', 'bar']
+    png: Path
+    title: str
+    xs: list[int] | list[str]
+    ys: dict[str, list[float]]
+    xlabel: str | None = None
 
 
+@lru_cache(maxsize=4096)  # scenario names repeat across records and x-values
 def _scenario_family_and_variant(scenario: str) -> tuple[str, str]:
     # 1) Treat the leading "[..][..]" chunks as the family
     # 2) Treat the remaining text as the variant
-    m = re.match(r'^(\[[^\]]+\](?:\[[^\]]+\])*)\s*(.*)$', scenario)
+    m = _FAMILY_RE.match(scenario)
     if m:
         fam = m.group(1).strip()
         var = m.group(2).strip()
@@ -42,7 +73,7 @@ def _scenario_family_and_variant(scenario: str) -> tuple[str, str]:
         return fam, var
 
     # Handle CPU cases where something like "_sa" is appended right after "[...]"
-    m2 = re.match(r'^(\[[^\]]+\])(.*)$', scenario)
+    m2 = _FAMILY_SUFFIX_RE.match(scenario)
     if m2:
         fam = m2.group(1).strip()
         var = m2.group(2).strip()
@@ -52,111 +83,168 @@ def _scenario_family_and_variant(scenario: str) -> tuple[str, str]:
     return scenario, '(default)'
 
 
+@lru_cache(maxsize=4096)
 def _safe(name: str) -> str:
-    s = re.sub(r'[^a-zA-Z0-9._-]+', '_', name.strip())
+    s = _UNSAFE_RE.sub('_', name.strip())
     s = s.lstrip('_.')
     if not s:
         s = 'scenario'
     return s[:180] if len(s) > 180 else s
 
 
-def _load_all(results_dir: Path) -> list[Record]:
-    records: list[Record] = []
-    for path in results_dir.rglob('*.jsonl'):
-        with path.open('r', encoding='utf-8') as f:
+def _iter_jsonl_paths(root: str) -> Iterator[str]:
+    # 1) Walk the tree with os.scandir: entry types come from the directory listing, so no per-file stat
+    # 2) Yield plain str paths instead of building Path objects
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir():
+                yield from _iter_jsonl_paths(entry.path)
+            elif entry.name.endswith('.jsonl'):
+                yield entry.path
+
+
+def _iter_all(results_dir: Path) -> Iterator[Record]:
+    # 1) Stream each file line by line in binary mode and yield records lazily (no intermediate list)
+    # 2) Table metrics arrive keyed by the x-value as a JSON string; convert the keys to int once here
+    if not results_dir.is_dir():
+        return
+    for path in _iter_jsonl_paths(str(results_dir)):
+        with open(path, 'rb', buffering=READ_BUFFER_BYTES) as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                if not line.strip():
                     continue
-                obj = json.loads(line)
+                obj = loads(line)
                 meta = obj['meta']
-                records.append(
-                    Record(
-                        run_id=meta['run_id'],
-                        ts_utc=meta['ts_utc'],
-                        suite=meta['suite'],
-                        source=meta['source'],
-                        type=obj['type'],
-                        scenario=obj['scenario'],
-                        key_label=obj.get('key_label'),
-                        metrics=obj['metrics'],
-                        seed_data_rows=meta.get('seed_data_rows_cnt'),
-                    )
+                metrics = obj['metrics']
+                if obj['type'] == 'table':
+                    metrics = {int(k): v for k, v in metrics.items()}
+                yield Record(
+                    run_id=meta['run_id'],
+                    ts_utc=meta['ts_utc'],
+                    suite=meta['suite'],
+                    source=meta['source'],
+                    type=obj['type'],
+                    scenario=obj['scenario'],
+                    key_label=obj.get('key_label'),
+                    metrics=metrics,
+                    seed_data_rows=meta.get('seed_data_rows_cnt'),
                 )
-    return records
 
 
-def _pick_latest_run(records: list[Record]) -> str:
-    # 1) Pick the most recent run_id based on timestamp
-    records_sorted = sorted(records, key=lambda r: _parse_ts(r.ts_utc))
-    return records_sorted[-1].run_id
+def _pick_latest_run(records: Iterable[Record]) -> str | None:
+    # 1) Pick the most recent run_id based on timestamp in a single pass (None if there are no records)
+    # 2) ts_utc is fixed-format ISO-8601 UTC from perf_reporter, so string order is time order
+    latest = max(records, key=lambda r: r.ts_utc, default=None)
+    return latest.run_id if latest is not None else None
 
 
-def _plot_table_group(
+def _table_group_tasks(
     *,
-    report_root: Path,
     out_dir: Path,
     title: str,
     key_label: str,
     series: dict[str, dict[int, dict[str, float]]],
-) -> list[str]:
-    paths: list[str] = []
-
+) -> list[PngTask]:
     xs_all: set[int] = set()
     for _, points in series.items():
         xs_all.update(points.keys())
     xs = sorted(xs_all)
 
-    for metric in ['avg', 'p95', 'p99']:
-        plt.figure()
-        for variant, points in series.items():
-            ys = []
-            for x in xs:
-                ys.append(points[x][metric] if x in points else float('nan'))
-            plt.plot(xs, ys, marker='o', label=variant)
-
-        plt.title(f'{title} ({metric})')
-        plt.xlabel(key_label)
-        plt.ylabel('ms')
-        plt.legend()
-
-        out_dir.mkdir(parents=True, exist_ok=True)
-        png = out_dir / f'{_safe(metric)}.png'
-        plt.savefig(png, dpi=160, bbox_inches='tight')
-        plt.close()
-
-        paths.append(png.relative_to(report_root).as_posix())
+    # Walk xs once per variant, filling every metric's y-values together
+    metrics = ['avg', 'p95', 'p99']
+    rows: dict[str, dict[str, list[float]]] = {metric: {} for metric in metrics}
+    for variant, points in series.items():
+        variant_ys: dict[str, list[float]] = {metric: [] for metric in metrics}
+        for x in xs:
+            point = points.get(x)
+            for metric in metrics:
+                variant_ys[metric].append(point[metric] if point is not None else float('nan'))
+        for metric in metrics:
+            rows[metric][variant] = variant_ys[metric]
+
+    # Create the group's directory once, before any (possibly parallel) rendering
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks: list[PngTask] = []
+    for metric in metrics:
+        tasks.append(
+            PngTask(
+                kind='line',
+                png=out_dir / f'{_safe(metric)}.png',
+                title=f'{title} ({metric})',
+                xs=xs,
+                ys=rows[metric],
+                xlabel=key_label,
+            )
+        )
 
-    return paths
+    return tasks
 
 
-def _plot_one_group(
+def _one_group_tasks(
     *,
-    report_root: Path,
     out_dir: Path,
     title: str,
     series: dict[str, dict[str, float]],
-) -> list[str]:
-    paths: list[str] = []
+) -> list[PngTask]:
     variants = list(series.keys())
 
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks: list[PngTask] = []
     for metric in ['avg', 'p95', 'p99']:
-        plt.figure()
-        ys = [series[v][metric] for v in variants]
-        xs = list(range(len(variants)))
-        plt.bar(xs, ys)
-        plt.xticks(xs, variants, rotation=30, ha='right')
-        plt.title(f'{title} ({metric})')
-        plt.ylabel('ms')
+        tasks.append(
+            PngTask(
+                kind='bar',
+                png=out_dir / f'{_safe(metric)}.png',
+                title=f'{title} ({metric})',
+                xs=variants,
+                ys={metric: [series[v][metric] for v in variants]},
+            )
+        )
+
+    return tasks
+
+
+@lru_cache(maxsize=1)
+def _canvas() -> tuple[Any, Any]:
+    # One Figure/Axes per process, cleared between images instead of building and tearing down a Figure each time
+    return plt.subplots()
 
-        out_dir.mkdir(parents=True, exist_ok=True)
-        png = out_dir / f'{_safe(metric)}.png'
-        plt.savefig(png, dpi=160, bbox_inches='tight')
-        plt.close()
 
-        paths.append(png.relative_to(report_root).as_posix())
+def _render_one_png(task: PngTask) -> None:
+    # Top-level so it can run in worker processes; every image is independent of the others
+    fig, ax = _canvas()
+    ax.clear()
+    if task.kind == 'line':
+        for variant, ys in task.ys.items():
+            ax.plot(task.xs, ys, marker='o', label=variant)
+        ax.set_xlabel(task.xlabel)
+        ax.legend()
+    else:
+        xs = list(range(len(task.xs)))
+        for ys in task.ys.values():
+            ax.bar(xs, ys)
+        ax.set_xticks(xs)
+        ax.set_xticklabels(task.xs, rotation=30, ha='right')
 
-    return paths
+    ax.set_title(task.title)
+    ax.set_ylabel('ms')
+
+    # Fast zlib level: PNG encoding dominates savefig for these small plots
+    fig.savefig(task.png, dpi=160, bbox_inches='tight', pil_kwargs={'compress_level': 1, 'optimize': False})
+
+
+def _render_all(tasks: list[PngTask]) -> None:
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers > 1 and len(tasks) >= PARALLEL_MIN_PNGS:
+        # Rasterizing and PNG encoding are CPU-bound: spread the images over worker processes.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_render_one_png, tasks, chunksize=4))
+    else:
+        for task in tasks:
+            _render_one_png(task)
+        if tasks:
+            plt.close(_canvas()[0])
+            _canvas.cache_clear()
 
 
 def main() -> None:
@@ -169,12 +257,12 @@ def main() -> None:
     results_dir = Path(args.results_dir)
     out_dir = Path(args.out_dir)
 
-    records = _load_all(results_dir)
-    if not records:
+    # Two streaming passes (find the run, then keep only its records) instead of holding every run in memory
+    run_id = args.run_id or _pick_latest_run(_iter_all(results_dir))
+    if run_id is None:
         raise SystemExit(f'no records under: {results_dir}')
 
-    run_id = args.run_id or _pick_latest_run(records)
-    picked = [r for r in records if r.run_id == run_id]
+    picked = [r for r in _iter_all(results_dir) if r.run_id == run_id]
 
     # 1) Group by (suite, family, type, key_label)
     table_groups: dict[tuple[str, str, str, str], dict[str, dict[int, dict[str, float]]]] = defaultdict(dict)
@@ -185,9 +273,7 @@ def main() -> None:
 
         if r.type == 'table':
             key_label = r.key_label or 'X'
-            metrics_raw: dict[str, dict[str, float]] = r.metrics
-            metrics: dict[int, dict[str, float]] = {int(k): v for k, v in metrics_raw.items()}
-            table_groups[(r.suite, family, r.type, key_label)][variant] = metrics
+            table_groups[(r.suite, family, r.type, key_label)][variant] = r.metrics
 
         elif r.type == 'one':
             one_groups[(r.suite, family, r.type)][variant] = r.metrics
@@ -207,38 +293,39 @@ def main() -> None:
     if seed_data_rows is not None:
         sections.append(f'<h2>seed_data_rows: {seed_data_rows}</h2>')
 
+    tasks: list[PngTask] = []
+
     # Table groups
     for (suite, family, _type, key_label), series in sorted(table_groups.items()):
-        base = out_dir / suite / _safe(family) / 'table'
-        rels = _plot_table_group(
-            report_root=out_dir,
-            out_dir=base,
+        group_tasks = _table_group_tasks(
+            out_dir=out_dir / suite / _safe(family) / 'table',
             title=f'{suite} {family}',
             key_label=key_label,
             series=series,
         )
+        tasks.extend(group_tasks)
         sections.append(f'<h2>{family}</h2>')
         img_html = []
-        for rel in rels:
-            img_html.append(f"<div class='card'><img src='{rel}'></div>")
+        for task in group_tasks:
+            img_html.append(f"<div class='card'><img src='{task.png.relative_to(out_dir).as_posix()}'></div>")
         sections.append("<div class='grid2'>" + '\n'.join(img_html) + '</div>')
 
     # One groups
-    for (suite, family, _type, key_label), table_series in sorted(table_groups.items()):
-        base = out_dir / suite / _safe(family) / 'table'
-        rels = _plot_table_group(
-            report_root=out_dir,
-            out_dir=base,
+    for (suite, family, _type), one_series in sorted(one_groups.items()):
+        group_tasks = _one_group_tasks(
+            out_dir=out_dir / suite / _safe(family) / 'one',
             title=f'{suite} {family}',
-            key_label=key_label,
-            series=table_series,
+            series=one_series,
         )
+        tasks.extend(group_tasks)
         sections.append(f'<h2>{family}</h2>')
         img_html = []
-        for rel in rels:
-            img_html.append(f"<div class='card'><img src='{rel}'></div>")
+        for task in group_tasks:
+            img_html.append(f"<div class='card'><img src='{task.png.relative_to(out_dir).as_posix()}'></div>")
         sections.append("<div class='grid2'>" + '\n'.join(img_html) + '</div>')
 
+    _render_all(tasks)
+
     index = out_dir / 'index.html'
     index.write_text(
         "<html><head><meta charset='utf-8'><title>Perf Report</title>"
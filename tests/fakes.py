@@ -47,7 +47,7 @@ class FakeAsyncSession:
         self.added_all: list[Any] = []
         self.flushed: bool = False
 
-    async def execute(self, stmt: Any) -> FakeResult:
+    async def execute(self, stmt: Any, params: Any = None) -> FakeResult:
         assert self._i < len(self._script), 'FakeAsyncSession script exhausted.'
         res = self._script[self._i]
         self._i += 1
@@ -3,6 +3,8 @@ import json
 from typing import Any
 from unittest.mock import MagicMock
 
+import msgspec
+import pytest
 from litestar import Litestar, get
 from litestar.di import Provide
 from litestar.status_codes import HTTP_200_OK
@@ -84,7 +86,7 @@ def test_apply_pagination_cursor() -> None:
 def test_controller_integration_offset() -> None:
     @get('/', dependencies={'params': Provide(provide_offset_pagination, sync_to_thread=False)})
     async def handler(params: OffsetPagination) -> dict[str, Any]:
-        return params.model_dump()
+        return msgspec.structs.asdict(params)
 
     with TestClient(app=Litestar(route_handlers=[handler], debug=True)) as client:
         res = client.get('/', params={'page': '3', 'size': '50'})
@@ -99,7 +101,7 @@ def test_controller_integration_offset() -> None:
 def test_controller_integration_cursor() -> None:
     @get('/', dependencies={'params': Provide(provide_cursor_pagination, sync_to_thread=False)})
     async def handler(params: CursorPagination) -> dict[str, Any]:
-        return params.model_dump()
+        return msgspec.structs.asdict(params)
 
     with TestClient(app=Litestar(route_handlers=[handler], debug=True)) as client:
         res = client.get('/', params={'cursor': 'abcd', 'limit': '15'})
@@ -109,3 +111,73 @@ def test_controller_integration_cursor() -> None:
         data = res.json()
         assert data['cursor'] == 'abcd'
         assert data['limit'] == 15
+
+
+def test_apply_pagination_cursor_invalid_falls_back_to_first_page() -> None:
+    repo = ItemRepo()
+    not_an_object = base64.urlsafe_b64encode(json.dumps([1, 2]).encode()).decode('utf-8')
+
+    for raw in ('%%%not-base64%%%', base64.urlsafe_b64encode(b'{bad json').decode('utf-8'), not_an_object):
+        q = repo.list().order_by(['id'])  # type: ignore
+        q2 = apply_pagination(q, CursorPagination(cursor=raw, limit=5))
+
+        assert q2.cursor == {}
+        assert q2.cursor_size == 5
+
+
+def test_apply_pagination_cursor_accepts_unpadded_base64() -> None:
+    repo = ItemRepo()
+    q = repo.list().order_by(['id'])  # type: ignore
+
+    cursor_data = {'id': 10}
+    cursor_str = base64.urlsafe_b64encode(json.dumps(cursor_data).encode()).decode('utf-8').rstrip('=')
+
+    q2 = apply_pagination(q, CursorPagination(cursor=cursor_str, limit=5))
+
+    assert q2.cursor == cursor_data
+
+
+def test_provide_repo_reuses_provider_per_repo_type() -> None:
+    class OtherItemRepo(BaseRepository[Item, ItemSchema]):
+        pass
+
+    assert provide_repo(ItemRepo) is provide_repo(ItemRepo)
+    assert provide_repo(ItemRepo) is not provide_repo(OtherItemRepo)
+
+
+def test_pagination_structs_defaults_and_frozen() -> None:
+    assert OffsetPagination() == OffsetPagination(page=1, size=20)
+    assert CursorPagination() == CursorPagination(cursor=None, limit=20)
+
+    p = OffsetPagination(page=2, size=10)
+    with pytest.raises(AttributeError):
+        p.page = 3  # type: ignore[misc]
+
+
+def test_apply_pagination_dispatches_subclasses_and_ignores_unknown_types() -> None:
+    class PageParams(OffsetPagination, frozen=True):
+        pass
+
+    repo = ItemRepo()
+
+    q = apply_pagination(repo.list(), PageParams(page=4, size=5))
+    assert q.page == 4
+    assert q.offset_size == 5
+
+    q_untouched = repo.list()
+    assert apply_pagination(q_untouched, object()) is q_untouched  # type: ignore[arg-type]
+    assert q_untouched.page is None
+
+
+def test_pagination_helpers_are_imported_lazily() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        'import sys\n'
+        'from base_repository.litestar import provide_repo\n'
+        "assert 'base_repository.litestar.pagination' not in sys.modules\n"
+        'from base_repository.litestar import OffsetPagination\n'
+        "assert 'base_repository.litestar.pagination' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
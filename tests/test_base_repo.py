@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import warnings
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any, TypedDict, cast
+from typing import Annotated, Any, TypedDict, cast
 
+import msgspec
 import pytest
-from pydantic import BaseModel, ConfigDict
-from sqlalchemy import Integer, String
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, WrapSerializer, field_serializer, field_validator
+from sqlalchemy import Integer, String, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, validates
 
 from base_repository.base_filter import BaseRepoFilter
 from base_repository.base_mapper import BaseMapper
@@ -112,6 +114,88 @@ async def test_execute_select_convert_schema_false_returns_orm() -> None:
     assert type(got[0]).__name__ == 'Result'
 
 
+@pytest.mark.asyncio
+async def test_execute_returns_the_fetched_list_without_copying_for_orm_results() -> None:
+    """
+    < execute materializes rows once via scalars().all() and returns that list for ORM results >
+    1. Prepare a FakeResult whose all() hands out one fixed list.
+    2. Call execute(..., convert_schema=False).
+    3. Assert the very same list object is returned.
+    """
+
+    # 1
+    fetched = [
+        Result(id=1, item_id=10, sub_category_id=None, result_value=None, is_abnormal=None, tenant_id=1, checkup_id=1),
+    ]
+
+    class FixedResult(FakeResult):
+        def all(self) -> list[Any]:
+            return fetched
+
+    # 2
+    repo = StrictRepo(cast(AsyncSession, FakeAsyncSession(script=[FixedResult()])))
+    got = await repo.execute(repo.list(), convert_schema=False)
+
+    # 3
+    assert got is fetched
+
+
+@pytest.mark.asyncio
+async def test_iter_execute_yields_converted_batches_of_chunk_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    < iter_execute streams the statement with yield_per and yields converted batches >
+    1. Seed five rows into an in-memory aiosqlite database.
+    2. Iterate with chunk=2 and assert batch sizes and schema conversion.
+    3. Break after the first batch and assert closing the generator closes the streamed result.
+    4. Assert chunk < 1 is rejected.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+        session.add_all([AutoIncModel(name=f'n{i}') for i in range(5)])
+        await session.flush()
+
+        # 2
+        batches = [
+            b async for b in repo.iter_execute(repo.list().order_by([AutoIncModel.pk.asc()]), chunk=2, session=session)
+        ]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert [r.name for b in batches for r in b] == ['n0', 'n1', 'n2', 'n3', 'n4']
+        assert isinstance(batches[0][0], AutoIncSchema)
+
+        # 3
+        streamed: list[Any] = []
+        stream = session.stream
+
+        async def spy_stream(stmt: Any) -> Any:
+            result = await stream(stmt)
+            streamed.append(result)
+            return result
+
+        monkeypatch.setattr(session, 'stream', spy_stream)
+        gen = repo.iter_execute(repo.list(), chunk=2, session=session)
+        async for _batch in gen:
+            break
+        assert not streamed[0].closed
+        await gen.aclose()
+        assert streamed[0].closed
+        monkeypatch.undo()
+
+        # 4
+        with pytest.raises(ValueError):
+            _ = [b async for b in repo.iter_execute(repo.list(), chunk=0, session=session)]
+
+    await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_get_and_get_or_fail() -> None:
     """
@@ -154,6 +238,40 @@ async def test_get_or_fail_raises_when_missing() -> None:
         _ = await repo.get_or_fail(RFilter(id=404))
 
 
+@pytest.mark.asyncio
+async def test_get_or_fail_converts_once_without_going_through_get(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    < get_or_fail queries directly and converts the row exactly once >
+    1. Prepare one ORM row and make get() unusable.
+    2. Count _convert calls.
+    3. Call get_or_fail(...) and assert one conversion happened.
+    """
+    # 1
+    row = Result(id=7, item_id=1, sub_category_id=None, result_value=None, is_abnormal=None, tenant_id=1, checkup_id=1)
+    session = FakeAsyncSession(script=[FakeResult([row])])
+    repo = StrictRepo(cast(AsyncSession, session))
+
+    async def _no_get(*_a: Any, **_k: Any) -> Any:
+        raise AssertionError('get() must not be called')
+
+    monkeypatch.setattr(repo, 'get', _no_get)
+
+    # 2
+    calls: list[Any] = []
+    orig = repo._convert
+
+    def _counting(obj: Any, **kw: Any) -> Any:
+        calls.append(obj)
+        return orig(obj, **kw)
+
+    monkeypatch.setattr(repo, '_convert', _counting)
+
+    # 3
+    got = await repo.get_or_fail(RFilter(id=7))
+    assert got.id == 7
+    assert calls == [row]
+
+
 @pytest.mark.asyncio
 async def test_count_and_delete_and_create() -> None:
     """
@@ -274,6 +392,572 @@ async def test_create_many_skip_convert_returns_orm_objects() -> None:
     assert type(created[0]).__name__ == 'Result'
 
 
+@pytest.mark.asyncio
+async def test_create_many_routes_large_batches_to_bulk_insert_returning() -> None:
+    """
+    < create_many uses create_many_core (bulk INSERT ... RETURNING) at bulk_insert_threshold >
+    1. Create an in-memory aiosqlite schema and a repo with a small threshold.
+    2. Call create_many_core with chunk=2 and assert input order, dropped autoinc PK, and conversion.
+    3. Call create_many above the threshold, assert nothing is left pending and the statement is reused.
+    4. Assert a session without a bind (FakeAsyncSession) keeps the ORM add_all path.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+        bulk_insert_threshold = 3
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+
+        # 2
+        created = await repo.create_many_core(
+            [{'name': 'a'}, AutoIncSchema(pk=99, name='b'), {'name': 'c'}], chunk=2, session=session
+        )
+        assert [(c.pk, c.name) for c in created] == [(1, 'a'), (2, 'b'), (3, 'c')]
+        assert isinstance(created[0], AutoIncSchema)
+
+        # 3
+        orm = await repo.create_many([{'name': f'n{i}'} for i in range(4)], session=session, skip_convert=True)
+        assert [o.pk for o in orm] == [4, 5, 6, 7]
+        assert not session.new
+        stmt = Repo.__dict__['_bulk_insert_stmt']
+        await repo.create_many_core([{'name': 'd'}], session=session)
+        assert Repo.__dict__['_bulk_insert_stmt'] is stmt
+
+    await engine.dispose()
+
+    # 4
+    fake = FakeAsyncSession(script=[])
+    await Repo().create_many([{'name': 'x'}] * 3, session=cast(AsyncSession, fake))
+    assert len(fake.added_all) == 3
+    assert fake.flushed is True
+
+
+@pytest.mark.asyncio
+async def test_create_uses_core_insert_returning_for_schema_results() -> None:
+    """
+    < create() inserts via cached Core INSERT ... RETURNING when the result is a schema >
+    1. Create an in-memory aiosqlite schema and a repo without mapper.
+    2. Call create() (schema result) and assert the returned schema and that nothing is added to the session.
+    3. Call create(convert_schema=False) and assert the ORM add + flush path returns a persistent object.
+    4. Assert the statement is cached per class, and disabled for models whose attribute/column keys differ.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+
+        # 2
+        created = await repo.create(AutoIncSchema(pk=99, name='a'), session=session)
+        assert isinstance(created, AutoIncSchema)
+        assert (created.pk, created.name) == (1, 'a')
+        assert not session.new and not session.identity_map
+
+        # 3
+        orm = await repo.create({'name': 'b'}, session=session, convert_schema=False)
+        assert isinstance(orm, AutoIncModel)
+        assert orm.pk == 2
+        assert orm in session
+
+    await engine.dispose()
+
+    # 4
+    assert Repo.__dict__['_insert_returning'] is repo._insert_returning_stmt()
+
+    class RenamedModel(Base):
+        __tablename__ = 'renamed_model'
+
+        pk: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+        name: Mapped[str | None] = mapped_column('db_name', nullable=True)
+
+    class RenamedRepo(BaseRepository[RenamedModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    assert RenamedRepo()._insert_returning_stmt() is None
+
+
+class ValidatedModel(Base):
+    __tablename__ = 'validated_model'
+
+    pk: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str | None] = mapped_column(nullable=True)
+
+    @validates('name')
+    def _upper(self, _key: str, value: str | None) -> str | None:
+        return value.upper() if value else value
+
+    @property
+    def display(self) -> str:
+        return f'<{self.name}>'
+
+
+class ValidatedSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    pk: int | None = None
+    name: str | None = None
+    display: str | None = None
+
+
+@pytest.mark.asyncio
+async def test_create_keeps_orm_path_for_validated_models_and_non_column_schema_fields() -> None:
+    """
+    < create() skips the Core INSERT ... RETURNING path when it would bypass ORM behavior >
+    1. Create an in-memory aiosqlite schema for a model with a @validates validator and a property.
+    2. Assert the Core statement is disabled and create() returns/stores the validated value and the property.
+    3. Assert a schema field that is not a model column disables it on a model without hooks.
+    """
+
+    # 1
+    class Repo(BaseRepository[ValidatedModel, ValidatedSchema]):
+        filter_class = DummyFilter
+
+    class DisplayRepo(BaseRepository[AutoIncModel, ValidatedSchema]):
+        filter_class = DummyFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+
+        # 2
+        assert repo._has_no_insert_hooks() is False
+        assert repo._insert_returning_stmt() is None
+        created = await repo.create({'name': 'alice'}, session=session)
+        assert (created.pk, created.name, created.display) == (1, 'ALICE', '<ALICE>')
+        stored = (await session.execute(select(ValidatedModel.name))).scalar_one()
+        assert stored == 'ALICE'
+
+    await engine.dispose()
+
+    # 3
+    display_repo = DisplayRepo()
+    assert display_repo._has_no_insert_hooks() is True
+    assert display_repo._insert_returning_stmt() is None
+
+
+class DefaultedModel(Base):
+    __tablename__ = 'defaulted_model'
+
+    pk: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str | None] = mapped_column(nullable=True)
+    status: Mapped[str | None] = mapped_column(nullable=True, default='active')
+
+
+class DefaultedSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    pk: int | None = None
+    name: str | None = None
+    status: str | None = None
+
+
+class VersionedModel(Base):
+    __tablename__ = 'versioned_model'
+
+    pk: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str | None] = mapped_column(nullable=True)
+    version: Mapped[int] = mapped_column(nullable=False)
+
+    __mapper_args__ = {'version_id_col': version}
+
+
+class VersionedSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    pk: int | None = None
+    name: str | None = None
+    version: int | None = None
+
+
+@pytest.mark.asyncio
+async def test_create_core_path_matches_orm_flush_for_defaults_and_version_counters() -> None:
+    """
+    < create() stores the same row as an ORM flush for None values and version counters >
+    1. Create an in-memory aiosqlite schema for a model with a column default and a versioned model.
+    2. Assert an explicit None keeps the column default on the Core path, like the ORM path.
+    3. Assert a versioned model keeps the ORM path and gets its version counter set.
+    """
+
+    # 1
+    class Repo(BaseRepository[DefaultedModel, DefaultedSchema]):
+        filter_class = DummyFilter
+
+    class VersionedRepo(BaseRepository[VersionedModel, VersionedSchema]):
+        filter_class = DummyFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+
+        # 2
+        assert repo._insert_returning_stmt() is not None
+        created = await repo.create({'name': 'a', 'status': None}, session=session)
+        assert created.status == 'active'
+        orm = await repo.create({'name': 'b', 'status': None}, session=session, convert_schema=False)
+        assert orm.status == 'active'
+        explicit = await repo.create(DefaultedSchema(name='c', status='off'), session=session)
+        assert explicit.status == 'off'
+
+        # 3
+        versioned_repo = VersionedRepo()
+        assert versioned_repo._insert_returning_stmt() is None
+        versioned = await versioned_repo.create({'name': 'v'}, session=session)
+        assert (versioned.name, versioned.version) == ('v', 1)
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_create_many_keeps_orm_path_for_models_with_insert_hooks() -> None:
+    """
+    < create_many() runs @validates validators for batches at or above bulk_insert_threshold >
+    1. Create an in-memory aiosqlite schema for a model with a @validates validator.
+    2. Call create_many with a batch of the default threshold size and assert every item was validated.
+    3. Assert the bulk statement was never built for this Repository class.
+    """
+
+    # 1
+    class Repo(BaseRepository[ValidatedModel, ValidatedSchema]):
+        filter_class = DummyFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+
+        # 2
+        threshold = Repo.bulk_insert_threshold
+        assert threshold is not None
+        created = await repo.create_many([{'name': f'u{i}'} for i in range(threshold)], session=session)
+        assert [c.name for c in created] == [f'U{i}' for i in range(threshold)]
+
+    await engine.dispose()
+
+    # 3
+    assert '_bulk_insert_stmt' not in Repo.__dict__
+
+
+@pytest.mark.asyncio
+async def test_update_many_updates_rows_by_primary_key_in_one_bulk_statement() -> None:
+    """
+    < update_many issues a Core UPDATE by primary key for every item and returns the matched row count >
+    1. Seed three rows into an in-memory aiosqlite database.
+    2. Update two of them with dict and schema items and assert the returned count and stored values.
+    3. Assert unknown primary keys and items without values are not counted, also when the driver
+       has no reliable executemany rowcount.
+    4. Assert columns named differently from their attribute are updated.
+    5. Assert an item without the primary key is rejected.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    class RenamedUpdateModel(Base):
+        __tablename__ = 'renamed_update_model'
+
+        pk: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+        name: Mapped[str | None] = mapped_column('db_name', nullable=True)
+
+    class RenamedRepo(BaseRepository[RenamedUpdateModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+        await repo.create_many_core([{'name': 'a'}, {'name': 'b'}, {'name': 'c'}], session=session)
+
+        # 2
+        n = await repo.update_many([{'pk': 1, 'name': 'x'}, AutoIncSchema(pk=3, name='z')], session=session)
+        assert n == 2
+        got = await repo.execute(repo.list().order_by([AutoIncModel.pk.asc()]), session=session)
+        assert [g.name for g in got] == ['x', 'b', 'z']
+
+        # 3
+        items = [{'pk': 2, 'name': 'y'}, {'pk': 99, 'name': 'none'}, {'pk': 1}]
+        assert await repo.update_many(items, session=session) == 1
+        engine.sync_engine.dialect.supports_sane_multi_rowcount = False
+        items = [{'pk': 1, 'name': 'x2'}, {'pk': 98, 'name': 'none'}, {'pk': 3, 'name': 'z2'}]
+        assert await repo.update_many(items, session=session) == 2
+        engine.sync_engine.dialect.supports_sane_multi_rowcount = True
+        got = await repo.execute(repo.list().order_by([AutoIncModel.pk.asc()]), session=session)
+        assert [g.name for g in got] == ['x2', 'y', 'z2']
+
+        # 4
+        renamed = RenamedRepo()
+        await renamed.create({'name': 'r'}, session=session, convert_schema=False)
+        assert await renamed.update_many([{'pk': 1, 'name': 'r2'}], session=session) == 1
+        assert (await session.execute(select(RenamedUpdateModel.name))).scalar_one() == 'r2'
+
+        # 5
+        with pytest.raises(ValueError, match="primary key 'pk'"):
+            await repo.update_many([{'name': 'no-pk'}], session=session)
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_count_delete_reuse_cached_statements_per_filter_shape() -> None:
+    """
+    < get/count bind filter values into one cached statement per filter shape >
+    1. Seed rows into an in-memory aiosqlite database.
+    2. Run count/get with scalar and sequence values and assert results.
+    3. Assert the same shape reuses one statement object and a new shape adds another.
+    4. Assert filters overriding where_criteria or holding SQL expressions are honored without caching,
+       and delete works.
+    """
+
+    # 1
+    @dataclass
+    class NameFilter(BaseRepoFilter):
+        pk: int | list[int] | None = None
+        name: str | None = None
+
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = NameFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+        await repo.create_many_core([{'name': 'a'}, {'name': 'b'}, {'name': 'b'}], session=session)
+
+        # 2
+        assert await repo.count(NameFilter(name='b'), session=session) == 2
+        assert await repo.count(NameFilter(name='a'), session=session) == 1
+        assert await repo.count(NameFilter(pk=[1, 3]), session=session) == 2
+        assert await repo.count(session=session) == 3
+        got = await repo.get(NameFilter(pk=2), session=session)
+        assert got is not None and got.name == 'b'
+
+        # 3
+        stmts = Repo.__dict__['_filter_stmts']
+        assert len([k for k in stmts if k[0] == 'count']) == 3
+        assert (
+            repo._filter_stmt('count', NameFilter(name='z'))[0] is repo._filter_stmt('count', NameFilter(name='y'))[0]
+        )
+        assert repo._filter_stmt('count', NameFilter(name='z'))[1] == {'flt_name': 'z'}
+
+        # 4
+        @dataclass
+        class CustomFilter(NameFilter):
+            def where_criteria(self, m: type[Any]) -> list[Any]:
+                return [m.name == 'a']
+
+        assert await repo.count(CustomFilter(), session=session) == 1
+        assert not any(k[1] is CustomFilter for k in stmts)
+        cached = len(stmts)
+        assert await repo.count(NameFilter(name=cast(Any, AutoIncModel.name)), session=session) == 3
+        assert len(stmts) == cached
+        assert await repo.delete(NameFilter(name='b'), session=session) == 2
+        assert await repo.count(session=session) == 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_delete_synchronizes_loaded_objects_in_the_session() -> None:
+    """
+    < delete() marks matching objects already loaded in the session as deleted >
+    1. Seed rows into an in-memory aiosqlite database and load them into the session.
+    2. Delete by filter and assert only the matching object left the session.
+    """
+
+    # 1
+    @dataclass
+    class NameFilter(BaseRepoFilter):
+        name: str | None = None
+
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = NameFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+        session.add_all([AutoIncModel(name='a'), AutoIncModel(name='b')])
+        await session.flush()
+        loaded = await repo.get_list(session=session, convert_schema=False)
+
+        # 2
+        assert await repo.delete(NameFilter(name='b'), session=session) == 1
+        assert [(o.name, o in session) for o in loaded] == [('a', True), ('b', False)]
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_delete_returning_pks_uses_returning_or_selects_first() -> None:
+    """
+    < delete(returning_pks=True) returns the deleted primary keys >
+    1. On aiosqlite (DELETE ... RETURNING supported), assert the deleted PKs are returned and rows are gone.
+    2. On a session without RETURNING support, assert PKs are selected first and the DELETE still runs.
+    """
+
+    # 1
+    @dataclass
+    class NameFilter(BaseRepoFilter):
+        name: str | None = None
+
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = NameFilter
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        repo = Repo()
+        await repo.create_many_core([{'name': 'a'}, {'name': 'b'}, {'name': 'b'}], session=session)
+        deleted = await repo.delete(NameFilter(name='b'), returning_pks=True, session=session)
+        assert sorted(deleted) == [2, 3]
+        assert await repo.count(session=session) == 1
+
+    await engine.dispose()
+
+    # 2
+    fake = FakeAsyncSession(script=[FakeResult([(5,), (6,)]), FakeResult(rowcount=2)])
+    selected: list[Any] = []
+    orig = fake.execute
+
+    async def capture(stmt: Any, params: Any = None) -> FakeResult:
+        selected.append(stmt)
+        return await orig(stmt, params)
+
+    fake.execute = capture  # type: ignore[method-assign]
+    assert await Repo().delete(NameFilter(name='x'), returning_pks=True, session=cast(AsyncSession, fake)) == [5, 6]
+    assert [str(s).split()[0] for s in selected] == ['SELECT', 'DELETE']
+
+
+@pytest.mark.asyncio
+async def test_count_uses_pk_column_and_approximate_only_on_postgresql() -> None:
+    """
+    < count() counts the PK column; approximate=True reads pg_class only for unfiltered PostgreSQL counts >
+    1. Assert the cached count statement is count(pk) and exact counts work on aiosqlite (approximate ignored).
+    2. On a PostgreSQL-bound fake session, assert the reltuples estimate is returned for an unfiltered count.
+    3. Assert a negative estimate (never analyzed) falls back to the exact count.
+    """
+
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    # 1
+    repo = Repo()
+    assert 'count(autoinc_model.pk)' in str(repo._filter_stmt('count', None)[0])
+
+    engine = create_async_engine('sqlite+aiosqlite://')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        await repo.create_many_core([{'name': 'a'}, {'name': 'b'}], session=session)
+        assert await repo.count(approximate=True, session=session) == 2
+    await engine.dispose()
+
+    # 2
+    from sqlalchemy.dialects import postgresql
+
+    class PgSession(FakeAsyncSession):
+        def get_bind(self) -> Any:
+            return engine_stub
+
+    engine_stub = type('EngineStub', (), {'dialect': postgresql.dialect()})()
+    seen: list[Any] = []
+
+    pg = PgSession(script=[FakeResult(count=12345)])
+    orig = pg.execute
+
+    async def capture(stmt: Any, params: Any = None) -> FakeResult:
+        seen.append((str(stmt), params))
+        return await orig(stmt, params)
+
+    pg.execute = capture  # type: ignore[method-assign]
+    assert await repo.count(approximate=True, session=cast(AsyncSession, pg)) == 12345
+    assert 'reltuples' in seen[0][0]
+    assert seen[0][1] == {'rel': 'autoinc_model'}
+
+    # 3
+    pg2 = PgSession(script=[FakeResult(count=-1), FakeResult(count=7)])
+    assert await repo.count(approximate=True, session=cast(AsyncSession, pg2)) == 7
+
+
+@pytest.mark.asyncio
+async def test_create_many_copy_uses_asyncpg_copy_above_threshold_else_bulk_insert() -> None:
+    """
+    < create_many_copy sends COPY records on asyncpg and falls back to bulk INSERT otherwise >
+    1. Build a session double whose bind reports the asyncpg driver and records copy_records_to_table calls.
+    2. Call create_many_copy at copy_threshold and assert table, columns (autoinc PK dropped) and records.
+    3. Call it below the threshold and assert a single executemany INSERT is issued instead.
+    """
+
+    # 1
+    copied: list[dict[str, Any]] = []
+    executed: list[tuple[Any, Any]] = []
+
+    class DriverConn:
+        async def copy_records_to_table(self, table: str, **kwargs: Any) -> None:
+            copied.append({'table': table, **kwargs})
+
+    class Conn:
+        async def get_raw_connection(self) -> Any:
+            return type('Raw', (), {'driver_connection': DriverConn()})()
+
+    class CopySession(FakeAsyncSession):
+        def get_bind(self) -> Any:
+            return type('Bind', (), {'dialect': type('Dialect', (), {'driver': 'asyncpg'})()})()
+
+        async def connection(self) -> Conn:
+            return Conn()
+
+        async def execute(self, stmt: Any, params: Any = None) -> FakeResult:  # type: ignore[override]
+            executed.append((stmt, params))
+            return FakeResult([])
+
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+        copy_threshold = 2
+
+    session = cast(AsyncSession, CopySession())
+
+    # 2
+    n = await Repo().create_many_copy([{'pk': 5, 'name': 'a'}, AutoIncSchema(name='b')], session=session)
+    assert n == 2
+    assert copied == [{'table': 'autoinc_model', 'records': [('a',), ('b',)], 'columns': ['name'], 'schema_name': None}]
+    assert executed == []
+
+    # 3
+    assert await Repo().create_many_copy([{'name': 'c'}], session=session) == 1
+    assert len(copied) == 1
+    assert executed[0][1] == [{'name': 'c'}]
+
+
 @pytest.mark.asyncio
 async def test_default_convert_schema_guard_at_init() -> None:
     """
@@ -515,6 +1199,36 @@ def test_subclass_definition_does_not_call_sa_mapper(monkeypatch: pytest.MonkeyP
     assert TmpRepo._default_convert_schema is True
 
 
+def test_sa_mapper_is_resolved_once_per_repository_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    < __init__ resolves the SQLAlchemy mapper once per Repository class and shares it across instances >
+    1. Patch repository.base_repo.sa_mapper to count calls.
+    2. Build two instances of a fresh Repo subclass.
+    3. Assert sa_mapper was called once and both instances hold the same Mapper.
+    """
+    # 1
+    import base_repository.repository.base_repo as base_repo_mod
+
+    real_sa_mapper = base_repo_mod.sa_mapper
+    called = {'count': 0}
+
+    def counting_sa_mapper(model: type[Any]) -> Any:
+        called['count'] += 1
+        return real_sa_mapper(model)
+
+    monkeypatch.setattr(base_repo_mod, 'sa_mapper', counting_sa_mapper)
+
+    # 2
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    first, second = Repo(), Repo()
+
+    # 3
+    assert called['count'] == 1
+    assert first.sa_mapper is second.sa_mapper is real_sa_mapper(AutoIncModel)
+
+
 def test_init_session_warning_cases() -> None:
     """
     < __init__ warning behavior depends on whether a SessionProvider is configured >
@@ -552,6 +1266,67 @@ def test_init_session_warning_cases() -> None:
         _ = RepoNoProvider(s3)
 
 
+def test_session_resolution_follows_provider_configured_after_init() -> None:
+    """
+    < Session resolution picks up a SessionProvider configured after the repository was built >
+    1. Build a sessionless repo and assert session access raises.
+    2. Configure a duck-typed provider (runtime-checkable protocol) on the class afterwards.
+    3. Assert the provider session is used, while an explicit session argument still wins.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    repo = Repo()
+    with pytest.raises(RuntimeError, match='Neither SessionProvider nor specific_session'):
+        _ = repo.session
+
+    # 2
+    class DuckProvider:
+        def __init__(self, s: AsyncSession) -> None:
+            self._s = s
+
+        def get_session(self) -> AsyncSession:
+            return self._s
+
+    provided = cast(AsyncSession, FakeAsyncSession(script=[]))
+    provider = DuckProvider(provided)
+    assert isinstance(provider, SessionProvider)
+    Repo.configure_session_provider(provider)
+
+    # 3
+    explicit = cast(AsyncSession, FakeAsyncSession(script=[]))
+    assert repo.session is provided
+    assert repo._resolve_session(None) is provided
+    assert repo._resolve_session(explicit) is explicit
+
+
+def test_init_session_warning_is_emitted_once_per_repository_class() -> None:
+    """
+    < The __init__ session warning is emitted once per Repository class, not per instance >
+    1. Instantiate a Repo with a session twice and assert only the first instantiation warns.
+    2. Assert another Repo class still warns on its first instantiation.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    with pytest.warns(UserWarning, match='Stale or closed session handling'):
+        Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+
+    # 2
+    class OtherRepo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    with pytest.warns(UserWarning, match='Stale or closed session handling'):
+        OtherRepo(cast(AsyncSession, FakeAsyncSession(script=[])))
+
+
 @pytest.mark.asyncio
 async def test_get_list_cursor_requires_order_by_then_requires_size() -> None:
     """
@@ -621,11 +1396,37 @@ def test_autoinc_pk_keys_includes_only_integer_autoincrement_primary_keys() -> N
     assert str_repo._autoinc_pk_keys() == set()
 
 
+def test_autoinc_pk_keys_use_mapper_attribute_keys_for_renamed_columns() -> None:
+    """
+    < _autoinc_pk_keys reports the mapped attribute key even when the DB column name differs >
+    1. Define a model whose autoincrement PK attribute `pk` maps to column `row_id`.
+    2. Assert the key set contains `pk` and the payload drops client-provided `pk`.
+    """
+
+    # 1
+    class RenamedPKModel(Base):
+        __tablename__ = 'renamed_pk_model_for_autoinc_keys'
+
+        pk: Mapped[int] = mapped_column('row_id', Integer, primary_key=True, autoincrement=True)
+        name: Mapped[str | None] = mapped_column(nullable=True)
+
+    class Repo(BaseRepository[RenamedPKModel]):
+        model = RenamedPKModel
+        filter_class = DummyFilter
+
+    repo = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+
+    # 2
+    assert repo._autoinc_pk_keys() == {'pk'}
+    assert repo._schema_payload({'pk': 7, 'name': 'A'}) == {'name': 'A'}
+
+
 def test_schema_payload_drops_unknown_keys_and_autoinc_pk() -> None:
     """
     < _schema_payload filters to model columns and drops autoincrement PK keys >
     1. Provide mapping payload including pk and unknown keys.
-    2. Assert pk and unknown are removed and known keys remain.
+    2. Assert pk and unknown are removed, known keys remain, and the allowed key set is cached on the class.
+    3. Assert plain dicts are not mutated and non-dict mappings take the same filtering.
     """
 
     # 1
@@ -639,6 +1440,155 @@ def test_schema_payload_drops_unknown_keys_and_autoinc_pk() -> None:
     assert 'pk' not in payload
     assert 'unknown' not in payload
     assert payload['name'] == 'A'
+    assert repo._payload_key_set() == frozenset({'name'}) == Repo.__dict__['_payload_keys']
+
+    # 3
+    from types import MappingProxyType
+
+    raw = {'name': 'B', 'pk': 1}
+    assert repo._schema_payload(raw) == {'name': 'B'}
+    assert raw == {'name': 'B', 'pk': 1}
+    assert repo._schema_payload(MappingProxyType({'name': 'C', 'x': 0})) == {'name': 'C'}
+
+
+def test_model_key_sets_are_cached_per_repository_class() -> None:
+    """
+    < Column/autoinc-PK key sets are computed once per Repository class and not shared with subclasses >
+    1. Instantiate a Repo twice and build payloads.
+    2. Assert the cached sets live on the class and are reused (same objects).
+    3. Assert a subclass builds its own entry instead of reading the parent's.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    repo1 = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    repo2 = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    repo1._schema_payload({'name': 'A'})
+
+    # 2
+    assert Repo.__dict__['_column_keys'] == frozenset({'pk', 'name'})
+    assert Repo.__dict__['_autoinc_pk'] == frozenset({'pk'})
+    assert repo2._model_key_sets()[0] is Repo.__dict__['_column_keys']
+
+    # 3
+    class SubRepo(Repo):
+        pass
+
+    assert '_column_keys' not in SubRepo.__dict__
+    SubRepo(cast(AsyncSession, FakeAsyncSession(script=[])))._autoinc_pk_keys()
+    assert SubRepo.__dict__['_autoinc_pk'] == frozenset({'pk'})
+
+
+def test_schema_validation_runs_once_per_repository_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    < _validate_schema_against_model caches a passing check per Repository class >
+    1. Instantiate a Repo once and assert the required-field set is stored on the class.
+    2. Make the model key lookup fail, instantiate again, and assert no re-validation happens.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    assert Repo.__dict__['_required_fields'] == frozenset()
+    assert Repo.__dict__['_required_schema'] is AutoIncSchema
+
+    # 2
+    def _fail(self: Any) -> Any:
+        raise AssertionError('schema must not be re-validated')
+
+    monkeypatch.setattr(Repo, '_model_key_sets', _fail)
+    Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+
+
+def test_schema_payload_skips_filtering_for_clean_schema_types() -> None:
+    """
+    < _schema_payload returns the dump as-is only for schema types that cannot carry foreign keys >
+    1. Dump a serializer-bearing schema whose fields are all non-autoinc columns; assert it is marked clean.
+    2. Assert AutoIncSchema (has autoinc `pk`) and an extra='allow' schema are not clean and still filtered.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    class NameOnly(BaseModel):
+        name: str | None = None
+
+        @field_serializer('name')
+        def _upper(self, v: str | None) -> str | None:
+            return v.upper() if v else v
+
+    class Loose(BaseModel):
+        model_config = ConfigDict(extra='allow')
+
+        name: str | None = None
+
+    repo = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    assert repo._schema_payload(NameOnly(name='a')) == {'name': 'A'}
+    assert Repo.__dict__['_clean_payload_types'][NameOnly] is True
+
+    # 2
+    assert repo._schema_payload(AutoIncSchema(pk=1, name='B')) == {'name': 'B'}
+    assert repo._schema_payload(Loose.model_validate({'name': 'C', 'other': 1})) == {'name': 'C'}
+    assert repo._payload_is_clean(AutoIncSchema) is False
+    assert repo._payload_is_clean(Loose) is False
+
+
+def test_schema_payload_reads_set_fields_directly_for_plain_schemas() -> None:
+    """
+    < _schema_payload reads __pydantic_fields_set__/__dict__ for plain schemas and dumps the rest >
+    1. Build a payload from a plain schema and assert only set, non-autoinc column fields are kept in order.
+    2. Assert schemas with excluded fields or nested models fall back to the Pydantic dump.
+    3. Assert Annotated Plain/WrapSerializer fields and serialize_by_alias also fall back to the Pydantic dump.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    class Extra(BaseModel):
+        name: str | None = None
+        pk: int | None = None
+        other: int | None = None
+
+    repo = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    assert repo._payload_field_names(Extra) == ('name',)
+    assert repo._schema_payload(Extra(pk=1, other=2, name='A')) == {'name': 'A'}
+    assert repo._schema_payload(Extra(pk=1)) == {}
+
+    # 2
+    class Hidden(BaseModel):
+        name: str | None = Field(default=None, exclude=True)
+
+    class Nested(BaseModel):
+        name: Extra | None = None
+
+    assert repo._payload_field_names(Hidden) is None
+    assert repo._payload_field_names(Nested) is None
+    assert repo._schema_payload(Hidden(name='A')) == {}
+    assert repo._schema_payload(Nested(name=Extra(name='B'))) == {'name': {'name': 'B'}}
+
+    # 3
+    class Plain(BaseModel):
+        name: Annotated[str | None, PlainSerializer(lambda v: v and v.upper())] = None
+
+    class Wrapped(BaseModel):
+        name: list[Annotated[str, WrapSerializer(lambda v, h: h(v) + '!')]] | None = None
+
+    class ByAlias(BaseModel):
+        model_config = ConfigDict(serialize_by_alias=True)
+
+        name: str | None = Field(default=None, alias='nm')
+
+    assert repo._payload_field_names(Plain) is None
+    assert repo._payload_field_names(Wrapped) is None
+    assert repo._payload_field_names(ByAlias) is None
+    assert repo._schema_payload(Plain(name='a')) == {'name': 'A'}
+    assert repo._schema_payload(Wrapped(name=['a'])) == {'name': ['a!']}
 
 
 def test_schema_payload_from_pydantic_exclude_unset() -> None:
@@ -693,6 +1643,36 @@ def test_schema_to_orm_falls_back_when_mapper_to_orm_not_implemented() -> None:
     assert obj.name == 'A'
 
 
+def test_schemas_to_orm_handles_mixed_batches_with_and_without_mapper() -> None:
+    """
+    < _schemas_to_orm builds ORM objects for mixed batches; schema items still go through mapper.to_orm >
+    1. Without a mapper, convert a batch of dict and schema items and assert payload construction.
+    2. With a mapper, assert schema items use to_orm and dict items use the payload path, in input order.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    objs = Repo()._schemas_to_orm([{'name': 'a', 'pk': 9}, AutoIncSchema(name='b')])
+    assert [(o.pk, o.name) for o in objs] == [(None, 'a'), (None, 'b')]
+
+    # 2
+    class UpperMapper(BaseMapper):
+        def to_schema(self, orm_object: AutoIncModel) -> AutoIncSchema:
+            return AutoIncSchema(pk=orm_object.pk, name=orm_object.name)
+
+        def to_orm(self, schema_object: AutoIncSchema) -> AutoIncModel:
+            return AutoIncModel(name=(schema_object.name or '').upper())
+
+    class MappedRepo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+        mapper = UpperMapper
+
+    objs = MappedRepo()._schemas_to_orm([AutoIncSchema(name='x'), {'name': 'y'}])
+    assert [o.name for o in objs] == ['X', 'y']
+
+
 def test_convert_uses_mapper_to_schema_then_falls_back_to_pydantic_on_not_implemented() -> None:
     """
     < _convert uses mapper.to_schema first; on NotImplementedError it falls back to Pydantic conversion >
@@ -731,6 +1711,185 @@ def test_convert_uses_mapper_to_schema_then_falls_back_to_pydantic_on_not_implem
     assert out2.name == 'B'
 
 
+def test_convert_uses_model_construct_only_for_validator_free_column_schemas(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    < With trusted_construct=None, _convert uses model_construct only when safe; default keeps model_validate >
+    1. Convert a row with a validator-free, column-only schema; assert model_validate is not called.
+    2. Convert a row with a schema declaring a field_validator; assert the validator still runs.
+    3. Assert the default (trusted_construct=False) keeps model_validate and the decision is cached per class.
+    4. Assert trusted_construct=True copies only column fields and leaves other optional fields at their default.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+        trusted_construct = None
+
+    def _no_validate(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError('model_validate must not be called')
+
+    monkeypatch.setattr(AutoIncSchema, 'model_validate', _no_validate)
+    out = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))._convert(AutoIncModel(pk=1, name='A'))
+    assert isinstance(out, AutoIncSchema)
+    assert (out.pk, out.name) == (1, 'A')
+    assert Repo.__dict__['_construct_fields'] == ('pk', 'name')
+    monkeypatch.undo()
+
+    # 2
+    class UpperSchema(AutoIncSchema):
+        @field_validator('name')
+        @classmethod
+        def _upper(cls, v: str | None) -> str | None:
+            return v.upper() if v else v
+
+    class UpperRepo(BaseRepository[AutoIncModel, UpperSchema]):
+        filter_class = DummyFilter
+        trusted_construct = None
+
+    out2 = UpperRepo(cast(AsyncSession, FakeAsyncSession(script=[])))._convert(AutoIncModel(pk=2, name='b'))
+    assert isinstance(out2, UpperSchema)
+    assert out2.name == 'B'
+    assert UpperRepo.__dict__['_construct_fields'] is None
+
+    # 3
+    class ValidatingRepo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    repo = ValidatingRepo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    assert isinstance(repo._convert(AutoIncModel(pk=3, name='C')), AutoIncSchema)
+    assert ValidatingRepo.__dict__['_construct_fields'] is None
+    assert '_construct_fields' not in BaseRepository.__dict__
+
+    # 4
+    class NoteSchema(AutoIncSchema):
+        note: str | None = 'n/a'
+
+    class TrustedRepo(BaseRepository[AutoIncModel, NoteSchema]):
+        filter_class = DummyFilter
+        trusted_construct = True
+
+    trusted = TrustedRepo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    out4 = trusted._convert(AutoIncModel(pk=4, name='D'))
+    assert isinstance(out4, NoteSchema)
+    assert (out4.pk, out4.name, out4.note) == (4, 'D', 'n/a')
+    assert TrustedRepo.__dict__['_construct_fields'] == ('pk', 'name')
+    out_many = cast(list[NoteSchema], trusted._convert_many([AutoIncModel(pk=5, name='E')]))
+    assert [(o.pk, o.note) for o in out_many] == [(5, 'n/a')]
+
+
+def test_convert_many_uses_one_cached_list_adapter_unless_a_mapper_is_set() -> None:
+    """
+    < _convert_many validates the whole list through a per-class TypeAdapter; mapper repos stay per-row >
+    1. Convert two rows without a mapper and assert the adapter is cached on the class and reused.
+    2. Convert with a mapper and assert to_schema is called per row and no adapter is built.
+    3. Assert convert_schema=False returns the same list object.
+    """
+
+    # 1
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+
+    repo = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+    rows = [AutoIncModel(pk=1, name='A'), AutoIncModel(pk=2, name='B')]
+    out = repo._convert_many(rows)
+    assert [(o.pk, o.name) for o in cast(list[AutoIncSchema], out)] == [(1, 'A'), (2, 'B')]
+    adapter = Repo.__dict__['_list_adapter']
+    Repo(cast(AsyncSession, FakeAsyncSession(script=[])))._convert_many(rows)
+    assert Repo.__dict__['_list_adapter'] is adapter
+
+    # 2
+    calls: list[int] = []
+
+    class Mapper(BaseMapper):
+        def to_schema(self, orm_object: AutoIncModel) -> AutoIncSchema:
+            calls.append(orm_object.pk)
+            return AutoIncSchema(pk=orm_object.pk, name='M')
+
+        def to_orm(self, schema_object: AutoIncSchema) -> AutoIncModel:
+            return AutoIncModel(name=schema_object.name)
+
+    class MapperRepo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+        mapper = Mapper
+
+    mapped = MapperRepo(cast(AsyncSession, FakeAsyncSession(script=[])))._convert_many(rows)
+    assert calls == [1, 2]
+    assert [cast(AutoIncSchema, o).name for o in mapped] == ['M', 'M']
+    assert '_list_adapter' not in MapperRepo.__dict__
+
+    # 3
+    assert repo._convert_many(rows, convert_schema=False) is rows
+
+
+def test_msgspec_struct_mapping_schema_converts_rows_and_builds_payloads() -> None:
+    """
+    < A msgspec.Struct mapping_schema uses the msgspec backend for reads and payloads >
+    1. Define a Struct schema and a repo inferring it from the Generic args.
+    2. Assert single-row and list conversion produce Struct instances.
+    3. Assert Struct input becomes a columns-only payload without UNSET fields or the autoinc PK.
+    4. Assert a Struct requiring a non-column field is rejected at instantiation.
+    """
+
+    # 1
+    class NameStruct(msgspec.Struct):
+        pk: int | None = None
+        name: str | None | msgspec.UnsetType = msgspec.UNSET
+
+    class Repo(BaseRepository[AutoIncModel, NameStruct]):  # type: ignore[type-var]
+        filter_class = DummyFilter
+
+    assert Repo.mapping_schema is NameStruct
+    assert Repo._schema_backend == 'msgspec'
+    repo = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))
+
+    # 2
+    one = repo._convert(AutoIncModel(pk=1, name='A'))
+    many = repo._convert_many([AutoIncModel(pk=2, name='B'), AutoIncModel(pk=3, name=None)])
+    assert one == NameStruct(pk=1, name='A')
+    assert many == [NameStruct(pk=2, name='B'), NameStruct(pk=3, name=None)]
+
+    # 3
+    assert repo._schema_payload(NameStruct(pk=9, name='C')) == {'name': 'C'}
+    assert repo._schema_payload(NameStruct(pk=9)) == {}
+
+    # 4
+    class BadStruct(msgspec.Struct):
+        missing_field: int
+
+    class BadRepo(BaseRepository[AutoIncModel, BadStruct]):  # type: ignore[type-var]
+        filter_class = DummyFilter
+
+    with pytest.raises(TypeError, match='missing_field'):
+        BadRepo(cast(AsyncSession, FakeAsyncSession(script=[])))
+
+
+def test_convert_many_with_mapper_keeps_per_row_fallback_when_to_schema_is_partial() -> None:
+    """
+    < _convert_many calls mapper.to_schema directly, but keeps per-row fallback on NotImplementedError >
+    1. Define a mapper that raises NotImplementedError for one row only.
+    2. Convert a batch and assert mapped rows and the Pydantic fallback row are both returned in order.
+    """
+
+    # 1
+    class PartialMapper(BaseMapper):
+        def to_schema(self, orm_object: AutoIncModel) -> AutoIncSchema:
+            if orm_object.pk == 2:
+                raise NotImplementedError()
+            return AutoIncSchema(pk=orm_object.pk, name='M')
+
+        def to_orm(self, schema_object: AutoIncSchema) -> AutoIncModel:
+            return AutoIncModel(name=schema_object.name)
+
+    class Repo(BaseRepository[AutoIncModel, AutoIncSchema]):
+        filter_class = DummyFilter
+        mapper = PartialMapper
+
+    # 2
+    rows = [AutoIncModel(pk=1, name='A'), AutoIncModel(pk=2, name='B'), AutoIncModel(pk=3, name='C')]
+    out = Repo(cast(AsyncSession, FakeAsyncSession(script=[])))._convert_many(rows)
+    assert [(o.pk, o.name) for o in cast(list[AutoIncSchema], out)] == [(1, 'M'), (2, 'B'), (3, 'M')]
+
+
 def test_convert_returns_row_when_schema_missing() -> None:
     """
     < _convert returns the raw ORM row when mapping_schema is missing >
@@ -1056,15 +2215,16 @@ async def test_get_list_cursor_path_calls_limit_when_size_is_provided(monkeypatc
 
 
 @pytest.mark.asyncio
-async def test_get_list_offset_paging_path_calls_paging_when_page_and_size_are_provided(
+async def test_get_list_offset_paging_builds_select_without_listquery(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """
-    < get_list(page,size) calls q.paging(page=..., size=...) >
-    1. Monkeypatch ListQuery.paging to record page and size.
-    2. Monkeypatch Repo.execute to return [] without SQL execution.
-    3. Call get_list(page=2, size=10).
-    4. Assert paging(...) was called once with (2, 10) and output is [].
+    < get_list(page,size) without cursor/order_by builds the Select directly >
+    1. Monkeypatch ListQuery.paging to record calls and capture the executed statement.
+    2. Call get_list(flt=..., page=2, size=10).
+    3. Assert ListQuery.paging was not used and the statement carries WHERE/ORDER BY pk/LIMIT/OFFSET.
+    4. Assert page < 1 is still rejected.
+    5. Assert an unpaged, unfiltered call executes the cached, pk-ordered list statement as-is.
     """
 
     # 1
@@ -1088,37 +2248,55 @@ async def test_get_list_offset_paging_path_calls_paging_when_page_and_size_are_p
     class Repo(BaseRepository[AutoIncModel2, AutoIncSchema2]):
         filter_class = DummyFilter2
 
-    class PagingCalled(TypedDict):
-        paging: int
-        page: int | None
-        size: int | None
-
-    called: PagingCalled = {'paging': 0, 'page': None, 'size': None}
+    called = {'paging': 0}
     orig_paging = ListQuery.paging
 
     def wrapped_paging(self: ListQuery, *, page: int, size: int) -> ListQuery:
         called['paging'] += 1
-        called['page'] = page
-        called['size'] = size
         return orig_paging(self, page=page, size=size)
 
-    async def stub_execute(self: Repo, *_: Any, **__: Any) -> list[Any]:
-        return []
-
     monkeypatch.setattr(ListQuery, 'paging', wrapped_paging)
-    monkeypatch.setattr(Repo, 'execute', stub_execute, raising=True)
+
+    session = FakeAsyncSession(script=[FakeResult([])])
+    seen: list[Any] = []
+    orig_execute = session.execute
+
+    async def capture(stmt: Any, params: Any = None) -> FakeResult:
+        seen.append(stmt)
+        return await orig_execute(stmt, params)
+
+    monkeypatch.setattr(session, 'execute', capture)
+    repo = Repo(cast(AsyncSession, session))
 
     # 2
-    repo = Repo(cast(AsyncSession, FakeAsyncSession(script=[FakeResult([])])))
+    out = await repo.get_list(flt=DummyFilter2(pk=3), page=2, size=10)
 
     # 3
-    out = await repo.get_list(page=2, size=10)
+    assert out == []
+    assert called['paging'] == 0
+    (stmt,) = seen
+    assert stmt._limit == 10
+    assert stmt._offset == 10
+    assert 'WHERE' in str(stmt)
+    assert 'ORDER BY autoinc_model_for_offset_paging.pk' in str(stmt)
 
     # 4
-    assert out == []
-    assert called['paging'] == 1
-    assert called['page'] == 2
-    assert called['size'] == 10
+    with pytest.raises(ValueError, match='page must be >= 1'):
+        await repo.get_list(page=0, size=10)
+
+    # 5
+    session2 = FakeAsyncSession(script=[FakeResult([])])
+    seen2: list[Any] = []
+
+    async def capture2(stmt: Any, params: Any = None) -> FakeResult:
+        seen2.append(stmt)
+        return FakeResult([])
+
+    monkeypatch.setattr(session2, 'execute', capture2)
+    assert await repo.get_list(session=cast(AsyncSession, session2)) == []
+    (stmt2,) = seen2
+    assert stmt2 is repo._filter_stmt('list', None)[0]
+    assert 'ORDER BY autoinc_model_for_offset_paging.pk' in str(stmt2)
 
 
 def test_validate_schema_against_model_raises_type_error_when_required_fields_are_missing() -> None:
@@ -39,3 +39,20 @@ def test_strenum_is_str_like() -> None:
     assert StatementType.SELECT.value == 'select'
     assert StatementType.SELECT.name == 'SELECT'
     assert isinstance(StatementType.SELECT, str)
+
+
+def test_from_stmt_resolves_statement_subclasses() -> None:
+    class MySelect(type(select(_t()))):  # type: ignore[misc]
+        inherit_cache = True
+
+    stmt = MySelect(_t())
+    assert StatementType.from_stmt(stmt) == StatementType.SELECT
+    # resolved again through the cached subclass entry
+    assert StatementType.from_stmt(stmt) == StatementType.SELECT
+
+
+def test_str_returns_plain_str_value() -> None:
+    s = str(StatementType.DELETE)
+    assert s == 'delete'
+    assert type(s) is str
+    assert f'{StatementType.UPDATE}' == 'update'
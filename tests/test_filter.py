@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from collections.abc import Iterable as IterableABC
 from dataclasses import dataclass
+from typing import Any
 
 import pytest
+from sqlalchemy import func
 from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql.elements import BindParameter
 
-from base_repository.base_filter import BaseRepoFilter
+from base_repository.base_filter import _COLUMNS_INFO_KEY, BaseRepoFilter
 
 
 # SQLAlchemy Base / model definitions for tests
@@ -274,3 +278,315 @@ def test_string_like_values_are_not_treated_as_sequences_and_do_not_use_in(filte
     )
     assert 'user_id' in compiled
     assert 'IN' not in compiled.upper()
+
+
+def test_repo_fields_are_cached_per_class_and_not_shared_with_subclasses() -> None:
+    """
+    < (field, column) pairs are cached on each class and subclasses build their own >
+    1. Define a filter with an alias and a dataclass subclass adding one more field.
+    2. Build criteria on both classes.
+    3. Assert each class caches its own pairs with aliases resolved.
+    """
+
+    # 1
+    @dataclass
+    class FBase(BaseRepoFilter):
+        __aliases__ = {'account_id': 'user_id'}
+        account_id: int | None = None
+
+    @dataclass
+    class FChild(FBase):
+        is_active: bool | None = None
+
+    # 2
+    FBase(account_id=1).where_criteria(M)
+    crit = FChild(account_id=1, is_active=True).where_criteria(M)
+
+    # 3
+    assert len(crit) == 2
+    assert FBase.__dict__['__repo_fields__'] == (('account_id', 'user_id'),)
+    assert FChild.__dict__['__repo_fields__'] == (('account_id', 'user_id'), ('is_active', 'is_active'))
+
+
+def test_bound_columns_are_cached_per_model_and_strict_check_still_applies() -> None:
+    """
+    < model columns are resolved once per model; strict mode still raises only for set fields >
+    1. Define a strict filter with a known field and an unknown field.
+    2. Build criteria twice with the unknown field unset and assert the cache entry is reused.
+    3. Set the unknown field and assert ValueError is raised from the cached path.
+    """
+
+    # 1
+    @dataclass
+    class FStrictCached(BaseRepoFilter):
+        __strict__ = True
+        id: int | None = None
+        unknown_field: int | None = None
+
+    # 2
+    assert len(FStrictCached(id=1).where_criteria(M)) == 1
+    cache = M._sa_class_manager.info[_COLUMNS_INFO_KEY]
+    cached = cache[FStrictCached]
+    assert len(FStrictCached(id=2).where_criteria(M)) == 1
+    assert cache[FStrictCached] is cached
+    assert cached[1] == ('unknown_field', 'unknown_field', None)
+
+    # 3
+    with pytest.raises(ValueError):
+        FStrictCached(unknown_field=1).where_criteria(M)
+
+
+def test_bound_columns_cache_does_not_keep_runtime_models_or_filters_alive() -> None:
+    """
+    < the bound-column cache holds neither models nor filter classes strongly >
+    1. Build criteria for a model and a filter class created at runtime.
+    2. Drop both and assert they are garbage collected.
+    3. Assert unmapped classes are resolved without a cache.
+    """
+
+    # 1
+    def _make() -> tuple[type[Any], type[Any]]:
+        class RuntimeBase(DeclarativeBase):
+            pass
+
+        class RuntimeModel(RuntimeBase):
+            __tablename__ = 'runtime_model'
+
+            id: Mapped[int] = mapped_column(primary_key=True)
+
+        @dataclass
+        class RuntimeFilter(BaseRepoFilter):
+            id: int | None = None
+
+        assert len(RuntimeFilter(id=1).where_criteria(RuntimeModel)) == 1
+        assert len(F(id=1).where_criteria(RuntimeModel)) == 1
+        return RuntimeModel, RuntimeFilter
+
+    model, flt_cls = _make()
+    model_ref, flt_ref = weakref.ref(model), weakref.ref(flt_cls)
+    assert len(flt_cls(id=1).where_criteria(M)) == 1
+
+    # 2
+    del model, flt_cls
+    gc.collect()
+    assert model_ref() is None
+    assert flt_ref() is None
+
+    # 3
+    class Plain:
+        id = 'not-a-column'
+
+    assert F._bound_columns(Plain)[0] == ('id', 'id', 'not-a-column')
+
+
+def test_is_seq_memoizes_decision_per_type() -> None:
+    """
+    < _is_seq falls back to ABC checks for unseeded types and memoizes the result per type >
+    1. Build criteria with a range value (a Sequence not seeded in the table).
+    2. Assert an IN expression is produced.
+    3. Assert the decision for range is now cached in the type table.
+    """
+    from base_repository.base_filter import _SEQ_TYPES
+
+    # 1
+    crit = F(user_id=range(1, 3)).where_criteria(M)
+
+    # 2
+    compiled = str(crit[0].compile(dialect=sqlite.dialect(), compile_kwargs={'literal_binds': True}))
+    assert 'IN' in compiled.upper()
+
+    # 3
+    assert _SEQ_TYPES[range] is True
+    assert BaseRepoFilter._is_seq({'a': 1}) is False
+
+
+def test_is_seq_override_is_honored_for_seeded_types() -> None:
+    """
+    < a subclass overriding _is_seq decides for every type, including the seeded list/tuple/set >
+    1. Define a filter whose _is_seq treats tuples as scalars.
+    2. Assert a tuple value produces an equality condition in where_criteria and where_params.
+    3. Assert lists still produce IN.
+    """
+
+    # 1
+    @dataclass
+    class TupleScalarF(BaseRepoFilter):
+        id: Any = None
+
+        @staticmethod
+        def _is_seq(value: Any) -> bool:
+            return type(value) is not tuple and BaseRepoFilter._is_seq(value)
+
+    # 2
+    crit = TupleScalarF(id=(1, 2)).where_criteria(M)
+    assert 'IN' not in str(crit[0].compile(dialect=sqlite.dialect())).upper()
+    assert TupleScalarF(id=(1, 2)).where_params(M) == (('=',), {'flt_id': (1, 2)})
+
+    # 3
+    assert TupleScalarF(id=[1, 2]).where_params(M) == (('in',), {'flt_id': [1, 2]})
+
+
+def test_values_getter_handles_zero_one_and_many_fields() -> None:
+    """
+    < the cached values getter always returns a tuple aligned with the field order >
+    1. Define filters with zero, one, and several fields.
+    2. Assert the getter returns tuples of matching length and order.
+    3. Assert a zero-field filter builds no criteria.
+    """
+
+    # 1
+    @dataclass
+    class FEmpty(BaseRepoFilter):
+        pass
+
+    @dataclass
+    class FOne(BaseRepoFilter):
+        id: int | None = None
+
+    # 2
+    assert FEmpty._values_getter()(FEmpty()) == ()
+    assert FOne._values_getter()(FOne(id=3)) == (3,)
+    assert F._values_getter()(F(id=1, user_id=[2], is_active=False)) == (1, [2], False)
+
+    # 3
+    assert FEmpty().where_criteria(M) == []
+
+
+def test_tuple_and_set_values_generate_in_expressions() -> None:
+    """
+    < tuple values go to IN as-is; set values are materialized; empty tuples are skipped >
+    1. Build criteria with a tuple and with a set.
+    2. Assert both produce IN expressions with the expected values.
+    3. Assert an empty tuple produces no criteria.
+    """
+    # 1
+    crit_tuple = F(user_id=(10, 20)).where_criteria(M)
+    crit_set = F(user_id={30}).where_criteria(M)
+
+    # 2
+    for crit, expected in ((crit_tuple, ['10', '20']), (crit_set, ['30'])):
+        compiled = str(crit[0].compile(dialect=sqlite.dialect(), compile_kwargs={'literal_binds': True}))
+        assert 'IN' in compiled.upper()
+        for v in expected:
+            assert v in compiled
+
+    # 3
+    assert F(user_id=()).where_criteria(M) == []
+
+
+def test_aliases_are_interned_at_subclass_definition() -> None:
+    """
+    < __aliases__ keys and values are interned when the subclass is defined >
+    1. Define a filter whose alias strings are built at runtime (not interned by the compiler).
+    2. Assert the stored alias key/value are the interned string objects.
+    """
+    import sys
+
+    # 1
+    key = ''.join(['acc', 'ount_id'])
+    value = ''.join(['user', '_id'])
+
+    @dataclass
+    class FRuntimeAlias(BaseRepoFilter):
+        __aliases__ = {key: value}
+        account_id: int | None = None
+
+    # 2
+    (stored_key, stored_value), *_ = FRuntimeAlias.__aliases__.items()
+    assert stored_key is sys.intern('account_id')
+    assert stored_value is sys.intern('user_id')
+
+
+def test_cached_names_used_for_model_lookups_are_interned() -> None:
+    """
+    < every name stored in the per-model column cache is an interned string >
+    1. Build a dataclass filter from runtime-built field/alias names via make_dataclass.
+    2. Build criteria to populate the caches.
+    3. Assert each cached field/column name is the interned object.
+    """
+    import sys
+    from dataclasses import field, make_dataclass
+
+    # 1
+    field_name = ''.join(['acc', 'ount'])
+    FRuntime = make_dataclass(
+        'FRuntime',
+        [(field_name, int | None, field(default=None))],
+        bases=(BaseRepoFilter,),
+        namespace={'__aliases__': {field_name: ''.join(['user', '_id'])}},
+    )
+
+    # 2
+    crit = FRuntime(**{field_name: 5}).where_criteria(M)
+    assert len(crit) == 1
+
+    # 3
+    for cached_field, cached_col, _ in FRuntime._bound_columns(M):
+        assert cached_field is sys.intern(cached_field)
+        assert cached_col is sys.intern('user_id')
+
+
+def test_where_criteria_leaves_the_filter_instance_untouched() -> None:
+    """
+    < where_criteria keeps no state on the filter instance >
+    1. Build criteria twice and assert the instance __dict__ only holds the dataclass fields.
+    2. Reassign a field and assert the criteria follow the new value.
+    """
+    # 1
+    f = F(id=1, user_id=(10, 20))
+    f.where_criteria(M)
+    assert len(f.where_criteria(M)) == 2
+    assert vars(f) == {'id': 1, 'user_id': (10, 20), 'is_active': None}
+
+    # 2
+    f.is_active = True
+    assert len(f.where_criteria(M)) == 3
+
+
+def test_where_params_and_template_split_shape_from_values() -> None:
+    """
+    < where_params returns a hashable shape + bind values; where_template renders bindparam criteria >
+    1. Build params for scalar, sequence and bool values and assert shape and params.
+    2. Assert an empty sequence / None produce no condition.
+    3. Compile the template and assert it uses named bind parameters (expanding for IN).
+    """
+    # 1
+    shape, params = F(id=1, user_id={10}, is_active=False).where_params(M)
+    assert shape == ('=', 'in', False)
+    assert params == {'flt_id': 1, 'flt_user_id': [10]}
+
+    # 2
+    assert F(user_id=[]).where_params(M) == ((None, None, None), {})
+
+    # 3
+    assert shape is not None
+    crit = F.where_template(M, shape)
+    compiled = [str(c.compile(dialect=sqlite.dialect())) for c in crit]
+    assert compiled[0] == 'm.id = ?'
+    assert 'POSTCOMPILE_flt_user_id' in compiled[1]
+    assert compiled[2] == 'm.is_active IS 0'
+
+
+def test_where_params_leaves_sql_expression_values_to_where_criteria() -> None:
+    """
+    < SQL expression values cannot be bound, so where_params opts out of templating >
+    1. Assert a column, a function and an ORM attribute value (scalar or inside a sequence) yield (None, {}).
+    2. Assert where_criteria still renders them as expressions, not bind parameters.
+    """
+
+    @dataclass
+    class ExprF(BaseRepoFilter):
+        id: Any = None
+
+    # 1
+    assert ExprF(id=M.user_id).where_params(M) == (None, {})
+    assert ExprF(id=func.abs(M.user_id)).where_params(M) == (None, {})
+    assert ExprF(id=M.__table__.c.user_id).where_params(M) == (None, {})
+    assert ExprF(id=[1, M.user_id]).where_params(M) == (None, {})
+    assert ExprF(id=1).where_params(M) == (('=',), {'flt_id': 1})
+
+    # 2
+    compiled = [str(c.compile(dialect=sqlite.dialect())) for c in ExprF(id=M.user_id).where_criteria(M)]
+    assert compiled == ['m.id = m.user_id']
+    compiled = [str(c.compile(dialect=sqlite.dialect())) for c in ExprF(id=func.abs(M.user_id)).where_criteria(M)]
+    assert compiled == ['m.id = abs(m.user_id)']
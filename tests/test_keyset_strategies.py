@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import re
+import uuid
+from datetime import datetime
 from typing import Any, cast
 from unittest.mock import patch
 
 import pytest
-from sqlalchemy import Column, ColumnElement, Integer, Select, String, column, select
+from sqlalchemy import Column, ColumnElement, DateTime, Integer, Select, String, Uuid, column, select
 from sqlalchemy.orm import DeclarativeBase
 
+import base_repository.query.strategies.keyset as keyset_mod
 from base_repository.query.strategies.keyset import KeysetStrategy
+from base_repository.query.strategies.order_by import OrderByStrategy
 
 
 # SQLAlchemy Base / model definitions for tests
@@ -424,11 +428,11 @@ def test_type_casting_fail_on_second_integer_column() -> None:
         KeysetStrategy.apply(stmt, order_cols=order_cols, cursor=cursor, size=4)
 
 
-def test_strip_unary_length_mismatch_triggers_error() -> None:
+def test_decompose_length_mismatch_triggers_error() -> None:
     """
     < apply raises when extracted key length does not match order_cols length >
     1. Build order_cols with two columns and a matching cursor.
-    2. Patch _strip_unary to return a list with the wrong length.
+    2. Patch _decompose to return keys with the wrong length.
     3. Assert ValueError is raised with the expected message.
     """
     # 1
@@ -437,7 +441,8 @@ def test_strip_unary_length_mismatch_triggers_error() -> None:
     cursor: dict[str, Any] = {'a': 1, 'b': 2}
 
     # 2
-    with patch.object(KeysetStrategy, '_strip_unary', return_value=[column('a')]):
+    bad = ((column('a'), column('b')), ('a',), (False, False))
+    with patch.object(keyset_mod, '_decompose', return_value=bad):
         # 3
         with pytest.raises(ValueError, match='order_cols length does not match extracted key length'):
             KeysetStrategy.apply(
@@ -446,3 +451,218 @@ def test_strip_unary_length_mismatch_triggers_error() -> None:
                 cursor=cursor,
                 size=10,
             )
+
+
+def test_compiled_order_matches_sequence_path() -> None:
+    """
+    < A CompiledOrder from OrderByStrategy.compile builds the same SQL as the raw sequence >
+    1. Compile [User.id.desc(), User.name] once.
+    2. Apply keyset paging with the compiled plan and with the equivalent sequence.
+    3. Assert both SQL strings are identical and the plan carries keys/dirs.
+    """
+    # 1
+    order = OrderByStrategy.compile(User, [User.id.desc(), User.name])
+    cursor = {'id': 5, 'name': 'bob'}
+
+    # 2
+    q_compiled = KeysetStrategy.apply(select(User), order_cols=order, cursor=cursor, size=10)
+    q_seq = KeysetStrategy.apply(select(User), order_cols=list(order.cols), cursor=cursor, size=10)
+
+    # 3
+    assert compile_sql(q_compiled) == compile_sql(q_seq)
+    assert order.keys == ('id', 'name')
+    assert order.dirs == (True, False)
+    assert [c.key for c in order.stripped] == ['id', 'name']
+
+
+def test_compiled_order_validates_cursor_keys() -> None:
+    """
+    < CompiledOrder path still rejects mismatched and reordered cursor keys >
+    1. Compile [User.id, User.name].
+    2. Assert a cursor with an unknown key raises "mismatch".
+    3. Assert a cursor with swapped key order raises "order must match".
+    """
+    # 1
+    order = OrderByStrategy.compile(User, [User.id, User.name])
+
+    # 2
+    with pytest.raises(ValueError, match='mismatch'):
+        KeysetStrategy.apply(select(User), order_cols=order, cursor={'id': 1, 'x': 2}, size=10)
+
+    # 3
+    with pytest.raises(ValueError, match='order must match'):
+        KeysetStrategy.apply(select(User), order_cols=order, cursor={'name': 'a', 'id': 1}, size=10)
+
+
+def test_or_ladder_shares_equality_prefix_between_branches() -> None:
+    """
+    < Later OR-ladder branches reuse the equality predicates built for earlier columns >
+    1. Use order_cols = [User.id.desc(), User.name.asc(), User.age.desc()] with a full cursor.
+    2. Render the WHERE clause.
+    3. Assert three branches with the expected operators, and one shared bind for "id =".
+    """
+    # 1
+    order_cols = [User.id.desc(), User.name.asc(), User.age.desc()]
+    cursor = {'id': 1, 'name': 'a', 'age': 3}
+
+    # 2
+    q = KeysetStrategy.apply(select(User), order_cols=order_cols, cursor=cursor, size=3)
+    where = str(q.whereclause)
+
+    # 3
+    branches = where.split(' OR ')
+    assert len(branches) == 3
+    assert '"user".id < ' in branches[0]
+    assert '"user".name > ' in branches[1]
+    assert '"user".age < ' in branches[2]
+    id_eq = re.findall(r'"user"\.id = (:\w+)', where)
+    assert len(id_eq) == 2 and id_eq[0] == id_eq[1]
+
+
+def test_cursor_key_errors_distinguish_mismatch_from_order() -> None:
+    """
+    < Sequence order_cols: a different key set and a swapped key order raise distinct errors >
+    1. Use order_cols = [User.id, User.name].
+    2. Assert an unknown key reports "cursor keys mismatch".
+    3. Assert the right keys in the wrong order report "cursor key order must match".
+    """
+    # 1
+    order_cols = [User.id, User.name]
+
+    # 2
+    with pytest.raises(ValueError, match='cursor keys mismatch'):
+        KeysetStrategy.apply(select(User), order_cols=order_cols, cursor={'id': 1, 'age': 2}, size=5)
+
+    # 3
+    with pytest.raises(ValueError, match='cursor key order must match'):
+        KeysetStrategy.apply(select(User), order_cols=order_cols, cursor={'name': 'a', 'id': 1}, size=5)
+
+
+def test_compiled_order_resolves_expected_types_once() -> None:
+    """
+    < Expected cursor value types are resolved at compile time; untyped columns skip casting >
+    1. Compile [User.id, User.name] and assert expected_types is (int, str).
+    2. Apply with a numeric-string id and assert the bound value was cast to int.
+    3. Apply on an untyped column('a') and assert the value is passed through unchanged.
+    """
+    # 1
+    order = OrderByStrategy.compile(User, [User.id, User.name])
+    assert order.expected_types == (int, str)
+
+    # 2
+    q = KeysetStrategy.apply(select(User), order_cols=order, cursor={'id': '7', 'name': 'kim'}, size=5)
+    assert 7 in q.compile().params.values()
+
+    # 3
+    q2 = KeysetStrategy.apply(select(column('a')), order_cols=[column('a')], cursor={'a': 'x'}, size=5)
+    assert 'x' in q2.compile().params.values()
+
+
+def test_decompose_splits_columns_in_one_pass() -> None:
+    """
+    < _decompose returns base columns, keys and DESC flags for mixed ORDER BY input >
+    1. Decompose [User.id.desc(), User.name].
+    2. Assert stripped columns, keys and directions.
+    """
+    # 1
+    stripped, keys, dirs = keyset_mod._decompose([User.id.desc(), User.name])
+
+    # 2
+    assert [c.key for c in stripped] == ['id', 'name']
+    assert keys == ('id', 'name')
+    assert dirs == (True, False)
+
+
+def test_compiled_order_validate_cursor_returns_values_in_order() -> None:
+    """
+    < CompiledOrder.validate_cursor validates keys and returns cast values in ORDER BY order >
+    1. Compile [User.id, User.name].
+    2. Assert exact-type values pass through and numeric strings are cast (every form int() accepts).
+    3. Assert None values and uncastable values are rejected.
+    """
+    # 1
+    order = OrderByStrategy.compile(User, [User.id, User.name])
+
+    # 2
+    assert order.validate_cursor({'id': 3, 'name': 'kim'}) == [3, 'kim']
+    assert order.validate_cursor({'id': '4', 'name': 'lee'}) == [4, 'lee']
+    assert order.validate_cursor({'id': ' 1_000 ', 'name': 'park'}) == [1000, 'park']
+
+    # 3
+    with pytest.raises(ValueError, match='NULL'):
+        order.validate_cursor({'id': 1, 'name': None})
+    with pytest.raises(TypeError):
+        order.validate_cursor({'id': 'x', 'name': 'kim'})
+    with pytest.raises(TypeError):
+        order.validate_cursor({'id': '1.5', 'name': 'kim'})
+
+
+def test_single_plain_column_fast_path_skips_compilation() -> None:
+    """
+    < A single plain column with a one-key cursor does not build a CompiledOrder >
+    1. Patch _compile_cols to fail if called.
+    2. Apply with order_cols=[User.id] and a numeric-string cursor; assert '>' and the cast value.
+    3. Assert a non-numeric value is still rejected with TypeError.
+    """
+    # 1
+    with patch.object(KeysetStrategy, '_compile_cols', side_effect=AssertionError('not expected')):
+        # 2
+        q = KeysetStrategy.apply(select(User), order_cols=[User.id], cursor={'id': '9'}, size=3)
+        sql = compile_sql(q)
+        assert '"user".id > ' in sql and has_limit(sql)
+        assert 9 in q.compile().params.values()
+
+        # 3
+        with pytest.raises(TypeError):
+            KeysetStrategy.apply(select(User), order_cols=[User.id], cursor={'id': 'abc'}, size=3)
+
+
+def test_compiled_order_reuses_row_comparison_lhs() -> None:
+    """
+    < All-ASC multi-column paging reuses the plan's prebuilt column tuple >
+    1. Compile [User.id, User.name] and apply two different cursors.
+    2. Assert both WHERE clauses share the same left-hand tuple object and keep their own values.
+    """
+    # 1
+    order = OrderByStrategy.compile(User, [User.id, User.name])
+    q1 = KeysetStrategy.apply(select(User), order_cols=order, cursor={'id': 1, 'name': 'a'}, size=5)
+    q2 = KeysetStrategy.apply(select(User), order_cols=order, cursor={'id': 2, 'name': 'b'}, size=5)
+
+    # 2
+    w1, w2 = q1.whereclause, q2.whereclause
+    assert w1 is not None and w2 is not None
+    assert w1.left is w2.left is order._row_lhs  # type: ignore[attr-defined]
+    assert set(q1.compile().params.values()) >= {1, 'a'}
+    assert set(q2.compile().params.values()) >= {2, 'b'}
+
+
+class Event(Base):
+    __tablename__ = 'event'
+
+    id = Column(Uuid, primary_key=True)
+    created_at = Column(DateTime)
+
+
+def test_str_cursor_values_are_parsed_for_common_column_types() -> None:
+    """
+    < str cursor values are parsed by the cast table for int / UUID / datetime columns >
+    1. Compile [Event.created_at, Event.id] and validate ISO datetime + UUID strings.
+    2. Assert the values come back as datetime and UUID, for every UUID string form UUID() accepts.
+    3. Assert malformed strings raise TypeError (int and UUID).
+    """
+    # 1
+    order = OrderByStrategy.compile(Event, [Event.created_at, Event.id])
+    uid = uuid.uuid4()
+    values = order.validate_cursor({'created_at': '2024-05-01T10:20:30', 'id': str(uid)})
+
+    # 2
+    assert values == [datetime(2024, 5, 1, 10, 20, 30), uid]
+    for form in (uid.hex, f'{{{uid.hex}}}', f'urn:uuid:{uid.hex}', f'{{{uid}}}', uid.urn):
+        assert order.validate_cursor({'created_at': '2024-05-01T10:20:30', 'id': form})[1] == uid
+
+    # 3
+    with pytest.raises(TypeError):
+        order.validate_cursor({'created_at': '2024-05-01T10:20:30', 'id': 'not-a-uuid'})
+    with pytest.raises(TypeError):
+        OrderByStrategy.compile(User, [User.id]).validate_cursor({'id': '12a'})
+    assert OrderByStrategy.compile(User, [User.id]).validate_cursor({'id': ' -12 '}) == [-12]
@@ -343,3 +343,73 @@ def test_apply_paging_offset_mode_missing_page_or_size() -> None:
     # 3
     with pytest.raises(ValueError, match='Offset mode requires paging'):
         _apply_paging(stmt, q, order_cols)
+
+
+def test_build_list_query_validates_paging_state_like_apply_paging() -> None:
+    """
+    < the fused _build_list_query raises the same paging-state errors as _apply_paging >
+    1. Force CURSOR mode without a cursor and OFFSET mode without page/size.
+    2. Assert _build_list_query raises ValueError with the expected messages.
+    """
+    from base_repository.query.list_query import _build_list_query
+
+    # 1
+    q_cursor = ListQuery(Result).order_by([Result.id.asc()])
+    q_cursor._mode = PagingMode.CURSOR
+    q_cursor._cursor_size = 10
+
+    q_offset = ListQuery(Result)
+    q_offset._mode = PagingMode.OFFSET
+
+    # 2
+    with pytest.raises(ValueError, match='Cursor mode requires with_cursor'):
+        _build_list_query(q_cursor)
+    with pytest.raises(ValueError, match='Offset mode requires paging'):
+        _build_list_query(q_offset)
+
+
+def test_listquery_uses_slots_and_generic_alias_construction_still_works() -> None:
+    """
+    < ListQuery instances use __slots__ (no per-instance __dict__) >
+    1. Create a ListQuery via the plain class and via the subscripted generic alias.
+    2. Assert neither instance has a __dict__ and unknown attributes cannot be set.
+    """
+    # 1
+    q_plain = ListQuery(Result)
+    q_alias = ListQuery[Result](Result)
+
+    # 2
+    for q in (q_plain, q_alias):
+        assert not hasattr(q, '__dict__')
+        with pytest.raises(AttributeError):
+            q.unknown = 1  # type: ignore[attr-defined]
+
+
+def test_build_reuses_ordered_select_for_cacheable_order_shapes() -> None:
+    """
+    < str/None ORDER BY shapes reuse one ordered base Select; expressions are not cached >
+    1. Build two queries with the same str ORDER BY but different filters.
+    2. Assert the cache was hit and each statement keeps its own WHERE value.
+    3. Assert expression-based ORDER BY input bypasses the cache key.
+    """
+    from sqlalchemy.dialects import sqlite
+
+    from base_repository.query.list_query import _build_list_query, _order_shape_key, _ordered_select
+
+    # 1
+    _ordered_select.cache_clear()
+    stmt1 = _build_list_query(ListQuery(Result, flt=RFilter(tenant_id=1)).order_by(['id']))  # type: ignore[list-item]
+    stmt2 = _build_list_query(ListQuery(Result, flt=RFilter(tenant_id=2)).order_by(['id']))  # type: ignore[list-item]
+
+    # 2
+    info = _ordered_select.cache_info()
+    assert info.misses == 1 and info.hits == 1
+    sql1 = str(stmt1.compile(dialect=sqlite.dialect(), compile_kwargs={'literal_binds': True}))
+    sql2 = str(stmt2.compile(dialect=sqlite.dialect(), compile_kwargs={'literal_binds': True}))
+    assert 'tenant_id = 1' in sql1 and 'ORDER BY result.id' in sql1
+    assert 'tenant_id = 2' in sql2 and 'tenant_id = 1' not in sql2
+
+    # 3
+    assert _order_shape_key(None) == ()
+    assert _order_shape_key([Result.id.asc()]) is None
+    assert _order_shape_key('id') is None
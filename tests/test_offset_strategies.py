@@ -56,3 +56,18 @@ def test_offset_strategy_apply_sets_offset_and_limit_correctly() -> None:
 
     assert 'OFFSET 20' in sql
     assert 'LIMIT 10' in sql
+
+
+def test_offset_strategy_apply_unchecked_matches_apply() -> None:
+    """
+    < OffsetStrategy.apply_unchecked must produce the same OFFSET/LIMIT as apply >
+    1. Build a SELECT statement.
+    2. Apply paging with page=3, size=10 via both apply and apply_unchecked.
+    3. Assert the compiled SQL strings are identical.
+    """
+    stmt = select(M)
+    checked = OffsetStrategy.apply(stmt, page=3, size=10)
+    unchecked = OffsetStrategy.apply_unchecked(stmt, page=3, size=10)
+
+    literal = {'literal_binds': True}
+    assert str(checked.compile(compile_kwargs=literal)) == str(unchecked.compile(compile_kwargs=literal))
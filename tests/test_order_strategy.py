@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import enum
+import gc
 import re
 import sys
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import pytest
 from sqlalchemy import (
@@ -612,6 +614,7 @@ def test_apply_raises_when_model_has_no_pk_for_default(monkeypatch) -> None:
         return FakeMapper()
 
     monkeypatch.setattr(order_by_mod, 'sa_mapper', fake_sa_mapper)
+    monkeypatch.setattr(order_by_mod, '_MODEL_META_CACHE', WeakKeyDictionary())
 
     # 3
     with pytest.raises(ValueError) as exc:
@@ -724,6 +727,43 @@ def test_same_column_recursionerror_breaks_and_returns_false() -> None:
         sys.setrecursionlimit(old)
 
 
+def test_same_column_positive_result_is_cached_until_collected() -> None:
+    """
+    < _same_column remembers a positive (a, b) pair and forgets it once an object is collected >
+    1. Create A whose proxy_set contains b and count proxy_set accesses.
+    2. Call _same_column twice and assert proxy_set was read once.
+    3. Drop A and assert the pair was evicted from the cache.
+    """
+
+    # 1
+    class B:
+        pass
+
+    b = B()
+    reads = 0
+
+    class A:
+        @property
+        def proxy_set(self):
+            nonlocal reads
+            reads += 1
+            return {b}
+
+    a = A()
+    pair = (id(a), id(b))
+
+    # 2
+    assert OrderByStrategy._same_column(a, b) is True
+    assert OrderByStrategy._same_column(a, b) is True
+    assert reads == 1
+    assert pair in order_by_mod._SAME_COLUMN_PAIRS
+
+    # 3
+    del a
+    gc.collect()
+    assert pair not in order_by_mod._SAME_COLUMN_PAIRS
+
+
 def test_same_table_none_tables_are_false() -> None:
     """
     < _same_table returns False if both sides have table=None >
@@ -833,3 +873,134 @@ def test_unary_expression_with_unknown_inner_hits_final_unsupported_branch() ->
     # 3
     with pytest.raises(ValueError, match=r'Unsupported order_by input type:'):
         OrderByStrategy.apply(User, [ue])
+
+
+def test_model_meta_is_cached_per_model(monkeypatch) -> None:
+    """
+    < Mapper metadata is resolved once per model and reused across apply() calls >
+    1. Start from an empty metadata cache and count sa_mapper calls.
+    2. Call OrderByStrategy.apply twice (explicit ordering, then PK fallback).
+    3. Assert sa_mapper was called once and the cached entry holds frozenset keys + PK tuple.
+    """
+    # 1
+    calls = 0
+    real_sa_mapper = order_by_mod.sa_mapper
+
+    def counting_sa_mapper(model):
+        nonlocal calls
+        calls += 1
+        return real_sa_mapper(model)
+
+    monkeypatch.setattr(order_by_mod, 'sa_mapper', counting_sa_mapper)
+    monkeypatch.setattr(order_by_mod, '_MODEL_META_CACHE', WeakKeyDictionary())
+
+    # 2
+    OrderByStrategy.apply(User, ['name'])
+    cols = OrderByStrategy.apply(User, None)
+
+    # 3
+    assert calls == 1
+    valid_keys, valid_expr_map, pks = order_by_mod._MODEL_META_CACHE[User]
+    assert valid_keys == frozenset({'id', 'name', 'org_id'})
+    assert isinstance(valid_keys, frozenset)
+    assert all(sys.intern(k) is k for k in valid_keys)
+    assert set(valid_expr_map) == valid_keys
+    assert isinstance(pks, tuple)
+    assert [c.key for c in cols] == ['id']
+
+
+def test_order_handler_resolved_once_per_input_type() -> None:
+    """
+    < Input types missing from the handler table are resolved once and remembered >
+    1. Define a str-valued Enum and a non-str-valued Enum.
+    2. Normalize a str-valued member and assert its type is now in the handler table.
+    3. Assert a non-str-valued Enum member is still rejected as unsupported.
+    """
+
+    # 1
+    class Key(enum.Enum):
+        NAME = 'name'
+
+    class Num(enum.Enum):
+        ONE = 1
+
+    # 2
+    cols = OrderByStrategy.apply(User, [Key.NAME])
+    assert [c.key for c in cols] == ['name']
+    assert order_by_mod._ORDER_HANDLERS[Key] is order_by_mod._order_enum
+
+    # 3
+    with pytest.raises(ValueError, match='Unsupported order_by input type'):
+        OrderByStrategy.apply(User, [Num.ONE])
+
+
+def test_compile_dedups_like_apply_and_keeps_plan_aligned() -> None:
+    """
+    < compile() deduplicates by base key exactly like apply() and keeps every plan field aligned >
+    1. Compile [User.id.desc(), 'id', 'name', User.name.desc()] (duplicates of id and name).
+    2. Assert the plan columns match apply() (first occurrence wins).
+    3. Assert keys/dirs/stripped/expected_types are aligned with the kept columns.
+    """
+    # 1
+    items = [User.id.desc(), 'id', 'name', User.name.desc()]
+    order = OrderByStrategy.compile(User, items)
+
+    # 2
+    expected = OrderByStrategy.apply(User, items)
+    assert len(order.cols) == len(expected) == 2
+    assert all(a.compare(b) for a, b in zip(order.cols, expected, strict=True))
+
+    # 3
+    assert order.keys == ('id', 'name')
+    assert order.dirs == (True, False)
+    assert [c.key for c in order.stripped] == ['id', 'name']
+    assert order.expected_types == (int, str)
+
+
+def test_base_key_does_not_evaluate_name_or_repr_when_key_exists() -> None:
+    """
+    < _base_key falls back to name/repr lazily >
+    1. Create an object with `key` whose `name` and `__repr__` raise.
+    2. Assert _base_key returns the key without touching name/repr.
+    3. Assert an object with neither key nor name falls back to repr.
+    """
+
+    # 1
+    class Keyed:
+        key = 'id'
+
+        @property
+        def name(self):
+            raise AssertionError('name must not be evaluated')
+
+        def __repr__(self):
+            raise AssertionError('repr must not be evaluated')
+
+    class Bare:
+        def __repr__(self):
+            return 'bare'
+
+    # 2
+    assert OrderByStrategy._base_key(Keyed()) == 'id'  # type: ignore[arg-type]
+
+    # 3
+    assert OrderByStrategy._base_key(Bare()) == 'bare'  # type: ignore[arg-type]
+
+
+def test_default_pk_ordering_copies_cached_pk_tuple() -> None:
+    """
+    < The PK default ordering is a fresh list built from the cached PK tuple >
+    1. Call OrderByStrategy.apply(User, None) twice.
+    2. Mutate the first result.
+    3. Assert the second result and the cached pk_cols are unaffected.
+    """
+    # 1
+    first = OrderByStrategy.apply(User, None)
+    second = OrderByStrategy.apply(User, None)
+
+    # 2
+    first.append(User.name.expression)
+
+    # 3
+    assert [c.key for c in second] == ['id']
+    assert [c.key for c in order_by_mod._model_meta(User).pk_cols] == ['id']
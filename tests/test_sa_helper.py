@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from typing import Any
 
+import pytest
 from sqlalchemy import ColumnClause, column
+from sqlalchemy.exc import NoInspectionAvailable
 from sqlalchemy.orm import DeclarativeBase, Mapped, Mapper, mapped_column
 
-from base_repository.sa_helper import peel_unary, sa_mapper
+from base_repository.sa_helper import _MAPPERS, peel_unary, sa_mapper
 
 
 # Base ORM setup for tests
@@ -37,6 +41,42 @@ def test_sa_mapper_returns_sqlalchemy_mapper() -> None:
     assert m.class_ is User
 
 
+def test_sa_mapper_is_memoized_per_model_class() -> None:
+    """
+    < sa_mapper caches the Mapper per model class weakly and does not cache failures >
+    1. Call sa_mapper(User) twice and assert the cached entry is reused.
+    2. Call sa_mapper on an unmapped class twice and assert both calls raise.
+    3. Map a class at runtime, look it up, drop it and assert the cache does not keep it alive.
+    """
+    # 1
+    assert sa_mapper(User) is sa_mapper(User)
+    assert User in _MAPPERS
+
+    # 2
+    class NotMapped:
+        pass
+
+    for _ in range(2):
+        with pytest.raises(NoInspectionAvailable):
+            sa_mapper(NotMapped)
+    assert NotMapped not in _MAPPERS
+
+    # 3
+    class RuntimeBase(DeclarativeBase):
+        pass
+
+    class Temp(RuntimeBase):
+        __tablename__ = 'temp'
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    assert sa_mapper(Temp).class_ is Temp
+    temp_ref = weakref.ref(Temp)
+    del Temp, RuntimeBase
+    gc.collect()
+    assert temp_ref() is None
+
+
 def test_peel_unary_returns_same_expr_if_not_unary() -> None:
     """
     < peel_unary returns the input unchanged when it is not a UnaryExpression >
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from base_repository import ContextSessionProvider, SessionProvider, create_asyncpg_provider
+from base_repository.session_provider import _asyncpg_url
+
+
+@pytest.mark.asyncio
+async def test_context_session_provider_reuses_one_session_per_task_and_closes_it() -> None:
+    """
+    < ContextSessionProvider hands out one session per task and opens a new one after close() >
+    1. Build a provider over an aiosqlite sessionmaker and assert it satisfies SessionProvider.
+    2. Assert repeated get_session() calls in one task return the same session.
+    3. Assert concurrently started tasks each get their own session.
+    4. Assert close() forgets the session so the next call opens a new one.
+    """
+    # 1
+    engine = create_async_engine('sqlite+aiosqlite://')
+    provider = ContextSessionProvider(async_sessionmaker(engine, expire_on_commit=False))
+    assert isinstance(provider, SessionProvider)
+    assert provider.engine is engine
+
+    # 2
+    async def one_task() -> tuple[AsyncSession, AsyncSession]:
+        return provider.get_session(), provider.get_session()
+
+    first, again = await asyncio.create_task(one_task())
+    assert first is again
+
+    # 3
+    results = await asyncio.gather(one_task(), one_task())
+    assert results[0][0] is not results[1][0]
+
+    # 4
+    current = provider.get_session()
+    await provider.close()
+    assert provider.get_session() is not current
+
+    await provider.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_context_session_provider_scope_opens_fresh_session_and_restores_previous() -> None:
+    """
+    < scope() yields a fresh session for the block and restores the outer session on exit >
+    1. Open an outer session via get_session().
+    2. Inside scope(), assert get_session() returns the scoped session, not the outer one.
+    3. After the block, assert the outer session is current again.
+    """
+    # 1
+    engine = create_async_engine('sqlite+aiosqlite://')
+    provider = ContextSessionProvider(async_sessionmaker(engine, expire_on_commit=False))
+    outer = provider.get_session()
+
+    # 2
+    async with provider.scope() as scoped:
+        assert scoped is not outer
+        assert provider.get_session() is scoped
+
+    # 3
+    assert provider.get_session() is outer
+
+    await provider.close()
+    await engine.dispose()
+
+
+def test_asyncpg_url_sets_prepared_statement_cache_and_rejects_other_drivers() -> None:
+    """
+    < create_asyncpg_provider's URL helper sets the asyncpg statement cache size and rejects other drivers >
+    1. Build the URL for a postgresql+asyncpg DSN and assert the cache size query parameter.
+    2. Assert a non-asyncpg URL raises ValueError.
+    """
+    # 1
+    url = _asyncpg_url('postgresql+asyncpg://u:p@localhost/db?ssl=disable', 500)
+    assert url.query == {'ssl': 'disable', 'prepared_statement_cache_size': '500'}
+
+    # 2
+    with pytest.raises(ValueError, match='requires a postgresql\\+asyncpg URL'):
+        _ = _asyncpg_url('sqlite+aiosqlite://', 500)
+
+
+@pytest.mark.asyncio
+async def test_create_asyncpg_provider_configures_engine_caches() -> None:
+    """
+    < create_asyncpg_provider builds a ContextSessionProvider over a tuned asyncpg engine >
+    1. Skip when asyncpg is not installed.
+    2. Create the provider and assert the compiled cache size, URL and session binding.
+    """
+    # 1
+    pytest.importorskip('asyncpg')
+
+    # 2
+    provider = create_asyncpg_provider('postgresql+asyncpg://u:p@localhost/db', stmt_cache=300, compiled_cache_size=64)
+    engine = provider.engine
+    assert engine is not None
+    assert engine.sync_engine._compiled_cache is not None
+    assert engine.sync_engine._compiled_cache.capacity == 64
+    assert engine.url.query['prepared_statement_cache_size'] == '300'
+    assert provider.get_session().bind is engine
+
+    await provider.close()
+    await engine.dispose()
@@ -42,3 +42,17 @@ def test_repo_types_version_branch_is_covered(monkeypatch) -> None:
     assert hasattr(mod, 'TModel')
     assert hasattr(mod, 'TSchema')
     assert hasattr(mod, 'QueryOrStmt')
+
+
+def test_repo_types_exports_only_typing_names() -> None:
+    """
+    < repo_types declares __all__ so star-imports do not leak its helper imports >
+    1. Import repo_types.
+    2. Assert __all__ lists the typing names and excludes runtime helpers.
+    """
+    # 1
+    mod = importlib.import_module('base_repository.repo_types')
+
+    # 2
+    assert set(mod.__all__) == {'NoSchema', 'QueryOrStmt', 'TModel', 'TPydanticSchema', 'TSchema'}
+    assert not hasattr(mod, 'Select')
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import warnings
+
+import pytest
+
+from base_repository.utils import experimental
+
+
+def test_experimental_warns_on_first_call_only() -> None:
+    """
+    < experimental() warns once per decorated function and always calls through >
+    1. Decorate two functions.
+    2. Assert the first call of each warns and returns the wrapped result.
+    3. Assert later calls return the result without warning.
+    """
+
+    # 1
+    @experimental
+    def double(x: int) -> int:
+        return x * 2
+
+    @experimental
+    def triple(x: int) -> int:
+        return x * 3
+
+    # 2
+    with pytest.warns(UserWarning, match=r'double\(\) is experimental'):
+        assert double(2) == 4
+    with pytest.warns(UserWarning, match=r'triple\(\) is experimental'):
+        assert triple(2) == 6
+
+    # 3
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert double(3) == 6
+        assert triple(3) == 9
+    assert double.__name__ == 'double'
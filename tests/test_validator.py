@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import sys
+
+import msgspec
 import pytest
 from pydantic import BaseModel, ConfigDict
 
-from base_repository.validator import validate_config_from_attributes_true, validate_schema_base
+from base_repository.validator import (
+    is_msgspec_struct,
+    validate_config_from_attributes_true,
+    validate_schema_base,
+)
 
 
 # Mapping-style configs (ConfigDict behaves like a mapping)
@@ -85,6 +92,26 @@ def test_validate_config_from_attributes_true__mapping_false() -> None:
     assert out is False
 
 
+def test_validate_config_from_attributes_true__non_dict_mapping() -> None:
+    """
+    < validate_config_from_attributes_true still reads non-dict Mapping configs >
+    1. Use a non-BaseModel type whose model_config is a read-only mapping (not a dict).
+    2. Call validate_config_from_attributes_true(schema).
+    3. Assert it reads from_attributes from the mapping.
+    """
+    # 1
+    from types import MappingProxyType
+
+    class ProxyConfigFakeSchema:
+        model_config = MappingProxyType({'from_attributes': True})
+
+    # 2
+    out = validate_config_from_attributes_true(ProxyConfigFakeSchema)  # type: ignore[arg-type]
+
+    # 3
+    assert out is True
+
+
 def test_validate_config_from_attributes_true__object_true() -> None:
     """
     < validate_config_from_attributes_true returns True for object config with from_attributes=True >
@@ -166,3 +193,23 @@ def test_validate_schema_base__ok() -> None:
 
     # 3
     assert True
+
+
+def test_is_msgspec_struct_detects_struct_subclasses_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    < is_msgspec_struct is True only for msgspec.Struct subclasses, without importing msgspec itself >
+    1. Assert a Struct subclass is detected and a BaseModel / Struct instance is not.
+    2. Hide msgspec from sys.modules and assert the check returns False.
+    """
+
+    # 1
+    class S(msgspec.Struct):
+        a: int
+
+    assert is_msgspec_struct(S) is True
+    assert is_msgspec_struct(MappingConfigTrueSchema) is False
+    assert is_msgspec_struct(S(a=1)) is False
+
+    # 2
+    monkeypatch.delitem(sys.modules, 'msgspec')
+    assert is_msgspec_struct(S) is False